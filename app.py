@@ -1,12 +1,24 @@
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, send_file, send_from_directory
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, send_file, send_from_directory, Response, stream_with_context, g
 from functools import wraps
 import os
 import json
+import time
+import uuid
 from datetime import datetime
 from utils.firebase_auth import FirebaseAuthManager
 from utils.firebase_storage import FirebaseStorageManager
 from utils.ai_helper import AIHelper
+from utils.answer_evaluator import IncrementalEvaluator
+from utils.answer_buffer import AnswerWriteBuffer
+from utils.job_queue import JobQueue, JobWorker
+from utils.session_sweeper import SessionSweeper
+from utils.session_store import ServerSessionInterface
+from utils.question_bank import QuestionBank, QuestionBankWarmer
 from utils.validators import ValidationHelper
+from utils.interview_manifest import InterviewManifest
+from utils.interview_store import InterviewQuestionStore
+from utils.answer_sync import AnswerSync
+from utils.user_stats import UserStats
 from config import Config
 from flask_session import Session
 
@@ -15,7 +27,10 @@ app = Flask(__name__)
 app.config.from_object(Config)
 
 # Initialize server-side sessions to handle large data
-Session(app)
+if Config.SESSION_BACKEND == 'filesystem':
+    Session(app)
+else:
+    app.session_interface = ServerSessionInterface.from_config()
 
 # Create session directory if it doesn't exist
 os.makedirs(app.config['SESSION_FILE_DIR'], exist_ok=True)
@@ -23,9 +38,17 @@ os.makedirs(app.config['SESSION_FILE_DIR'], exist_ok=True)
 # Initialize utilities with Firebase
 auth_manager = FirebaseAuthManager()
 storage_manager = FirebaseStorageManager()
-ai_helper = AIHelper()
+question_bank = QuestionBank() if Config.QUESTION_BANK_ENABLED else None
+ai_helper = AIHelper(question_store=storage_manager, question_bank=question_bank)
+answer_evaluator = IncrementalEvaluator(ai_helper, storage_manager) if Config.INCREMENTAL_EVALUATION_ENABLED else None
+answer_buffer = AnswerWriteBuffer(storage_manager) if Config.ANSWER_WRITE_BEHIND_ENABLED else None
+interview_questions = InterviewQuestionStore.from_config(storage_manager)
 validator = ValidationHelper()
 
+# Optionally keep the question bank warm from inside the web process
+if question_bank and Config.QUESTION_BANK_WARMUP_ENABLED:
+    QuestionBankWarmer(question_bank, ai_helper.generate_bank_questions).start()
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -34,33 +57,63 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
-def load_interview_questions():
-    """Load questions from Firebase session"""
+def load_user_stats_snapshot():
+    """Load the user's aggregate stats once per request; every stats view in the request shares it"""
+    user_id = session['user_id']
+    snapshot = g.get('user_stats')
+    if snapshot is None or snapshot.data.get('user_id') != user_id:
+        try:
+            snapshot = storage_manager.load_user_stats(user_id)
+        except Exception as e:
+            print(f"Error loading user stats: {e}")
+            snapshot = UserStats.empty(user_id)
+        g.user_stats = snapshot
+    return snapshot
+
+def load_interview_session_data():
+    """Load the interview session_data dict from Firebase"""
     if 'interview_id' not in session:
         return None
     
-    # Try to get from Firebase first
-    session_data = storage_manager.get_interview_session(session['interview_id'])
-    if session_data and 'questions' in session_data.get('session_data', {}):
-        return session_data['session_data']['questions']
-    
-    # Fallback to local file for backward compatibility
-    questions_file = f"data/sessions/questions_{session['interview_id']}.json"
-    if os.path.exists(questions_file):
-        with open(questions_file, 'r') as f:
-            return json.load(f)
+    session_doc = storage_manager.get_interview_session(session['interview_id'])
+    if session_doc:
+        return session_doc.get('session_data', {})
     return None
 
-def cleanup_interview_files():
+def load_interview_questions():
+    """Load the interview's questions from the fastest question tier that has them"""
+    if 'interview_id' not in session:
+        return None
+    return interview_questions.get(session['interview_id'])
+
+def start_interview_session(interview_id):
+    """Point the user session at a freshly created interview"""
+    # Clear all previous interview data and start fresh
+    session['interview_id'] = interview_id
+    session['current_question'] = 0
+    session['user_answers'] = {}
+    session['answer_versions'] = {}
+    
+    # Clear any previous results or report IDs
+    session.pop('report_id', None)
+    session.pop('interview_results', None)
+
+def sse_event(event, data):
+    """Format a Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def cleanup_interview_files(interview_id=None, delete_session=True):
     """Clean up temporary interview files"""
-    if 'interview_id' in session:
-        # Clean up Firebase session
-        storage_manager.delete_interview_session(session['interview_id'])
-        
-        # Clean up local files (for backward compatibility)
-        questions_file = f"data/sessions/questions_{session['interview_id']}.json"
-        if os.path.exists(questions_file):
-            os.remove(questions_file)
+    interview_id = interview_id or session.get('interview_id')
+    if interview_id:
+        # Clean up Firebase session (completed interviews delete it along with saving the report)
+        if delete_session:
+            storage_manager.delete_interview_session(interview_id)
+        if answer_evaluator:
+            answer_evaluator.discard(interview_id)
+        if answer_buffer:
+            answer_buffer.discard(interview_id)
+        interview_questions.delete(interview_id)
 
 @app.route('/favicon.ico')
 def favicon():
@@ -136,10 +189,12 @@ def logout():
 @app.route('/dashboard')
 @login_required
 def dashboard():
-    user_stats = storage_manager.get_user_stats(session['user_id'])
-    recent_reports = storage_manager.get_recent_reports(session['user_id'], limit=5)
+    # One stats read feeds the cards, the recent reports check and the inline chart data
+    snapshot = load_user_stats_snapshot()
+    recent_reports = storage_manager.get_recent_reports(session['user_id'], limit=5, stats=snapshot)
     return render_template('dashboard/dashboard.html', 
-                         stats=user_stats, 
+                         stats=snapshot.summary(), 
+                         detailed_stats=snapshot.detailed(),
                          recent_reports=recent_reports,
                          config=Config)
 
@@ -170,7 +225,7 @@ def setup():
 def loading():
     if 'interview_setup' not in session:
         return redirect(url_for('setup'))
-    return render_template('dashboard/loading.html')
+    return render_template('dashboard/loading.html', question_streaming=Config.QUESTION_STREAMING_ENABLED)
 
 @app.route('/generate_questions', methods=['POST'])
 @login_required
@@ -179,14 +234,29 @@ def generate_questions():
         return jsonify({'error': 'No interview setup found'}), 400
     
     setup = session['interview_setup']
+    data = request.get_json(silent=True) or {}
+    stream = bool(data.get('stream')) and Config.QUESTION_STREAMING_ENABLED
     
     try:
         # Clean up any previous interview files
         cleanup_interview_files()
         
+        if stream:
+            # Questions are generated by /generate_questions/stream while the interview page is open
+            interview_id = f"{session['user_id']}_{int(datetime.now().timestamp())}"
+            session_data = {
+                'questions': [],
+                'setup': setup,
+                'user_answers': {},
+                'current_question': 0,
+                'generation_status': 'pending'
+            }
+            storage_manager.save_interview_session(session['user_id'], interview_id, session_data)
+            start_interview_session(interview_id)
+            return jsonify({'success': True, 'streaming': True})
+        
         questions = ai_helper.generate_questions(setup)
         
-        # Store questions in Firebase and local file as backup
         interview_id = f"{session['user_id']}_{int(datetime.now().timestamp())}"
         
         # Save to Firebase
@@ -196,49 +266,159 @@ def generate_questions():
             'user_answers': {},
             'current_question': 0
         }
-        storage_manager.save_interview_session(session['user_id'], interview_id, session_data)
+        saved = storage_manager.save_interview_session(session['user_id'], interview_id, session_data)
         
-        # Backup to local file
-        questions_file = f"data/sessions/questions_{interview_id}.json"
-        os.makedirs(os.path.dirname(questions_file), exist_ok=True)
-        with open(questions_file, 'w') as f:
-            json.dump(questions, f)
+        # The session document already holds the questions; fill the other tiers
+        interview_questions.save(interview_id, questions, written=('firestore',) if saved else ())
         
-        # Clear all previous interview data and start fresh
-        session['interview_id'] = interview_id
-        session['current_question'] = 0
-        session['user_answers'] = {}
-        
-        # Clear any previous results or report IDs
-        session.pop('report_id', None)
-        session.pop('interview_results', None)
+        start_interview_session(interview_id)
         
         return jsonify({'success': True, 'questions_count': len(questions)})
     except Exception as e:
         return jsonify({'error': f'Failed to generate questions: {str(e)}'}), 500
 
+@app.route('/generate_questions/stream')
+@login_required
+def stream_questions():
+    """Stream generated questions to the interview page as Server-Sent Events"""
+    interview_id = session.get('interview_id')
+    setup = session.get('interview_setup')
+    if not interview_id or not setup or load_interview_session_data() is None:
+        return jsonify({'error': 'No interview setup found'}), 400
+    
+    def generate():
+        # Only the stream holding the generation claim calls the model; a reconnect
+        # (or a second tab) replays the stored questions and follows the new ones
+        owner = uuid.uuid4().hex
+        sent = 0
+        while True:
+            session_doc = storage_manager.get_interview_session(interview_id, use_cache=False) or {}
+            session_data = session_doc.get('session_data', {})
+            questions = session_data.get('questions', [])
+            for index in range(sent, len(questions)):
+                yield sse_event('question', {'index': index, 'question': questions[index]})
+            sent = len(questions)
+            
+            if not session_doc or session_data.get('generation_status', 'complete') == 'complete':
+                break
+            if sent >= setup['question_count']:
+                # The generating stream stopped before marking the session complete
+                storage_manager.update_interview_session_fields(interview_id, {'generation_status': 'complete'})
+                interview_questions.save(interview_id, questions, written=('firestore',))
+                break
+            
+            if storage_manager.claim_question_generation(interview_id, owner, Config.QUESTION_GENERATION_LEASE):
+                questions = list(questions)
+                remaining = setup['question_count'] - sent
+                for question in ai_helper.stream_questions(dict(setup, question_count=remaining)):
+                    # One array element per write instead of rewriting the whole list
+                    storage_manager.append_interview_question(interview_id, question)
+                    questions.append(question)
+                    yield sse_event('question', {'index': sent, 'question': question})
+                    sent += 1
+                
+                storage_manager.update_interview_session_fields(interview_id, {'generation_status': 'complete'})
+                interview_questions.save(interview_id, questions, written=('firestore',))
+                break
+            
+            time.sleep(Config.QUESTION_STREAM_POLL_INTERVAL)
+        
+        yield sse_event('done', {'total': sent})
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/interview')
 @login_required
 def interview():
+    # Final question lists come from the fastest question tier; only a session
+    # still generating questions (not in the tiers yet) is read from Firestore
     questions = load_interview_questions()
+    generating = False
     if not questions:
+        session_data = load_interview_session_data() or {}
+        questions = session_data.get('questions')
+        # Questions still being generated are streamed in by the interview page
+        generating = 'generation_status' in session_data and session_data['generation_status'] != 'complete'
+    if not questions and not generating:
         return redirect(url_for('setup'))
     
-    current_q = session.get('current_question', 0)
+    questions = questions or []
     interview_id = session.get('interview_id', 'unknown')
+    total_questions = session['interview_setup']['question_count'] if generating else len(questions)
+    
+    # Navigation happens in the page; ?q= (set by the page) keeps the position across reloads
+    current_q = request.args.get('q', type=int)
+    if current_q is None or not 0 <= current_q < total_questions:
+        current_q = session.get('current_question', 0)
     
     return render_template('dashboard/interview.html', 
                          questions=questions,
                          current_question=current_q,
-                         total_questions=len(questions),
-                         interview_id=interview_id)
+                         total_questions=total_questions,
+                         interview_id=interview_id,
+                         manifest=InterviewManifest.create(interview_id, total_questions),
+                         answer_versions=session.get('answer_versions', {}),
+                         stream_url=url_for('stream_questions') if generating else None)
+
+def update_position(data):
+    """Store the position the interview page reports, if its manifest is valid"""
+    current_question = data.get('current_question')
+    question_count = InterviewManifest.verify(data.get('manifest'), session.get('interview_id'))
+    if question_count is not None and isinstance(current_question, int) and 0 <= current_question < question_count:
+        session['current_question'] = current_question
+
+def save_answers(answers):
+    """Write changed answers ({str index: text}) to the interview session and start evaluating them"""
+    if 'interview_id' not in session or not answers:
+        return
+    questions = load_interview_questions()
+    if questions is None:
+        # Still generating: evaluate against the questions streamed so far
+        session_data = load_interview_session_data()
+        if not session_data:
+            return
+        questions = session_data.get('questions', [])
+    
+    interview_id = session['interview_id']
+    current_question = session.get('current_question', 0)
+    # Field-level updates so background evaluations stored on the session are kept
+    if answer_buffer:
+        # Coalesced with other autosaves and written on the next flush
+        for index, answer in answers.items():
+            answer_buffer.record(interview_id, index, answer, current_question)
+    else:
+        storage_manager.update_interview_session_fields(interview_id, {
+            'user_answers': session['user_answers'],
+            'current_question': current_question
+        })
+    
+    # Start evaluating the answers while the user moves on
+    if answer_evaluator:
+        for index, answer in answers.items():
+            if str(index).isdigit() and int(index) < len(questions):
+                answer_evaluator.submit(
+                    interview_id, int(index), questions[int(index)], answer, session['interview_setup']
+                )
 
 @app.route('/submit_answer', methods=['POST'])
 @login_required
 def submit_answer():
-    data = request.json
+    """Save a single answer (interview pages loaded before /sync_answers existed)"""
+    data = request.get_json(silent=True) or {}
+    setup = session.get('interview_setup')
+    if 'interview_id' not in session or not setup:
+        return jsonify({'success': False, 'error': 'No active interview'}), 400
+    
+    # The index becomes a Firestore field path (user_answers.<index>), so only accept a valid question number
     question_index = data.get('question_index')
     answer = data.get('answer')
+    if isinstance(question_index, bool) or not isinstance(question_index, int) \
+            or not 0 <= question_index < setup['question_count']:
+        return jsonify({'success': False, 'error': 'Invalid question index'}), 400
+    if not isinstance(answer, str):
+        return jsonify({'success': False, 'error': 'Invalid answer'}), 400
+    answer = answer[:AnswerSync.MAX_ANSWER_LENGTH]
     
     if 'user_answers' not in session:
         session['user_answers'] = {}
@@ -246,58 +426,130 @@ def submit_answer():
     session['user_answers'][str(question_index)] = answer
     session.modified = True
     
-    # Update Firebase session data
-    if 'interview_id' in session:
-        session_data = storage_manager.get_interview_session(session['interview_id'])
-        if session_data:
-            session_data['session_data']['user_answers'] = session['user_answers']
-            session_data['session_data']['current_question'] = session.get('current_question', 0)
-            storage_manager.update_interview_session(session['interview_id'], session_data['session_data'])
+    # The page navigates on its own and reports its position with each autosave
+    update_position(data)
+    save_answers({str(question_index): answer})
     
     return jsonify({'success': True})
 
-@app.route('/next_question', methods=['POST'])
+@app.route('/sync_answers', methods=['POST'])
 @login_required
-def next_question():
-    current = session.get('current_question', 0)
-    questions = load_interview_questions()
-    total = len(questions) if questions else 0
+def sync_answers():
+    """Apply a batch of versioned answer edits from the interview page (see AnswerSync)"""
+    data = request.get_json(silent=True) or {}
+    setup = session.get('interview_setup')
+    if 'interview_id' not in session or not setup:
+        return jsonify({'success': False, 'error': 'No active interview'}), 400
     
-    if current < total - 1:
-        session['current_question'] = current + 1
-        return jsonify({'success': True, 'next_question': current + 1})
-    else:
-        return jsonify({'success': True, 'completed': True})
-
-@app.route('/previous_question', methods=['POST'])
-@login_required
-def previous_question():
-    current = session.get('current_question', 0)
+    answers = dict(session.get('user_answers', {}))
+    versions = dict(session.get('answer_versions', {}))
+    changes = data.get('changes') if isinstance(data.get('changes'), list) else []
+    applied, conflicts = AnswerSync.apply(answers, versions, changes, setup['question_count'])
+    if applied:
+        session['user_answers'] = answers
+        session['answer_versions'] = versions
     
-    if current > 0:
-        session['current_question'] = current - 1
-        return jsonify({'success': True, 'previous_question': current - 1})
-    else:
-        return jsonify({'success': False, 'message': 'Already at first question'})
+    update_position(data)
+    save_answers(applied)
+    
+    # Acknowledge the version the server holds for every question in the batch
+    indexes = {str(change['index']) for change in changes if isinstance(change, dict) and 'index' in change}
+    return jsonify({
+        'success': True,
+        'versions': {index: versions[index] for index in indexes if index in versions},
+        'conflicts': conflicts
+    })
 
 @app.route('/update_current_question', methods=['POST'])
 @login_required
 def update_current_question():
+    """Kept for interview pages loaded before navigation moved into the page"""
     data = request.json
     new_question = data.get('current_question')
+    total = session.get('interview_setup', {}).get('question_count', 0)
     
-    if new_question is not None:
-        questions = load_interview_questions()
-        total = len(questions) if questions else 0
-        if 0 <= new_question < total:
-            session['current_question'] = new_question
-            return jsonify({'success': True})
+    if isinstance(new_question, int) and 0 <= new_question < total:
+        session['current_question'] = new_question
+        return jsonify({'success': True})
     
     return jsonify({'success': False, 'message': 'Invalid question index'})
 
+def finish_interview(payload, progress=None):
+    """Evaluate an interview and save its report. Returns the report id."""
+    interview_id = payload['interview_id']
+    questions = payload['questions']
+    user_answers = payload['user_answers']
+    setup_data = payload['interview_setup']
+    report_progress = progress or (lambda update: None)
+
+    if answer_buffer:
+        # Answers buffered by this process reach the session before anything is evaluated
+        answer_buffer.flush(interview_id)
+
+    # Reuse answers already evaluated in the background, waiting for any still running
+    precomputed = None
+    if answer_evaluator:
+        # Evaluations may have been stored by another worker process
+        session_doc = storage_manager.get_interview_session(interview_id, use_cache=False) or {}
+        stored_evaluations = session_doc.get('session_data', {}).get('evaluations')
+        precomputed = answer_evaluator.collect(interview_id, user_answers, stored_evaluations)
+
+    # Evaluate answers using AI
+    print("🤖 Evaluating answers with AI...")
+    results = ai_helper.evaluate_answers(
+        questions,
+        user_answers,
+        setup_data,
+        precomputed=precomputed,
+        progress=lambda completed, total: report_progress(
+            {'stage': 'evaluating', 'completed': completed, 'total': total}
+        )
+    )
+    print("✅ AI evaluation completed")
+    print(f"📊 Overall score: {results.get('overall_score', 'N/A')}")
+
+    # Save the report, update the user's stats and delete the session in one transaction
+    report_progress({'stage': 'saving', 'completed': len(questions), 'total': len(questions)})
+    print("💾 Saving report to Firebase...")
+    report_id = storage_manager.complete_interview(
+        payload['user_id'],
+        interview_id,
+        setup_data,
+        questions,
+        user_answers,
+        results
+    )
+
+    if not report_id:
+        raise RuntimeError('Failed to save report')
+
+    print(f"✅ Report saved with ID: {report_id}")
+    return report_id
+
+def run_complete_interview_job(payload, report_progress):
+    """Job handler for queued interview completions"""
+    report_id = finish_interview(payload, progress=report_progress)
+    cleanup_interview_files(payload['interview_id'], delete_session=False)
+    return {'report_id': report_id}
+
+job_queue = JobQueue() if Config.JOB_QUEUE_ENABLED else None
+session_store = app.session_interface if isinstance(app.session_interface, ServerSessionInterface) else None
+session_sweeper = SessionSweeper(
+    storage_manager, job_queue=job_queue, session_store=session_store
+) if Config.SESSION_SWEEP_ENABLED else None
+if job_queue:
+    job_handlers = {'complete_interview': run_complete_interview_job}
+    if session_sweeper:
+        job_handlers[SessionSweeper.JOB_KIND] = session_sweeper.run_job
+    JobWorker(job_queue, job_handlers).start()
+if session_sweeper:
+    session_sweeper.start()
+
 @app.route('/complete_interview', methods=['POST'])
 @login_required
 def complete_interview():
+    if answer_buffer and 'interview_id' in session:
+        answer_buffer.flush(session['interview_id'])
     questions = load_interview_questions()
     if not questions or 'user_answers' not in session:
         print("❌ Interview data not found - questions or answers missing")
@@ -306,37 +558,38 @@ def complete_interview():
     print(f"🎯 Completing interview for user: {session.get('user_id')}")
     print(f"📊 Processing {len(questions)} questions with {len(session['user_answers'])} answers")
     
-    try:
-        # Evaluate answers using AI
-        print("🤖 Evaluating answers with AI...")
-        results = ai_helper.evaluate_answers(
-            questions,
-            session['user_answers'],
-            session['interview_setup']
-        )
-        print("✅ AI evaluation completed")
-        print(f"📊 Overall score: {results.get('overall_score', 'N/A')}")
-                # Save the report
-        print("💾 Saving report to Firebase...")
-        report_id = storage_manager.save_report(
-            session['user_id'],
-            session['interview_setup'],
-            questions,
-            session['user_answers'],
-            results
+    payload = {
+        'user_id': session['user_id'],
+        'interview_id': session['interview_id'],
+        'interview_setup': session['interview_setup'],
+        'questions': questions,
+        'user_answers': session['user_answers']
+    }
+    
+    if job_queue:
+        # Evaluate on a job worker; the client polls /jobs/<job_id> for progress
+        job = job_queue.enqueue(
+            'complete_interview', payload,
+            idempotency_key=f"complete_interview:{session['interview_id']}",
+            owner=session['user_id']
         )
-        
-        if not report_id:
-            print("❌ Failed to save report - no report ID returned")
-            return jsonify({'error': 'Failed to save report'}), 500
-        
-        print(f"✅ Report saved with ID: {report_id}")
+        print(f"📥 Queued completion job {job['id']} ({job['status']})")
+        return jsonify({
+            'success': True,
+            'job_id': job['id'],
+            'status': job['status'],
+            'status_url': url_for('job_status', job_id=job['id'])
+        }), 202
+    
+    try:
+        # finish_interview reads the stored evaluations from the session itself
+        report_id = finish_interview(payload)
         
         # Store only result ID in session, not the full results
         session['report_id'] = report_id
         
         # Clean up temporary files
-        cleanup_interview_files()
+        cleanup_interview_files(delete_session=False)
         
         return jsonify({'success': True, 'report_id': report_id})
     except Exception as e:
@@ -345,6 +598,25 @@ def complete_interview():
         traceback.print_exc()
         return jsonify({'error': f'Failed to evaluate interview: {str(e)}'}), 500
 
+@app.route('/jobs/<job_id>')
+@login_required
+def job_status(job_id):
+    job = job_queue.get(job_id) if job_queue else None
+    if not job or job['owner'] != session['user_id']:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    if job['status'] == 'completed' and job['kind'] == 'complete_interview':
+        session['report_id'] = job['result']['report_id']
+    
+    return jsonify({
+        'success': True,
+        'job_id': job['id'],
+        'status': job['status'],
+        'progress': job['progress'],
+        'result': job['result'],
+        'error': job['error']
+    })
+
 @app.route('/results')
 @login_required
 def results():
@@ -368,11 +640,21 @@ def results():
 @login_required
 def reports():
     print(f"📋 Fetching reports for user: {session.get('user_id')}")
-    user_reports = storage_manager.get_user_reports(session['user_id'])
+    cursor = request.args.get('cursor')
+    snapshot = load_user_stats_snapshot()
+    page = storage_manager.get_report_summaries_page(session['user_id'], cursor=cursor, stats=snapshot)
+    user_reports = page['reports']
     print(f"📊 Reports retrieved: {len(user_reports)}")
     for i, report in enumerate(user_reports):
         print(f"  Report {i+1}: ID={report.get('id', 'N/A')}, Created={report.get('created_at', 'N/A')}")
-    return render_template('dashboard/reports.html', reports=user_reports)
+    
+    # The domain chart covers every report, not just this page
+    domain_breakdown = snapshot.detailed().get('domain_breakdown', {})
+    return render_template('dashboard/reports.html',
+                         reports=user_reports,
+                         next_cursor=page['next_cursor'],
+                         is_first_page=not cursor,
+                         domain_breakdown=domain_breakdown)
 
 @app.route('/report/<report_id>')
 @login_required
@@ -401,8 +683,7 @@ def download_report(report_id):
 @app.route('/api/stats')
 @login_required
 def api_stats():
-    stats = storage_manager.get_detailed_stats(session['user_id'])
-    return jsonify(stats)
+    return jsonify(load_user_stats_snapshot().detailed())
 
 @app.route('/debug/session')
 @login_required  
@@ -421,6 +702,31 @@ def debug_session():
     
     return jsonify(session_info)
 
+@app.route('/debug/cache')
+@login_required
+def debug_cache():
+    """Debug route to check cache hit rates"""
+    evaluation_cache = ai_helper.evaluation_cache
+    question_pool = ai_helper.question_pool
+    return jsonify({
+        'evaluation_cache': evaluation_cache.stats() if evaluation_cache else None,
+        'question_pool': question_pool.stats() if question_pool else None,
+        'question_bank': question_bank.stats() if question_bank else None,
+        'jobs': job_queue.stats() if job_queue else None,
+        'documents': storage_manager.cache.stats() if storage_manager.cache else None,
+        'answer_buffer': answer_buffer.stats() if answer_buffer else None,
+        'answer_evaluator': answer_evaluator.stats() if answer_evaluator else None,
+        'session_sweeper': session_sweeper.stats() if session_sweeper else None,
+        'sessions': session_store.stats() if session_store else None,
+        'interview_questions': interview_questions.stats()
+    })
+
+@app.route('/debug/model')
+@login_required
+def debug_model():
+    """Debug route to check model latency, retries, fallbacks and circuit state"""
+    return jsonify(ai_helper.model_client.stats())
+
 @app.route('/debug/reports')
 @login_required
 def debug_reports():
@@ -432,7 +738,7 @@ def debug_reports():
         return jsonify({'error': 'No user_id in session'})
     
     try:
-        reports = storage_manager.get_user_reports(user_id)
+        reports = storage_manager.get_user_report_summaries(user_id)
         return jsonify({
             'user_id': user_id,
             'reports_count': len(reports),
@@ -0,0 +1,174 @@
+"""
+Benchmark for answer autosave traffic
+Replays simulated typing sessions (bursts of keystrokes, pauses, corrections,
+moving to the next question) through the two autosave policies of the
+interview page and counts the requests and bytes uploaded per interview:
+
+- per-answer: every debounced save sends the full answer to /submit_answer
+- batched: debounced saves are queued per question and sent to /sync_answers
+  on moving to another question, or SYNC_INTERVAL seconds after the first
+  unsent edit, as versioned single-splice diffs (AnswerSync); the position
+  and manifest are only sent when the position changed
+
+The batched changes are applied with AnswerSync to check that the server ends
+up with exactly the typed answers. Fully reproducible for a given --seed.
+
+Usage:
+    python benchmarks/benchmark_answer_sync.py [--interviews 20] [--questions 10] [--seed 42]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.answer_sync import AnswerSync
+from utils.interview_manifest import InterviewManifest
+
+# Timings used by static/js/interview.js (seconds)
+DEBOUNCE = 1.5
+SYNC_INTERVAL = 30.0
+WORDS = ('the', 'service', 'cache', 'latency', 'because', 'index', 'query', 'thread', 'we', 'would',
+         'scale', 'queue', 'trade-off', 'request', 'database', 'memory', 'first', 'then', 'measure')
+
+
+def type_answer(rng, start):
+    """Keystroke timeline [(time, text)] for one answer, starting at ``start``"""
+    timeline = []
+    text = ''
+    now = start
+    for _ in range(rng.randint(25, 80)):
+        word = rng.choice(WORDS) + ' '
+        for char in word:
+            now += rng.uniform(0.08, 0.3)
+            text += char
+            timeline.append((now, text))
+        if rng.random() < 0.08:
+            # Go back and fix something
+            cut = rng.randint(1, min(len(text), 15))
+            now += rng.uniform(0.5, 1.5)
+            text = text[:-cut]
+            timeline.append((now, text))
+        if rng.random() < 0.15:
+            now += rng.uniform(2, 8)  # Thinking
+    return timeline, now
+
+
+def save_points(timeline, end):
+    """Debounced saves (pauses of DEBOUNCE seconds) plus the save on moving on"""
+    saves = []
+    for (time, text), following in zip(timeline, timeline[1:] + [(None, None)]):
+        if following[0] is None or following[0] - time >= DEBOUNCE:
+            saves.append((min(time + DEBOUNCE, end), text.strip()))
+    return saves
+
+
+def diff_text(old, new):
+    """Python port of InterviewManager.diffText"""
+    shorter = min(len(old), len(new))
+    start = 0
+    while start < shorter and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < shorter - start and old[len(old) - 1 - end] == new[len(new) - 1 - end]:
+        end += 1
+    return [start, len(old) - start - end, new[start:len(new) - end]]
+
+
+def simulate(rng, question_count):
+    manifest = InterviewManifest.create('benchmark_interview', question_count)
+    saves = []
+    now = 0.0
+    for index in range(question_count):
+        timeline, now = type_answer(rng, now + rng.uniform(3, 10))
+        saves.extend((time, index, text) for time, text in save_points(timeline, now + 0.5))
+        now += 0.5
+    final = {}
+    for _, index, text in saves:
+        final[str(index)] = text
+
+    # Per-answer policy: every changed save is one /submit_answer with the full text
+    per_answer = {'requests': 0, 'bytes': 0}
+    sent = {}
+    for _, index, text in saves:
+        if text and sent.get(index) != text:
+            sent[index] = text
+            body = json.dumps({'question_index': index, 'answer': text, 'current_question': index, 'manifest': manifest})
+            per_answer['requests'] += 1
+            per_answer['bytes'] += len(body)
+
+    # Batched policy: queue per question, flush on moving on, SYNC_INTERVAL after the first queued edit and on submit
+    batched = {'requests': 0, 'bytes': 0}
+    queue, acked, versions = {}, {}, {}
+    server_answers, server_versions = {}, {}
+
+    def flush(current_question):
+        changes = []
+        for index, (version, text) in queue.items():
+            change = {'index': index, 'version': version}
+            diff = diff_text(acked[index][1], text) if index in acked else None
+            if diff and len(json.dumps(diff)) < len(json.dumps(text)):
+                change.update(base=acked[index][0], diff=diff)
+            else:
+                change['text'] = text
+            changes.append(change)
+        payload = {'changes': changes}
+        if current_question != synced_position[0]:
+            payload.update(current_question=current_question, manifest=manifest)
+            synced_position[0] = current_question
+        body = json.dumps(payload)
+        batched['requests'] += 1
+        batched['bytes'] += len(body)
+        applied, conflicts = AnswerSync.apply(server_answers, server_versions, changes, question_count)
+        assert not conflicts, conflicts
+        for index, (version, text) in queue.items():
+            acked[index] = (version, text)
+        queue.clear()
+
+    timer = None
+    synced_position = [None]
+    previous_index = 0
+    for time, index, text in saves:
+        if queue and (index != previous_index or (timer is not None and time >= timer)):
+            flush(index)
+            timer = None
+        previous_index = index
+        current = queue[index][1] if index in queue else acked.get(index, (0, None))[1]
+        if text and text != current:
+            versions[index] = versions.get(index, 0) + 1
+            queue[index] = (versions[index], text)
+            if timer is None:
+                timer = time + SYNC_INTERVAL
+    if queue:
+        flush(question_count - 1)
+
+    expected = {index: text for index, text in final.items() if text}
+    assert server_answers == expected, 'batched sync lost an edit'
+    return per_answer, batched
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare per-answer and batched autosave traffic')
+    parser.add_argument('--interviews', type=int, default=20)
+    parser.add_argument('--questions', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    totals = {'per-answer': {'requests': 0, 'bytes': 0}, 'batched': {'requests': 0, 'bytes': 0}}
+    for _ in range(args.interviews):
+        for name, result in zip(totals, simulate(rng, args.questions)):
+            totals[name]['requests'] += result['requests']
+            totals[name]['bytes'] += result['bytes']
+
+    print(f"{args.interviews} interviews x {args.questions} questions (seed {args.seed}), per interview:")
+    for name, total in totals.items():
+        print(f"  {name:<11} {total['requests'] / args.interviews:7.1f} requests   "
+              f"{total['bytes'] / args.interviews / 1024:7.1f} KB uploaded")
+    print("  Server state matched the typed answers in every interview")
+
+
+if __name__ == '__main__':
+    main()
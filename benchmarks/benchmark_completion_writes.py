@@ -0,0 +1,97 @@
+"""
+Benchmark for the interview completion writes
+Compares the old sequential completion calls (save_report, then
+delete_interview_session, then FirebaseAuthManager.update_user_stats) with
+FirebaseStorageManager.complete_interview, which does the same work in one
+transaction, against the local Firestore emulator.
+
+Start the emulator first and point the app at it:
+    firebase emulators:start --only firestore
+    export FIRESTORE_EMULATOR_HOST=localhost:8080
+
+Usage:
+    python benchmarks/benchmark_completion_writes.py [--interviews 50] [--questions 10]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('FIRESTORE_EMULATOR_HOST'):
+    sys.exit('Set FIRESTORE_EMULATOR_HOST to a running Firestore emulator (never run this against production)')
+
+from utils.firebase_auth import FirebaseAuthManager
+from utils.firebase_storage import FirebaseStorageManager
+
+SETUP = {'job_role': 'Software Engineer', 'domain': 'Python', 'interview_type': 'Technical',
+         'question_type': 'Short Answer', 'difficulty': 'Medium'}
+
+
+def make_interview(storage_manager, user_id, question_count):
+    interview_id = f'{user_id}_{uuid.uuid4().hex[:8]}'
+    questions = [{'text': f'Question {n}', 'type': 'short'} for n in range(question_count)]
+    answers = {str(n): 'An answer of moderate length. ' * 20 for n in range(question_count)}
+    storage_manager.save_interview_session(user_id, interview_id, {
+        'questions': questions, 'user_answers': answers, 'current_question': question_count - 1
+    })
+    results = {'overall_score': 7.0, 'question_results': []}
+    return interview_id, questions, answers, results
+
+
+def sequential(storage_manager, auth_manager, user_id, interview):
+    interview_id, questions, answers, results = interview
+    storage_manager.save_report(user_id, SETUP, questions, answers, results)
+    storage_manager.delete_interview_session(interview_id)
+    auth_manager.update_user_stats(user_id, results)
+
+
+def transactional(storage_manager, auth_manager, user_id, interview):
+    interview_id, questions, answers, results = interview
+    storage_manager.complete_interview(user_id, interview_id, SETUP, questions, answers, results)
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare sequential and transactional completion writes')
+    parser.add_argument('--interviews', type=int, default=50)
+    parser.add_argument('--questions', type=int, default=10)
+    args = parser.parse_args()
+
+    storage_manager = FirebaseStorageManager()
+    auth_manager = FirebaseAuthManager()
+    user_id = f'benchmark-{uuid.uuid4().hex[:8]}'
+    auth_manager.users_collection.document(user_id).set({
+        'id': user_id, 'total_interviews': 0, 'average_score': 0.0, 'skill_levels': {}
+    })
+
+    timings = {'sequential': [], 'transaction': []}
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Seed the user's stats so both paths update them
+        storage_manager.rebuild_user_stats(user_id)
+        for _ in range(args.interviews):
+            # Alternate the two paths so emulator warm-up affects both equally
+            for label, complete in (('sequential', sequential), ('transaction', transactional)):
+                interview = make_interview(storage_manager, user_id, args.questions)
+                started = time.perf_counter()
+                complete(storage_manager, auth_manager, user_id, interview)
+                timings[label].append(time.perf_counter() - started)
+
+    print(f"{args.interviews} completions per path, {args.questions} questions each")
+    for label, values in timings.items():
+        print(f"{label:<12} p50 {percentile(values, 0.5) * 1000:7.1f}ms   p95 {percentile(values, 0.95) * 1000:7.1f}ms")
+
+    profile = auth_manager.users_collection.document(user_id).get().to_dict()
+    print(f"Profile total_interviews: {profile['total_interviews']} (expected {args.interviews * 2})")
+
+
+if __name__ == '__main__':
+    main()
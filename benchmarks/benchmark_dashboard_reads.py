@@ -0,0 +1,95 @@
+"""
+Benchmark for documents read per dashboard view
+Seeds one user with reports in the local Firestore emulator and counts the
+documents read for one dashboard view:
+
+- before: the separate get_user_stats, get_recent_reports and /api/stats
+  (get_detailed_stats) calls the dashboard used to make, each reading the
+  stats document on its own
+- after: GET /dashboard, which loads one stats snapshot per request, reuses it
+  for the recent reports and renders the chart data inline; measured with a
+  cold cache and again within USER_STATS_CACHE_TTL
+
+Start the emulator first and point the app at it:
+    firebase emulators:start --only firestore
+    export FIRESTORE_EMULATOR_HOST=localhost:8080
+
+Usage:
+    python benchmarks/benchmark_dashboard_reads.py [--reports 200] [--repeat 5]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('FIRESTORE_EMULATOR_HOST'):
+    sys.exit('Set FIRESTORE_EMULATOR_HOST to a running Firestore emulator (never run this against production)')
+
+# Keep the app import offline and free of background work
+os.environ.setdefault('LLM_BACKEND', 'stub')
+os.environ.setdefault('SESSION_SWEEP_ENABLED', 'False')
+os.environ.setdefault('QUESTION_BANK_WARMUP_ENABLED', 'False')
+
+# Importing the listing benchmark also installs its document read counters
+from benchmark_report_listing import DOCUMENTS_READ, seed
+from app import app, storage_manager
+
+
+def measure(label, repeat, call, cold=True):
+    timings = []
+    reads = []
+    for _ in range(repeat):
+        if cold and storage_manager.cache:
+            storage_manager.cache.entries.clear()
+        DOCUMENTS_READ[0] = 0
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            call()
+        timings.append(time.perf_counter() - started)
+        reads.append(DOCUMENTS_READ[0])
+    timings.sort()
+    print(f"{label:<40} median {timings[len(timings) // 2] * 1000:8.1f}ms   "
+          f"{max(reads):4d} documents read per view")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count documents read per dashboard view')
+    parser.add_argument('--reports', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    user_id = f'benchmark-{uuid.uuid4().hex[:8]}'
+    with contextlib.redirect_stdout(io.StringIO()):
+        seed(storage_manager, user_id, args.reports)
+    print(f"Seeded {args.reports} reports for {user_id}")
+
+    def before():
+        cache, storage_manager.cache = storage_manager.cache, None
+        try:
+            storage_manager.get_user_stats(user_id)
+            storage_manager.get_recent_reports(user_id, limit=5)
+            storage_manager.get_detailed_stats(user_id)
+        finally:
+            storage_manager.cache = cache
+
+    client = app.test_client()
+    with client.session_transaction() as flask_session:
+        flask_session['user_id'] = user_id
+
+    def after():
+        response = client.get('/dashboard')
+        assert response.status_code == 200, response.status_code
+
+    measure('Before (3 calls + /api/stats fetch)', args.repeat, before)
+    measure('After, cold cache (GET /dashboard)', args.repeat, after)
+    if storage_manager.cache:
+        measure('After, within USER_STATS_CACHE_TTL', args.repeat, after, cold=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark for AIHelper.evaluate_answers
+Compares sequential, concurrent and batched evaluation against a stubbed
+model that sleeps to simulate Gemini round-trip latency.
+
+Usage:
+    python benchmarks/benchmark_evaluation.py [--questions 20] [--latency 0.5] [--workers 4]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from utils.ai_helper import AIHelper
+
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubModel:
+    """Minimal stand-in for genai.GenerativeModel with fixed latency"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        time.sleep(self.latency)
+        self.calls += 1
+        if 'Respond ONLY with a JSON array' in prompt:
+            return StubResponse(self._batch_response(prompt))
+        return StubResponse(
+            "CLARITY_SCORE: 7\n"
+            "CLARITY_FEEDBACK: Clear explanation.\n\n"
+            "CORRECTNESS_SCORE: 8\n"
+            "CORRECTNESS_FEEDBACK: Technically accurate.\n\n"
+            "COMPLETENESS_SCORE: 6\n"
+            "COMPLETENESS_FEEDBACK: Some aspects are missing.\n\n"
+            "OVERALL_SCORE: 7\n"
+            "OVERALL_FEEDBACK: Solid answer overall.\n\n"
+            "SUGGESTED_RESOURCES: Official Python documentation, "
+            "Book: 'Effective Python' by Brett Slatkin"
+        )
+
+    def _batch_response(self, prompt):
+        answers = json.loads(re.search(r'Answers:\s*(\[.*?\n\])', prompt, re.DOTALL).group(1))
+        return json.dumps([
+            {
+                'id': item['id'],
+                'clarity_score': 7,
+                'clarity_feedback': 'Clear explanation.',
+                'correctness_score': 8,
+                'correctness_feedback': 'Technically accurate.',
+                'completeness_score': 6,
+                'completeness_feedback': 'Some aspects are missing.',
+                'overall_score': 7,
+                'overall_feedback': 'Solid answer overall.',
+                'suggested_resources': [
+                    'Official Python documentation',
+                    "Book: 'Effective Python' by Brett Slatkin"
+                ]
+            }
+            for item in answers
+        ])
+
+
+def build_interview(question_count):
+    """Build a short-answer interview with one answer per question"""
+    categories = ['Python', 'Algorithms', 'System Design', 'API Design']
+    questions = []
+    answers = {}
+    for i in range(question_count):
+        questions.append({
+            'text': f'Explain concept number {i} and when you would use it.',
+            'type': 'short',
+            'category': categories[i % len(categories)],
+            'difficulty': 'Medium'
+        })
+        answers[str(i)] = f'Concept {i} is used when the workload needs it, for example in production services.'
+    setup = {
+        'job_role': 'Software Engineer',
+        'domain': 'Backend',
+        'interview_type': 'Technical',
+        'question_count': question_count,
+        'question_type': 'Short Answer',
+        'difficulty': 'Medium'
+    }
+    return questions, answers, setup
+
+
+def run(ai_helper, workers, questions, answers, setup, batch=False):
+    Config.EVALUATION_MAX_WORKERS = workers
+    Config.BATCH_EVALUATION_ENABLED = batch
+    ai_helper.model.calls = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = ai_helper.evaluate_answers(questions, answers, setup)
+    return results, time.perf_counter() - start, ai_helper.model.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark answer evaluation')
+    parser.add_argument('--questions', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.5, help='Stub model latency in seconds')
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    # Disable the evaluation cache so every run pays for its model calls
+    Config.EVALUATION_CACHE_ENABLED = False
+    Config.MODEL_RATE_LIMIT_RPM = 0
+    ai_helper = AIHelper(model=StubModel(args.latency))
+    questions, answers, setup = build_interview(args.questions)
+
+    sequential, sequential_time, sequential_calls = run(ai_helper, 1, questions, answers, setup)
+    concurrent, concurrent_time, concurrent_calls = run(ai_helper, args.workers, questions, answers, setup)
+    batched, batched_time, batched_calls = run(ai_helper, args.workers, questions, answers, setup, batch=True)
+
+    if sequential != concurrent:
+        print("❌ Concurrent results differ from sequential results")
+        sys.exit(1)
+    if sequential['overall_score'] != batched['overall_score']:
+        print("❌ Batched scores differ from sequential scores")
+        sys.exit(1)
+
+    print(f"Questions: {args.questions}, stub latency: {args.latency:.2f}s")
+    print(f"Sequential (1 worker):   {sequential_time:.2f}s, {sequential_calls} calls")
+    print(f"Concurrent ({args.workers} workers):  {concurrent_time:.2f}s, {concurrent_calls} calls "
+          f"({sequential_time / concurrent_time:.1f}x)")
+    print(f"Batched:                 {batched_time:.2f}s, {batched_calls} calls "
+          f"({sequential_time / batched_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
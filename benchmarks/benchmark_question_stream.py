@@ -0,0 +1,105 @@
+"""
+Benchmark for streamed question generation
+Measures time-to-first-question and total time for AIHelper.generate_questions
+(blocking) and AIHelper.stream_questions against a stubbed model that emits
+its JSON response in chunks at a fixed rate.
+
+Usage:
+    python benchmarks/benchmark_question_stream.py [--questions 20] [--per-question 0.4]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from utils.ai_helper import AIHelper
+
+
+class StubChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubStreamingModel:
+    """Stand-in for genai.GenerativeModel that produces questions at a fixed rate"""
+
+    def __init__(self, question_count, per_question):
+        self.question_count = question_count
+        self.per_question = per_question
+
+    def _chunks(self):
+        yield StubChunk('```json\n[\n')
+        for i in range(self.question_count):
+            question = json.dumps({
+                'text': f'Explain concept number {i} and when you would use it.',
+                'type': 'short',
+                'category': 'Python',
+                'difficulty': 'Medium'
+            }, indent=2)
+            # Split every question across chunk boundaries like a real token stream
+            middle = len(question) // 2
+            time.sleep(self.per_question / 2)
+            yield StubChunk(question[:middle])
+            time.sleep(self.per_question / 2)
+            separator = ',\n' if i < self.question_count - 1 else '\n'
+            yield StubChunk(question[middle:] + separator)
+        yield StubChunk(']\n```')
+
+    def generate_content(self, prompt, stream=False):
+        if stream:
+            return self._chunks()
+        chunks = list(self._chunks())
+        return StubChunk(''.join(chunk.text for chunk in chunks))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark streamed question generation')
+    parser.add_argument('--questions', type=int, default=20)
+    parser.add_argument('--per-question', type=float, default=0.4,
+                        help='Stub model generation time per question in seconds')
+    args = parser.parse_args()
+
+    Config.EVALUATION_CACHE_ENABLED = False
+    Config.MODEL_RATE_LIMIT_RPM = 0
+    ai_helper = AIHelper(model=StubStreamingModel(args.questions, args.per_question))
+    setup = {
+        'job_role': 'Software Engineer',
+        'domain': 'Python',
+        'interview_type': 'Technical',
+        'question_count': args.questions,
+        'question_type': 'Short Answer',
+        'difficulty': 'Medium'
+    }
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        blocking = ai_helper.generate_questions(dict(setup))
+        blocking_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        first_question_time = None
+        streamed = []
+        for question in ai_helper.stream_questions(dict(setup)):
+            if first_question_time is None:
+                first_question_time = time.perf_counter() - start
+            streamed.append(question)
+        streaming_time = time.perf_counter() - start
+
+    if blocking != streamed:
+        print("❌ Streamed questions differ from blocking questions")
+        sys.exit(1)
+
+    print(f"Questions: {args.questions}, stub generation time: {args.per_question:.2f}s/question")
+    print(f"Blocking:  first question after {blocking_time:.2f}s, all after {blocking_time:.2f}s")
+    print(f"Streaming: first question after {first_question_time:.2f}s, all after {streaming_time:.2f}s")
+    print(f"Time-to-first-question speedup: {blocking_time / first_question_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
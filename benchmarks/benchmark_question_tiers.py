@@ -0,0 +1,101 @@
+"""
+Benchmark for the interview question tiers
+Saves and reads the question lists of many interviews through:
+
+- backup file: the synchronous questions_<id>.json write /generate_questions
+  used to make after the Firestore save, and the os.path.exists probe plus
+  read of the old fallback
+- InterviewQuestionStore with the local tiers, durability 'memory' and the
+  file tier mirrored in the background, read from memory and (in a fresh
+  store, as another worker would) from the file tier
+
+The Firestore tier is left out so the benchmark runs without credentials;
+its cost is the same single session read as before.
+
+Usage:
+    python benchmarks/benchmark_question_tiers.py [--interviews 2000] [--questions 10]
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.interview_store import FileQuestionTier, InterviewQuestionStore, MemoryQuestionTier
+
+
+def make_questions(count):
+    return [{
+        'id': index + 1,
+        'text': f'Question {index + 1}: explain how you would design a rate limiter for a public API.',
+        'type': 'mcq',
+        'options': ['A token bucket', 'A fixed window', 'A sliding log', 'No limit'],
+        'correct_answer': 0,
+        'category': 'System Design'
+    } for index in range(count)]
+
+
+def timed(label, calls):
+    started = time.perf_counter()
+    for call in calls:
+        call()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<44} {elapsed / len(calls) * 1e6:8.1f}us per call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the question backup file with the tiered question store')
+    parser.add_argument('--interviews', type=int, default=2000)
+    parser.add_argument('--questions', type=int, default=10)
+    args = parser.parse_args()
+
+    questions = make_questions(args.questions)
+    ids = [f'benchmark_user_{index}' for index in range(args.interviews)]
+    workdir = tempfile.mkdtemp(prefix='question-tier-benchmark-')
+    try:
+        backup_dir = os.path.join(workdir, 'backup')
+        os.makedirs(backup_dir)
+
+        def backup_write(interview_id):
+            with open(os.path.join(backup_dir, f'questions_{interview_id}.json'), 'w') as f:
+                json.dump(questions, f)
+
+        def backup_read(interview_id):
+            path = os.path.join(backup_dir, f'questions_{interview_id}.json')
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    return json.load(f)
+
+        print(f"{args.interviews} interviews x {args.questions} questions")
+        timed('save: backup file (before)', [lambda i=i: backup_write(i) for i in ids])
+
+        tier_dir = os.path.join(workdir, 'tiers')
+        store = InterviewQuestionStore(
+            [MemoryQuestionTier(max_entries=args.interviews), FileQuestionTier(tier_dir)], durability='memory'
+        )
+        timed('save: memory, file mirrored (after)', [lambda i=i: store.save(i, questions) for i in ids])
+        started = time.perf_counter()
+        store.drain()
+        print(f"{'  mirror drained in the background':<44} {(time.perf_counter() - started) * 1000:8.1f}ms left after the saves")
+
+        timed('read: exists + backup file (before)', [lambda i=i: backup_read(i) for i in ids])
+        timed('read: memory tier hit (after)', [lambda i=i: store.get(i) for i in ids])
+
+        other_worker = InterviewQuestionStore(
+            [MemoryQuestionTier(max_entries=args.interviews), FileQuestionTier(tier_dir)], durability='memory'
+        )
+        timed('read: file tier, another worker (after)', [lambda i=i: other_worker.get(i) for i in ids])
+        assert all(other_worker.get(i) == questions for i in ids), 'a tier lost questions'
+
+        for name, counters in other_worker.stats()['tiers'].items():
+            print(f"  {name:<10} " + '   '.join(f'{key} {value}' for key, value in counters.items()))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark for the report listing queries
+Seeds one user with thousands of reports in the local Firestore emulator and
+compares time and documents read for the legacy full-history listing
+(get_user_reports: stream every report, sort in Python) with the paginated
+summary listing (get_report_summaries_page) used by /reports and the dashboard.
+
+Start the emulator first and point the app at it:
+    firebase emulators:start --only firestore
+    export FIRESTORE_EMULATOR_HOST=localhost:8080
+
+Usage:
+    python benchmarks/benchmark_report_listing.py [--reports 2000] [--pages 3] [--repeat 5]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('FIRESTORE_EMULATOR_HOST'):
+    sys.exit('Set FIRESTORE_EMULATOR_HOST to a running Firestore emulator (never run this against production)')
+
+from google.cloud.firestore_v1.document import DocumentReference
+from google.cloud.firestore_v1.query import Query
+from config import Config
+from utils.firebase_storage import FirebaseStorageManager
+
+DOCUMENTS_READ = [0]
+
+
+def _count_stream(stream):
+    def counted(self, *args, **kwargs):
+        for snapshot in stream(self, *args, **kwargs):
+            DOCUMENTS_READ[0] += 1
+            yield snapshot
+    return counted
+
+
+def _count_get(get):
+    def counted(self, *args, **kwargs):
+        DOCUMENTS_READ[0] += 1
+        return get(self, *args, **kwargs)
+    return counted
+
+
+# Count every document returned to the app (what Firestore bills as reads)
+Query.stream = _count_stream(Query.stream)
+DocumentReference.get = _count_get(DocumentReference.get)
+
+
+def seed(storage_manager, user_id, count):
+    started = datetime.now() - timedelta(days=count)
+    domains = ['Python', 'SQL', 'React', 'AWS']
+    for start in range(0, count, 500):
+        batch = storage_manager.db.batch()
+        for i in range(start, min(start + 500, count)):
+            report_id = str(uuid.uuid4())
+            batch.set(storage_manager.reports_collection.document(report_id), {
+                'id': report_id,
+                'user_id': user_id,
+                'created_at': (started + timedelta(days=i)).isoformat(),
+                'setup': {'job_role': 'Software Engineer', 'domain': domains[i % len(domains)],
+                          'interview_type': 'Technical', 'question_type': 'Short Answer', 'difficulty': 'Medium'},
+                'questions': [{'text': f'Question {n}', 'type': 'short'} for n in range(10)],
+                'answers': {str(n): 'An answer of moderate length. ' * 20 for n in range(10)},
+                'results': {'overall_score': round(4 + (i % 60) / 10, 1), 'question_results': []}
+            })
+        batch.commit()
+    # Writes the stats document and the report summaries
+    storage_manager.rebuild_user_stats(user_id)
+
+
+def measure(label, repeat, call):
+    timings = []
+    for _ in range(repeat):
+        DOCUMENTS_READ[0] = 0
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            call()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    print(f"{label:<34} median {timings[len(timings) // 2] * 1000:8.1f}ms   {DOCUMENTS_READ[0]:6d} documents read")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare full-history and paginated report listing')
+    parser.add_argument('--reports', type=int, default=2000)
+    parser.add_argument('--pages', type=int, default=3, help='Pages walked with the cursor')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    storage_manager = FirebaseStorageManager()
+    user_id = f'benchmark-{uuid.uuid4().hex[:8]}'
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        seed(storage_manager, user_id, args.reports)
+    print(f"Seeded {args.reports} reports for {user_id} in {time.perf_counter() - started:.1f}s "
+          f"(page size {Config.REPORTS_PAGE_SIZE})")
+
+    def walk_pages():
+        cursor = None
+        for _ in range(args.pages):
+            page = storage_manager.get_report_summaries_page(user_id, cursor=cursor)
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+
+    measure('Full history (get_user_reports)', args.repeat, lambda: storage_manager.get_user_reports(user_id))
+    measure('First page of summaries', args.repeat, lambda: storage_manager.get_report_summaries_page(user_id))
+    measure(f'First {args.pages} pages of summaries', args.repeat, walk_pages)
+    measure('Dashboard recent reports (5)', args.repeat, lambda: storage_manager.get_recent_reports(user_id, 5))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Offline load test of the question generation + evaluation path
+Runs complete interviews (generate_questions, then evaluate_answers) through
+AIHelper and its ModelClient against the local stub LLM backend, with
+configurable latency and error rate. No API key or network access needed.
+
+With --concurrency 1 the run is fully reproducible for a given --seed.
+
+Usage:
+    python benchmarks/benchmark_request_path.py [--interviews 20] [--concurrency 4]
+        [--latency 0.2] [--error-rate 0.05] [--seed 42] [--rpm 0]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from utils.ai_helper import AIHelper
+from utils.llm_backends import StubBackend
+
+
+def run_interview(ai_helper, number, question_count):
+    setup = {
+        'job_role': Config.JOB_ROLES[number % len(Config.JOB_ROLES)],
+        'domain': 'Python',
+        'interview_type': 'Technical',
+        'question_count': question_count,
+        'question_type': 'AI Choice',
+        'difficulty': 'Medium'
+    }
+
+    started = time.perf_counter()
+    questions = ai_helper.generate_questions(dict(setup))
+    generated = time.perf_counter()
+
+    answers = {}
+    for i, question in enumerate(questions):
+        if question.get('type') == 'mcq':
+            answers[str(i)] = 'A'
+        else:
+            answers[str(i)] = f'Interview {number} answer {i}: ' + 'it depends on the trade-offs involved. ' * (i % 5 + 1)
+    results = ai_helper.evaluate_answers(questions, answers, setup)
+    finished = time.perf_counter()
+
+    return generated - started, finished - generated, results['overall_score']
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline load test against the stub LLM backend')
+    parser.add_argument('--interviews', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--questions', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.2, help='Stub latency per call in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.05, help='Share of stub calls that fail')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--rpm', type=int, default=0, help='Model client rate limit (0 = unlimited)')
+    args = parser.parse_args()
+
+    Config.EVALUATION_CACHE_ENABLED = False
+    Config.MODEL_BACKOFF_BASE = 0.05
+    Config.MODEL_RATE_LIMIT_RPM = args.rpm
+    backend = StubBackend(latency=args.latency, error_rate=args.error_rate, seed=args.seed)
+    ai_helper = AIHelper(model=backend)
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            runs = list(executor.map(
+                lambda number: run_interview(ai_helper, number, args.questions), range(args.interviews)
+            ))
+    elapsed = time.perf_counter() - started
+
+    generation = [run[0] for run in runs]
+    evaluation = [run[1] for run in runs]
+    scores = [run[2] for run in runs]
+    stats = ai_helper.model_client.stats()
+
+    print(f"Interviews: {args.interviews} x {args.questions} questions, concurrency {args.concurrency}, "
+          f"stub latency {args.latency:.2f}s, error rate {args.error_rate:.0%}, seed {args.seed}")
+    print(f"Total: {elapsed:.2f}s ({args.interviews / elapsed:.2f} interviews/s), {backend.calls} backend calls")
+    print(f"Question generation: p50 {percentile(generation, 0.5):.2f}s, p95 {percentile(generation, 0.95):.2f}s")
+    print(f"Evaluation:          p50 {percentile(evaluation, 0.5):.2f}s, p95 {percentile(evaluation, 0.95):.2f}s")
+    print(f"Model client: {stats['successes']} successes, {stats['retries']} retries, "
+          f"{stats['failures']} failures, fallbacks {stats['fallbacks'] or 'none'}")
+    print(f"Average overall score: {sum(scores) / len(scores):.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Multi-worker benchmark for the server-side session backends
+Runs the interview session pattern (log in, save the setup, start an
+interview, then alternate page views and answer autosaves) from several
+worker processes against one shared session store, and compares Flask-Session
+filesystem sessions with the SQLite backend (and Redis when --redis-url is
+given). Reports requests per second, latency, store writes skipped by lazy
+saving and the size of the store. Each run also checks that a session written
+by one worker can be read by a fresh process, as a second node would.
+
+Usage:
+    python benchmarks/benchmark_session_store.py [--workers 4] [--users 25] [--answers 20]
+        [--redis-url redis://localhost:6379/15]
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify, request, session
+from config import Config
+
+SECRET_KEY = 'benchmark-secret'
+
+
+def create_app(backend, location):
+    """Minimal app with the session traffic of the interview routes"""
+    app = Flask(__name__)
+    app.secret_key = SECRET_KEY
+
+    if backend == 'filesystem':
+        from flask_session import Session
+        app.config.update(SESSION_TYPE='filesystem', SESSION_FILE_DIR=location, SESSION_PERMANENT=False,
+                          SESSION_USE_SIGNER=True, SESSION_KEY_PREFIX=Config.SESSION_KEY_PREFIX)
+        Session(app)
+    else:
+        from utils.session_store import RedisSessionStore, ServerSessionInterface, SQLiteSessionStore
+        store = SQLiteSessionStore(location) if backend == 'sqlite' else RedisSessionStore(location)
+        app.session_interface = ServerSessionInterface(store)
+
+    @app.route('/login', methods=['POST'])
+    def login():
+        session['user_id'] = request.json['user_id']
+        session['user_name'] = 'Benchmark User'
+        session['user_email'] = 'benchmark@example.com'
+        return jsonify({'success': True})
+
+    @app.route('/setup', methods=['POST'])
+    def setup():
+        session['interview_setup'] = {
+            'job_role': 'Software Engineer', 'domain': 'Python', 'interview_type': 'Technical',
+            'question_count': 10, 'question_type': 'Short Answer', 'difficulty': 'Medium'
+        }
+        session['interview_id'] = f"{session['user_id']}_{int(time.time())}"
+        session['current_question'] = 0
+        session['user_answers'] = {}
+        return jsonify({'success': True})
+
+    @app.route('/interview')
+    def interview():
+        # Read-only page view
+        return jsonify({'current_question': session.get('current_question', 0),
+                        'answered': len(session.get('user_answers', {}))})
+
+    @app.route('/submit_answer', methods=['POST'])
+    def submit_answer():
+        data = request.json
+        session['user_answers'][str(data['question_index'])] = data['answer']
+        session.modified = True
+        return jsonify({'success': True})
+
+    return app
+
+
+def run_worker(args):
+    backend, location, worker, users, answers = args
+    app = create_app(backend, location)
+    timings = []
+    cookie = None
+
+    for user in range(users):
+        client = app.test_client()
+
+        def timed(method, url, **kwargs):
+            started = time.perf_counter()
+            response = getattr(client, method)(url, **kwargs)
+            timings.append(time.perf_counter() - started)
+            assert response.status_code == 200, (url, response.status_code)
+            return response
+
+        timed('post', '/login', json={'user_id': f'w{worker}-u{user}'})
+        timed('post', '/setup')
+        for index in range(answers):
+            timed('get', '/interview')
+            timed('post', '/submit_answer', json={'question_index': index % 10,
+                                                  'answer': f'Answer {index}: ' + 'because of the trade-offs. ' * 20})
+            timed('get', '/interview')
+        cookie = client.get_cookie(app.config['SESSION_COOKIE_NAME'])
+    stats = app.session_interface.stats() if hasattr(app.session_interface, 'stats') else {}
+    return timings, cookie.value if cookie else None, stats
+
+
+def store_size(backend, location):
+    if backend == 'filesystem':
+        files = [os.path.join(location, name) for name in os.listdir(location)]
+        return f"{len(files)} files, {sum(os.path.getsize(f) for f in files) / 1024:.0f} KB"
+    if backend == 'sqlite':
+        size = sum(os.path.getsize(location + suffix) for suffix in ('', '-wal') if os.path.exists(location + suffix))
+        return f"{size / 1024:.0f} KB database"
+    return 'in Redis'
+
+
+def benchmark(backend, location, workers, users, answers):
+    started = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        runs = pool.map(run_worker, [(backend, location, worker, users, answers) for worker in range(workers)])
+    elapsed = time.perf_counter() - started
+
+    timings = sorted(t for run in runs for t in run[0])
+    skipped = sum(run[2].get('skipped_writes', 0) for run in runs)
+    writes = sum(run[2].get('writes', 0) for run in runs)
+
+    # A fresh process (another node) must see the session written by a worker
+    app = create_app(backend, location)
+    client = app.test_client()
+    client.set_cookie(app.config['SESSION_COOKIE_NAME'], runs[0][1])
+    shared = client.get('/interview').get_json()['answered'] > 0
+
+    lazy = f"{writes} writes, {skipped} skipped" if writes or skipped else 'no write counters'
+    print(f"{backend:<10} {len(timings) / elapsed:8.0f} req/s   p50 {timings[len(timings) // 2] * 1000:6.2f}ms   "
+          f"p95 {timings[int(len(timings) * 0.95)] * 1000:6.2f}ms   {lazy}   {store_size(backend, location)}   "
+          f"shared: {'yes' if shared else 'NO'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare session backends under several worker processes')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--users', type=int, default=25, help='Users per worker')
+    parser.add_argument('--answers', type=int, default=20, help='Answer autosaves per user')
+    parser.add_argument('--redis-url', help='Also benchmark Redis (use a scratch database)')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='session-benchmark-')
+    try:
+        print(f"{args.workers} workers x {args.users} users x {args.answers} answers "
+              f"({args.workers * args.users * (2 + 3 * args.answers)} requests per backend)")
+        filesystem_dir = os.path.join(workdir, 'files')
+        os.makedirs(filesystem_dir)
+        benchmark('filesystem', filesystem_dir, args.workers, args.users, args.answers)
+        benchmark('sqlite', os.path.join(workdir, 'sessions.db'), args.workers, args.users, args.answers)
+        if args.redis_url:
+            benchmark('redis', args.redis_url, args.workers, args.users, args.answers)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
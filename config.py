@@ -6,6 +6,7 @@ load_dotenv()
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or ' '
     GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY') or ' '
+    GEMINI_MODEL = os.environ.get('GEMINI_MODEL', 'gemini-2.5-flash')
     
     # Environment settings
     DEBUG = os.environ.get('DEBUG', 'False').lower() == 'true'
@@ -26,8 +27,14 @@ class Config:
     FIREBASE_CLIENT_EMAIL = os.environ.get('FIREBASE_CLIENT_EMAIL')
     
     # Session configuration for large data storage
+    # 'filesystem' (Flask-Session pickle files in SESSION_FILE_DIR), or opt in to 'sqlite'
+    # (one database shared by the workers on a host) or 'redis' (shared across hosts)
+    SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'filesystem').lower()
+    SESSION_DB_PATH = os.environ.get('SESSION_DB_PATH', 'data/sessions.db')
+    SESSION_REDIS_URL = os.environ.get('SESSION_REDIS_URL', 'redis://localhost:6379/0')
+    SESSION_TTL = int(os.environ.get('SESSION_TTL', 24 * 60 * 60))  # Seconds after the last change
     SESSION_TYPE = 'filesystem'
-    SESSION_FILE_DIR = 'data/sessions'
+    SESSION_FILE_DIR = 'data/sessions'  # Also holds the question files of the 'file' tier
     SESSION_PERMANENT = False
     SESSION_USE_SIGNER = True
     SESSION_KEY_PREFIX = 'interview_buddy:'
@@ -40,10 +47,27 @@ class Config:
     MAX_QUESTIONS_PER_SESSION = 20
     MIN_QUESTIONS_PER_SESSION = 5
     DEFAULT_QUESTIONS_COUNT = 10
+    # Start the interview on the first question while the rest are still being generated
+    QUESTION_STREAMING_ENABLED = os.environ.get('QUESTION_STREAMING_ENABLED', 'True').lower() == 'true'
+    # Another stream may take over generation once the generating one is silent this long (seconds)
+    QUESTION_GENERATION_LEASE = int(os.environ.get('QUESTION_GENERATION_LEASE', 60))
+    QUESTION_STREAM_POLL_INTERVAL = 1.0  # Seconds between session reads of a stream following another one
+    # Tiers holding each interview's question list, fastest first ('memory', 'file', 'firestore')
+    INTERVIEW_QUESTION_TIERS = [
+        tier.strip() for tier in os.environ.get('INTERVIEW_QUESTION_TIERS', 'memory,firestore').lower().split(',')
+        if tier.strip()
+    ]
+    # Saves wait for the tiers up to this one; slower tiers are mirrored in the background
+    INTERVIEW_QUESTION_DURABILITY = os.environ.get('INTERVIEW_QUESTION_DURABILITY', 'firestore').lower()
+    INTERVIEW_QUESTION_MEMORY_ENTRIES = int(os.environ.get('INTERVIEW_QUESTION_MEMORY_ENTRIES', 500))
     
     # File paths
     USERS_FILE = 'data/users.json'
     REPORTS_DIR = 'data/reports'
+    # SQLite database of the local report store (utils/storage.py)
+    REPORTS_DB_PATH = os.environ.get('REPORTS_DB_PATH', 'data/reports.db')
+    # Reports listed per page on /reports
+    REPORTS_PAGE_SIZE = int(os.environ.get('REPORTS_PAGE_SIZE', 20))
     
     # Supported job roles and domains
     JOB_ROLES = [
@@ -73,8 +97,108 @@ class Config:
     
     INTERVIEW_TYPES = ['Technical', 'Behavioral', 'Mixed']
     QUESTION_TYPES = ['MCQ', 'Short Answer', 'AI Choice']
+    DIFFICULTY_LEVELS = ['Easy', 'Medium', 'Hard']
     
     # Scoring settings
     MCQ_MAX_SCORE = 10
     SHORT_ANSWER_MAX_SCORE = 10
     PASS_PERCENTAGE = 70
+    # Entries kept per leaderboard (all reports, per domain, per job role; all time, month, week)
+    LEADERBOARD_SIZE = int(os.environ.get('LEADERBOARD_SIZE', 100))
+
+    # Answer-level analytics export (python export_answers.py; needs requirements-analytics.txt)
+    ANALYTICS_EXPORT_PATH = os.environ.get('ANALYTICS_EXPORT_PATH', 'data/analytics/answers')
+    ANALYTICS_CHUNK_ROWS = int(os.environ.get('ANALYTICS_CHUNK_ROWS', 500000))  # Rows per .npz chunk
+
+    # LLM backend settings
+    LLM_BACKEND = os.environ.get('LLM_BACKEND', 'gemini')  # 'gemini' or 'stub' (offline load testing)
+    LLM_STUB_LATENCY = float(os.environ.get('LLM_STUB_LATENCY', 0.5))  # Seconds per stub call
+    LLM_STUB_ERROR_RATE = float(os.environ.get('LLM_STUB_ERROR_RATE', 0.0))  # Share of stub calls that fail
+    LLM_STUB_SEED = int(os.environ.get('LLM_STUB_SEED', 42))
+    
+    # Model client settings
+    MODEL_REQUEST_TIMEOUT = int(os.environ.get('MODEL_REQUEST_TIMEOUT', 60))  # Seconds per attempt
+    MODEL_CALL_DEADLINE = int(os.environ.get('MODEL_CALL_DEADLINE', 120))  # Seconds per call, including retries
+    MODEL_MAX_RETRIES = int(os.environ.get('MODEL_MAX_RETRIES', 3))
+    MODEL_BACKOFF_BASE = 0.5  # Seconds before the first retry (doubled per attempt, with jitter)
+    MODEL_BACKOFF_MAX = 8
+    # Token bucket shared by all threads of a process (0 = unlimited)
+    MODEL_RATE_LIMIT_RPM = int(os.environ.get('MODEL_RATE_LIMIT_RPM', 300))
+    MODEL_RATE_LIMIT_BURST = int(os.environ.get('MODEL_RATE_LIMIT_BURST', 10))
+    # Fail fast to fallbacks after this many consecutive provider failures, for RESET_TIMEOUT seconds
+    MODEL_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get('MODEL_CIRCUIT_FAILURE_THRESHOLD', 5))
+    MODEL_CIRCUIT_RESET_TIMEOUT = int(os.environ.get('MODEL_CIRCUIT_RESET_TIMEOUT', 30))
+    
+    # Evaluation settings
+    # Maximum number of answers evaluated in parallel (1 = sequential)
+    EVALUATION_MAX_WORKERS = int(os.environ.get('EVALUATION_MAX_WORKERS', 4))
+    # Evaluate all short answers of an interview in as few model calls as possible
+    BATCH_EVALUATION_ENABLED = os.environ.get('BATCH_EVALUATION_ENABLED', 'False').lower() == 'true'
+    # Approximate prompt + response token budget per batch evaluation call
+    BATCH_EVALUATION_TOKEN_BUDGET = int(os.environ.get('BATCH_EVALUATION_TOKEN_BUDGET', 8000))
+    # Evaluate each answer in the background when it is submitted
+    INCREMENTAL_EVALUATION_ENABLED = os.environ.get('INCREMENTAL_EVALUATION_ENABLED', 'False').lower() == 'true'
+    # Seconds an answer must stay unchanged before it is evaluated
+    INCREMENTAL_EVALUATION_DELAY = float(os.environ.get('INCREMENTAL_EVALUATION_DELAY', 5))
+    # Maximum seconds /complete_interview waits for background evaluations still running
+    INCREMENTAL_EVALUATION_WAIT = float(os.environ.get('INCREMENTAL_EVALUATION_WAIT', 60))
+    # Forget in-process evaluations of interviews without a new answer for this long (seconds)
+    INCREMENTAL_EVALUATION_IDLE_TTL = int(os.environ.get('INCREMENTAL_EVALUATION_IDLE_TTL', 60 * 60))
+    
+    # Answer autosave settings
+    # Coalesce answer autosaves in memory and write them to the interview session periodically
+    ANSWER_WRITE_BEHIND_ENABLED = os.environ.get('ANSWER_WRITE_BEHIND_ENABLED', 'False').lower() == 'true'
+    ANSWER_FLUSH_INTERVAL = float(os.environ.get('ANSWER_FLUSH_INTERVAL', 10))  # Seconds between flushes
+    
+    # Evaluation cache settings
+    EVALUATION_CACHE_ENABLED = os.environ.get('EVALUATION_CACHE_ENABLED', 'True').lower() == 'true'
+    # Shared tier: 'memory' (in-process only) or 'sqlite' (shared by all workers on the host)
+    EVALUATION_CACHE_BACKEND = os.environ.get('EVALUATION_CACHE_BACKEND', 'sqlite')
+    EVALUATION_CACHE_PATH = os.environ.get('EVALUATION_CACHE_PATH', 'data/cache/evaluations.db')
+    EVALUATION_CACHE_TTL = int(os.environ.get('EVALUATION_CACHE_TTL', 7 * 24 * 60 * 60))  # 7 days
+    EVALUATION_CACHE_MAX_ENTRIES = int(os.environ.get('EVALUATION_CACHE_MAX_ENTRIES', 2000))
+    EVALUATION_CACHE_SHARED_MAX_ENTRIES = int(os.environ.get('EVALUATION_CACHE_SHARED_MAX_ENTRIES', 50000))
+    
+    # Background job settings
+    # Run /complete_interview evaluations on a persistent job queue instead of inside the request
+    JOB_QUEUE_ENABLED = os.environ.get('JOB_QUEUE_ENABLED', 'False').lower() == 'true'
+    JOB_QUEUE_PATH = os.environ.get('JOB_QUEUE_PATH', 'data/jobs.db')
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))  # Job threads per app process
+    JOB_POLL_INTERVAL = 1.0
+    JOB_STALE_TIMEOUT = int(os.environ.get('JOB_STALE_TIMEOUT', 5 * 60))  # Requeue running jobs silent this long
+    JOB_HEARTBEAT_INTERVAL = 30  # Seconds between heartbeats of a running job (well under JOB_STALE_TIMEOUT)
+    JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', 3))  # Then the job is moved to 'dead'
+    JOB_RETENTION = 24 * 60 * 60  # Finished jobs are purged after a day
+    
+    # Session sweeper settings (expired interview sessions and local session files)
+    SESSION_SWEEP_ENABLED = os.environ.get('SESSION_SWEEP_ENABLED', 'False').lower() == 'true'
+    SESSION_SWEEP_INTERVAL = int(os.environ.get('SESSION_SWEEP_INTERVAL', 60 * 60))  # Seconds between sweeps
+    SESSION_SWEEP_PAGE_SIZE = 500  # Sessions deleted per batched write (Firestore maximum)
+    SESSION_MAX_AGE = int(os.environ.get('SESSION_MAX_AGE', 24 * 60 * 60))  # Interview sessions and question files
+    SESSION_FILE_MAX_AGE = int(os.environ.get('SESSION_FILE_MAX_AGE', 7 * 24 * 60 * 60))  # Untouched Flask-Session files
+    
+    # Document cache settings (per-process read-through cache of interview sessions, reports and user stats)
+    DOCUMENT_CACHE_ENABLED = os.environ.get('DOCUMENT_CACHE_ENABLED', 'True').lower() == 'true'
+    DOCUMENT_CACHE_TTL = int(os.environ.get('DOCUMENT_CACHE_TTL', 5 * 60))  # Bounds staleness across workers
+    DOCUMENT_CACHE_MAX_ENTRIES = int(os.environ.get('DOCUMENT_CACHE_MAX_ENTRIES', 1000))
+    DOCUMENT_CACHE_MAX_BYTES = int(os.environ.get('DOCUMENT_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+    USER_STATS_CACHE_TTL = int(os.environ.get('USER_STATS_CACHE_TTL', 30))  # Dashboard stats may lag other workers by this much
+    
+    # Question pool settings (generated questions are reused across setups with the same key)
+    QUESTION_POOL_ENABLED = os.environ.get('QUESTION_POOL_ENABLED', 'True').lower() == 'true'
+    QUESTION_POOL_SIZE = int(os.environ.get('QUESTION_POOL_SIZE', 40))  # Questions generated per refill
+    QUESTION_POOL_MAX_SIZE = int(os.environ.get('QUESTION_POOL_MAX_SIZE', 80))
+    QUESTION_POOL_TTL = int(os.environ.get('QUESTION_POOL_TTL', 60 * 60))  # Served fresh for 1 hour
+    QUESTION_POOL_MAX_STALE = int(os.environ.get('QUESTION_POOL_MAX_STALE', 24 * 60 * 60))  # Served stale while refreshing
+    QUESTION_POOL_MEMORY_ENTRIES = 200
+    QUESTION_POOL_REFRESH_WORKERS = 2
+    
+    # Question bank settings (pre-generated questions served before the pool and the model)
+    QUESTION_BANK_ENABLED = os.environ.get('QUESTION_BANK_ENABLED', 'False').lower() == 'true'
+    QUESTION_BANK_PATH = os.environ.get('QUESTION_BANK_PATH', 'data/question_bank.db')
+    QUESTION_BANK_TARGET_DEPTH = int(os.environ.get('QUESTION_BANK_TARGET_DEPTH', 40))
+    # In-process warm-up thread; prefer running warm_question_bank.py separately with multiple workers
+    QUESTION_BANK_WARMUP_ENABLED = os.environ.get('QUESTION_BANK_WARMUP_ENABLED', 'False').lower() == 'true'
+    QUESTION_BANK_WARMUP_RPM = int(os.environ.get('QUESTION_BANK_WARMUP_RPM', 10))  # Model requests per minute
+    QUESTION_BANK_WARMUP_INTERVAL = int(os.environ.get('QUESTION_BANK_WARMUP_INTERVAL', 60 * 60))
+    QUESTION_BANK_WARMUP_BATCH = 20  # Setups filled per warm-up cycle
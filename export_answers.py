@@ -0,0 +1,79 @@
+"""
+Answer analytics export command
+Flattens stored interview reports into an answer-level columnar dataset
+(one row per question: domain, difficulty, category, question and scores)
+under ANALYTICS_EXPORT_PATH. Runs are incremental: only reports created since
+the previous export are appended, so this can run from cron.
+
+Requires NumPy: pip install -r requirements-analytics.txt
+
+Usage:
+    python export_answers.py                # Export new Firestore reports
+    python export_answers.py --local        # Export from the local SQLite report store
+    python export_answers.py --report       # Export, then print cohort statistics
+    python export_answers.py --report-only  # Print statistics without exporting
+"""
+import argparse
+import time
+
+
+def print_rows(title, rows, columns):
+    print(f"\n{title}")
+    if not rows:
+        print("  (no data)")
+        return
+    for row in rows:
+        labels = ' | '.join(str(row[column]) for column in columns)
+        print(f"  {labels}: {row['average_score']} ({row['answers']} answers)")
+
+
+def print_report(path):
+    from utils.answer_analytics import AnswerDataset
+
+    started = time.time()
+    dataset = AnswerDataset(path)
+    loaded = time.time()
+    summary = dataset.summary()
+    by_domain = dataset.mean_score_by('domain', 'difficulty')
+    hardest = dataset.hardest_questions()
+    trends = dataset.category_trends()
+    finished = time.time()
+
+    print(f"📊 {summary['answers']} answers ({summary['answered']} answered) from {summary['users']} users, "
+          f"average score {summary['average_score']}")
+    print_rows('Average score by domain and difficulty', by_domain, ('domain', 'difficulty'))
+    print_rows('Hardest questions', hardest, ('category', 'question'))
+    print_rows('Category trends by month', trends, ('category', 'period'))
+    print(f"\n⏱️ Loaded in {loaded - started:.2f}s, queries took {finished - loaded:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export answer-level analytics from stored reports')
+    parser.add_argument('--local', action='store_true', help='Read the local SQLite store instead of Firestore')
+    parser.add_argument('--path', help='Dataset directory (default: ANALYTICS_EXPORT_PATH)')
+    parser.add_argument('--report', action='store_true', help='Print cohort statistics after exporting')
+    parser.add_argument('--report-only', action='store_true', help='Print cohort statistics without exporting')
+    args = parser.parse_args()
+
+    if not args.report_only:
+        from utils.answer_export import AnswerExporter
+
+        if args.local:
+            from utils.storage import StorageManager
+            storage_manager = StorageManager(check_legacy=False)
+        else:
+            from utils.firebase_storage import FirebaseStorageManager
+            storage_manager = FirebaseStorageManager()
+
+        exporter = AnswerExporter(args.path)
+        started = time.time()
+        result = exporter.export(storage_manager.iter_reports_since(exporter.watermark))
+        print(f"✅ Exported {result['rows']} answers from {result['reports']} reports "
+              f"in {time.time() - started:.1f}s (watermark: {result['watermark']})")
+
+    if args.report or args.report_only:
+        print_report(args.path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Local report store migration
+Imports the per-user {user_id}_reports.json files written by the old local
+StorageManager into its SQLite database (REPORTS_DB_PATH). Reports already
+in the database are skipped, so the migration can be run more than once.
+
+Usage:
+    python migrate_local_reports.py              # Import every JSON report file
+    python migrate_local_reports.py --archive    # Also rename imported files to *.migrated
+    python migrate_local_reports.py --dry-run    # Only list the files and report counts
+"""
+import argparse
+import json
+import os
+from utils.storage import StorageManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import JSON report files into the SQLite report store')
+    parser.add_argument('--archive', action='store_true', help='Rename each imported file to <name>.migrated')
+    parser.add_argument('--dry-run', action='store_true', help='Only count the reports in each file')
+    args = parser.parse_args()
+
+    storage_manager = StorageManager(check_legacy=False)
+    paths = storage_manager.legacy_report_files()
+    print(f"🔄 Found {len(paths)} report files in {storage_manager.reports_dir}")
+
+    total_read = total_added = 0
+    for path in paths:
+        try:
+            if args.dry_run:
+                with open(path, 'r') as f:
+                    print(f"📝 {os.path.basename(path)}: {len(json.load(f))} reports")
+                continue
+
+            read, added = storage_manager.import_report_file(path)
+            total_read += read
+            total_added += added
+            if args.archive:
+                os.replace(path, path + '.migrated')
+            print(f"✅ {os.path.basename(path)}: {added} of {read} reports imported")
+        except Exception as e:
+            print(f"❌ {os.path.basename(path)}: {e}")
+
+    if not args.dry_run:
+        print(f"📊 Imported {total_added} of {total_read} reports into {storage_manager.db_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""
+Leaderboard rebuild command
+Recomputes the top-K leaderboards (overall, per domain, per job role and per
+domain and job role; all time, per month and per week) from the stored
+reports. Boards are kept up to date as reports are saved and deleted; run
+this after changing LEADERBOARD_SIZE or importing reports by hand.
+
+Usage:
+    python rebuild_leaderboards.py           # Firestore leaderboards collection
+    python rebuild_leaderboards.py --local   # Local SQLite report store
+"""
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild leaderboards from reports')
+    parser.add_argument('--local', action='store_true', help='Rebuild the local SQLite store instead of Firestore')
+    args = parser.parse_args()
+
+    if args.local:
+        from utils.storage import StorageManager
+        storage_manager = StorageManager(check_legacy=False)
+    else:
+        from utils.firebase_storage import FirebaseStorageManager
+        storage_manager = FirebaseStorageManager()
+
+    count = storage_manager.rebuild_leaderboards()
+    print(f"✅ Rebuilt {count} leaderboards")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+User stats rebuild command
+Recomputes the aggregate per-user stats documents (user_stats collection)
+from the raw interview reports. Stats are kept up to date by save_report and
+delete_report; run this after importing or editing reports by hand.
+
+Usage:
+    python rebuild_user_stats.py --user <user_id>   # Rebuild one user
+    python rebuild_user_stats.py --all              # Rebuild every user with reports
+"""
+import argparse
+from utils.firebase_storage import FirebaseStorageManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild aggregate user stats from reports')
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--user', help='User id to rebuild')
+    group.add_argument('--all', action='store_true', help='Rebuild every user that has reports')
+    args = parser.parse_args()
+
+    storage_manager = FirebaseStorageManager()
+
+    if args.user:
+        user_ids = [args.user]
+    else:
+        user_ids = sorted({
+            doc.to_dict().get('user_id')
+            for doc in storage_manager.reports_collection.select(['user_id']).stream()
+        } - {None})
+
+    print(f"🔄 Rebuilding stats for {len(user_ids)} users")
+    for user_id in user_ids:
+        stats = storage_manager.rebuild_user_stats(user_id)
+        summary = stats.summary()
+        print(f"✅ {user_id}: {summary['total_interviews']} interviews, "
+              f"average {summary['average_score']}, best {summary['best_score']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -13,12 +13,28 @@ class InterviewManager {
         this.timer = null;
         this.autoSaveTimer = null;
         this.isNavigating = false; // Flag to track internal navigation
+        this.questionStream = null;
+        this.questionsStreaming = false; // True while questions are still being generated
+        // Answer sync: edits are queued per question and sent in batches to /sync_answers
+        this.answerVersions = {}; // Latest local version per question
+        this.ackedAnswers = {}; // {version, text} the server has confirmed per question
+        this.syncQueue = {}; // Newest unsent {version, text} per question
+        this.syncTimer = null;
+        this.syncInFlight = null;
+        this.syncInterval = 30000; // Backstop while typing; leaving a question sends its answer at once
+        this.syncedPosition = null; // Position the server last acknowledged
+        this.baseSyncRetryDelay = 1000; // Failed syncs retry with jittered exponential backoff
+        this.maxSyncRetryDelay = 60000;
+        this.syncRetryDelay = this.baseSyncRetryDelay;
+        this.syncStats = {requests: 0, bytes: 0};
     }
     
     init(config) {
         this.totalQuestions = config.totalQuestions || 0;
         this.currentQuestion = config.currentQuestion || 0;
         this.questions = config.questions || [];
+        this.manifest = config.manifest || null; // Signed question count, sent back with autosaves
+        this.answerVersions = Object.assign({}, config.answerVersions || {});
         
         // Check if this is a new interview by comparing question count or first question text
         const isNewInterview = this.isNewInterview(config);
@@ -51,15 +67,55 @@ class InterviewManager {
         
         if (!isNewInterview) {
             this.loadSavedAnswers();
+            this.restoreSyncQueue();
         }
         
         this.displayCurrentAnswer(); // Fix: Display saved answer for first question
         this.updateStats();
         this.setupAutoSave();
         
+        if (config.streamUrl) {
+            this.startQuestionStream(config.streamUrl);
+        }
+        
         console.log('Interview Manager initialized', config, 'New interview:', isNewInterview);
     }
     
+    startQuestionStream(url) {
+        // Receive questions over Server-Sent Events as the server generates them
+        this.questionsStreaming = true;
+        this.questionStream = new EventSource(url);
+        
+        this.questionStream.addEventListener('question', (e) => {
+            const data = JSON.parse(e.data);
+            const isNewCurrent = !this.questions[data.index] && data.index === this.currentQuestion;
+            this.questions[data.index] = data.question;
+            
+            if (isNewCurrent) {
+                this.updateQuestionDisplay();
+                this.questionStartTime = Date.now();
+            }
+            this.updateQuestionGrid();
+        });
+        
+        this.questionStream.addEventListener('done', (e) => {
+            const data = JSON.parse(e.data);
+            this.questionsStreaming = false;
+            this.questionStream.close();
+            
+            if (data.total !== this.totalQuestions) {
+                // Fewer questions were generated than requested
+                this.totalQuestions = data.total;
+                document.querySelectorAll('.question-nav-btn').forEach((btn, index) => {
+                    if (index >= data.total) {
+                        btn.remove();
+                    }
+                });
+                this.updateStats();
+            }
+        });
+    }
+    
     isNewInterview(config) {
         // Check if this is a new interview vs resuming existing one
         const lastInterviewId = localStorage.getItem('current_interview_id');
@@ -78,6 +134,9 @@ class InterviewManager {
         localStorage.removeItem('interview_start_time');
         localStorage.removeItem('current_interview_id');
         localStorage.removeItem('first_question_text');
+        localStorage.removeItem('answer_sync_queue');
+        this.syncQueue = {};
+        this.ackedAnswers = {};
         
         // Store current interview identifiers
         const currentInterviewId = Date.now().toString(); // Simple unique ID
@@ -150,6 +209,27 @@ class InterviewManager {
             }
         };
         window.addEventListener('beforeunload', this.beforeUnloadHandler);
+        
+        // Send queued answers as soon as the connection is back
+        window.addEventListener('online', () => this.flushAnswers());
+        
+        // Last chance for unsent answers when the page goes away (they are also kept in localStorage)
+        window.addEventListener('pagehide', () => {
+            const changes = this.buildChanges();
+            if (changes.length > 0 && navigator.sendBeacon) {
+                navigator.sendBeacon('/sync_answers', new Blob([this.syncPayload(changes)], {type: 'application/json'}));
+            }
+        });
+        
+        // Browser back/forward between questions
+        window.addEventListener('popstate', (e) => {
+            const questionIndex = e.state ? e.state.questionIndex : 0;
+            if (questionIndex !== this.currentQuestion && questionIndex < this.totalQuestions) {
+                this.saveCurrentAnswer(true);
+                this.recordQuestionTime();
+                this.navigateToQuestion(questionIndex, false);
+            }
+        });
     }
 
     bindDynamicInputs(){
@@ -293,9 +373,8 @@ class InterviewManager {
             // Save locally as backup
             InterviewBuddy.saveToLocalStorage('interview_answers', this.answers);
 
-            if (!silent) {
-                this.submitAnswer(this.currentQuestion, answer);
-            }
+            // Queue changed answers; the next batch sends them so the server can start evaluating them
+            this.queueAnswer(this.currentQuestion, answer);
             
             // Update save status
             this.showSaveStatus('saved');
@@ -331,34 +410,195 @@ class InterviewManager {
         }
     }
     
-    async submitAnswer(questionIndex, answer) {
-        this.showSaveStatus('saving');
+    queueAnswer(questionIndex, answer) {
+        const queued = this.syncQueue[questionIndex];
+        const acked = this.ackedAnswers[questionIndex];
+        if ((queued && queued.text === answer) || (!queued && acked && acked.text === answer)) {
+            return;
+        }
         
+        // Only the newest edit per question is kept; the server ignores versions older than its own
+        const version = (this.answerVersions[questionIndex] || 0) + 1;
+        this.answerVersions[questionIndex] = version;
+        this.syncQueue[questionIndex] = {version, text: answer};
+        this.persistSyncQueue();
+        this.scheduleSync(this.syncInterval);
+    }
+    
+    persistSyncQueue() {
+        // Unsent edits survive reloads and going offline
+        InterviewBuddy.saveToLocalStorage('answer_sync_queue', this.syncQueue);
+    }
+    
+    restoreSyncQueue() {
+        this.syncQueue = InterviewBuddy.loadFromLocalStorage('answer_sync_queue', {});
+        Object.entries(this.syncQueue).forEach(([index, entry]) => {
+            this.answerVersions[index] = Math.max(this.answerVersions[index] || 0, entry.version);
+        });
+        if (Object.keys(this.syncQueue).length > 0) {
+            this.scheduleSync(0);
+        }
+    }
+    
+    scheduleSync(delay) {
+        if (this.syncTimer) return; // The scheduled batch will include this edit
+        this.syncTimer = setTimeout(() => {
+            this.syncTimer = null;
+            this.flushAnswers();
+        }, delay);
+    }
+    
+    diffText(oldText, newText) {
+        // One [start, deleteCount, insert] splice between the common prefix and suffix, in code points
+        const oldChars = Array.from(oldText);
+        const newChars = Array.from(newText);
+        const shorter = Math.min(oldChars.length, newChars.length);
+        let start = 0;
+        while (start < shorter && oldChars[start] === newChars[start]) {
+            start++;
+        }
+        let end = 0;
+        while (end < shorter - start &&
+               oldChars[oldChars.length - 1 - end] === newChars[newChars.length - 1 - end]) {
+            end++;
+        }
+        return [start, oldChars.length - start - end, newChars.slice(start, newChars.length - end).join('')];
+    }
+    
+    buildChanges() {
+        return Object.entries(this.syncQueue).map(([index, entry]) => {
+            const change = {index: parseInt(index), version: entry.version};
+            const acked = this.ackedAnswers[index];
+            const diff = acked ? this.diffText(acked.text, entry.text) : null;
+            if (diff && JSON.stringify(diff).length < JSON.stringify(entry.text).length) {
+                change.base = acked.version;
+                change.diff = diff;
+            } else {
+                change.text = entry.text;
+            }
+            return {change, text: entry.text};
+        });
+    }
+    
+    syncPayload(changes) {
+        const payload = {changes: changes.map(item => item.change)};
+        if (this.currentQuestion !== this.syncedPosition) {
+            // The position (and the manifest that vouches for it) only travels when it changed
+            payload.current_question = this.currentQuestion;
+            payload.manifest = this.manifest;
+        }
+        return JSON.stringify(payload);
+    }
+    
+    async flushAnswers() {
+        if (this.syncTimer) {
+            clearTimeout(this.syncTimer);
+            this.syncTimer = null;
+        }
+        while (this.syncInFlight) {
+            await this.syncInFlight;
+        }
+        if (Object.keys(this.syncQueue).length === 0) {
+            return true;
+        }
+        
+        this.syncInFlight = this.sendChanges(this.buildChanges());
         try {
-            const response = await fetch('/submit_answer', {
+            return await this.syncInFlight;
+        } finally {
+            this.syncInFlight = null;
+        }
+    }
+    
+    async sendChanges(changes) {
+        const body = this.syncPayload(changes);
+        const position = this.currentQuestion;
+        this.syncStats.requests += 1;
+        this.syncStats.bytes += body.length;
+        
+        try {
+            const response = await fetch('/sync_answers', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
                 },
-                body: JSON.stringify({
-                    question_index: questionIndex,
-                    answer: answer
-                })
+                body
             });
             
+            if (response.status === 400) {
+                // The interview is gone on the server; retrying cannot help
+                console.error('Answer sync rejected: no active interview');
+                this.syncQueue = {};
+                this.persistSyncQueue();
+                return false;
+            }
+            
             const result = await response.json();
+            if (!response.ok || !result.success) {
+                throw new Error(result.error || `HTTP ${response.status}`);
+            }
             
-            if (result.success) {
-                this.showSaveStatus('saved');
-            } else {
-                this.showSaveStatus('error');
+            this.acknowledge(changes, result);
+            this.syncedPosition = position;
+            this.syncRetryDelay = this.baseSyncRetryDelay;
+            if (result.conflicts.length > 0) {
+                // Conflicting diffs are resent as full text
+                this.scheduleSync(0);
             }
+            this.showSaveStatus('saved');
+            return true;
         } catch (error) {
-            console.error('Error saving answer:', error);
+            // Offline or server error: keep the queue and retry with backoff
+            console.error('Answer sync failed, retrying:', error);
             this.showSaveStatus('error');
+            if (this.syncTimer) {
+                // The retry comes before the periodic backstop an edit may have scheduled
+                clearTimeout(this.syncTimer);
+                this.syncTimer = null;
+            }
+            // Half to all of the delay, so clients don't retry in lockstep after an outage
+            this.scheduleSync(this.syncRetryDelay * (0.5 + Math.random() / 2));
+            this.syncRetryDelay = Math.min(this.syncRetryDelay * 2, this.maxSyncRetryDelay);
+            return false;
         }
     }
     
+    acknowledge(changes, result) {
+        changes.forEach(({change, text}) => {
+            const index = String(change.index);
+            const serverVersion = result.versions[index];
+            const queued = this.syncQueue[index];
+            
+            if (result.conflicts.includes(change.index)) {
+                delete this.ackedAnswers[index];
+                return;
+            }
+            if (serverVersion === change.version) {
+                this.ackedAnswers[index] = {version: change.version, text};
+            } else {
+                // Invalid index, or a newer edit from another tab won: stop diffing against our copy
+                delete this.ackedAnswers[index];
+                if (serverVersion) {
+                    this.answerVersions[index] = Math.max(this.answerVersions[index] || 0, serverVersion);
+                }
+            }
+            if (queued && queued.version <= change.version) {
+                delete this.syncQueue[index];
+            }
+        });
+        this.persistSyncQueue();
+    }
+    
+    async syncAllAnswers() {
+        // A conflict needs one more round trip to resend the full text
+        for (let attempt = 0; attempt < 3 && Object.keys(this.syncQueue).length > 0; attempt++) {
+            if (!await this.flushAnswers()) {
+                return false;
+            }
+        }
+        return Object.keys(this.syncQueue).length === 0;
+    }
+    
     nextQuestion() {
         if (this.currentQuestion < this.totalQuestions - 1) {
             // Save current answer before navigating
@@ -386,48 +626,31 @@ class InterviewManager {
         }
     }
     
-    async navigateToQuestion(questionIndex) {
-        // Set navigation flag to prevent beforeunload warning
-        this.isNavigating = true;
+    navigateToQuestion(questionIndex, updateHistory = true) {
+        if (!this.questions[questionIndex]) {
+            InterviewBuddy.showAlert('This question is still being generated. Please wait a moment.', 'info', 3000);
+            return;
+        }
         
-        try {            
-            // Update server with new current question
-            const response = await fetch('/update_current_question', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({
-                    current_question: questionIndex
-                })
-            });
-            
-            if (response.ok) {
-                // Update current question locally
-                this.currentQuestion = questionIndex;
-                this.questionStartTime = Date.now();
-                
-                // Update the URL without page reload
-                const newUrl = `${window.location.pathname}?q=${questionIndex}`;
-                window.history.pushState({questionIndex}, '', newUrl);
-                
-                // Update the UI to show new question
-                this.updateQuestionDisplay();
-                this.updateNavigationButtons();
-                this.updateStats();
-                this.loadCurrentAnswer();
-                
-            } else {
-                console.error('Failed to update current question on server');
-                InterviewBuddy.showAlert('Failed to navigate to question', 'error');
-            }
-        } catch (error) {
-            console.error('Navigation error:', error);
-            InterviewBuddy.showAlert('Navigation error occurred', 'error');
-        } finally {
-            // Reset navigation flag
-            this.isNavigating = false;
+        // Navigation stays in the page; the position reaches the server with the next answer sync
+        if (Object.keys(this.syncQueue).length > 0) {
+            // The answer just left is likely final, so the server can start evaluating it
+            this.flushAnswers();
+        }
+        this.currentQuestion = questionIndex;
+        this.questionStartTime = Date.now();
+        
+        if (updateHistory) {
+            // Keeps the position across reloads
+            const newUrl = `${window.location.pathname}?q=${questionIndex}`;
+            window.history.pushState({questionIndex}, '', newUrl);
         }
+        
+        // Update the UI to show new question
+        this.updateQuestionDisplay();
+        this.updateNavigationButtons();
+        this.updateStats();
+        this.loadCurrentAnswer();
     }
     
 
@@ -629,6 +852,10 @@ renderTextarea() {
             if (index === this.currentQuestion) {
                 btn.classList.add('btn-primary');
                 btn.disabled = true;
+            } else if (!this.questions[index]) {
+                // Not generated yet
+                btn.classList.add('btn-outline-secondary');
+                btn.disabled = true;
             } else if (this.answers[index]) {
                 btn.classList.add('btn-success');
                 btn.disabled = false;
@@ -657,6 +884,11 @@ renderTextarea() {
     }
     
     async submitInterview() {
+        if (this.questionsStreaming) {
+            InterviewBuddy.showAlert('Please wait until all questions have been generated.', 'info', 3000);
+            return;
+        }
+        
         // Save the current answer before submitting
         this.saveCurrentAnswer(true);
         
@@ -666,6 +898,11 @@ renderTextarea() {
         }
         
         try {
+            // Make sure every answer has reached the server before it evaluates them
+            if (!await this.syncAllAnswers()) {
+                throw new Error('Answers could not be saved');
+            }
+            
             const response = await fetch('/complete_interview', {
                 method: 'POST',
                 headers: {
@@ -675,9 +912,15 @@ renderTextarea() {
             
             const result = await response.json();
             
+            if (result.success && result.job_id) {
+                // Evaluation runs in the background; wait for the job to finish
+                await this.waitForJob(result.status_url, submitBtn);
+            }
+            
             if (result.success) {
                 // Clear local storage and timer state
                 InterviewBuddy.removeFromLocalStorage('interview_answers');
+                InterviewBuddy.removeFromLocalStorage('answer_sync_queue');
                 localStorage.removeItem('interview_start_time');
                 
                 // Clear timer
@@ -706,16 +949,48 @@ renderTextarea() {
         }
     }
     
+    async waitForJob(statusUrl, submitBtn) {
+        while (true) {
+            const response = await fetch(statusUrl);
+            const job = await response.json();
+            
+            if (!job.success || job.status === 'failed' || job.status === 'dead') {
+                throw new Error(job.error || 'Evaluation failed');
+            }
+            if (job.status === 'completed') {
+                return job;
+            }
+            
+            const progress = job.progress;
+            if (submitBtn && progress) {
+                const label = progress.stage === 'saving'
+                    ? 'Saving report...'
+                    : `Evaluating ${progress.completed}/${progress.total}...`;
+                submitBtn.innerHTML = `<span class="loading-spinner me-2"></span>${label}`;
+            }
+            
+            await new Promise(resolve => setTimeout(resolve, 1000));
+        }
+    }
+    
     // Cleanup method
     destroy() {
         if (this.timer) {
             clearInterval(this.timer);
         }
         
+        if (this.questionStream) {
+            this.questionStream.close();
+        }
+        
         if (this.autoSaveTimer) {
             clearTimeout(this.autoSaveTimer);
         }
         
+        if (this.syncTimer) {
+            clearTimeout(this.syncTimer);
+        }
+        
         // Remove event listeners
         window.removeEventListener('beforeunload', this.beforeUnloadHandler);
     }
@@ -0,0 +1,38 @@
+"""
+Expired session sweep
+Deletes interview sessions older than SESSION_MAX_AGE from Firestore in
+batched pages, expired login sessions from the SQLite session store and old
+question files and Flask-Session files from SESSION_FILE_DIR. The app runs
+the same sweep every SESSION_SWEEP_INTERVAL.
+
+Usage:
+    python sweep_sessions.py             # Sweep once
+    python sweep_sessions.py --dry-run   # Only count what would be removed
+"""
+import argparse
+from config import Config
+from utils.firebase_storage import FirebaseStorageManager
+from utils.session_sweeper import SessionSweeper
+from utils.session_store import ServerSessionInterface, SQLiteSessionStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remove expired interview sessions and session files')
+    parser.add_argument('--dry-run', action='store_true', help='Count expired sessions and files without removing them')
+    args = parser.parse_args()
+
+    # Redis expires sessions itself
+    session_store = ServerSessionInterface(SQLiteSessionStore()) if Config.SESSION_BACKEND == 'sqlite' else None
+    sweeper = SessionSweeper(FirebaseStorageManager(), session_store=session_store)
+    summary = sweeper.run_once(dry_run=args.dry_run)
+
+    verb = 'Would remove' if args.dry_run else 'Removed'
+    print(f"🧹 {verb} {summary['sessions_deleted']} sessions ({summary['session_pages']} pages), "
+          f"{summary['server_sessions_deleted']} login sessions, "
+          f"{summary['question_files_deleted']} question files and {summary['session_files_deleted']} session files, "
+          f"{summary['bytes_freed'] / 1024:.1f} KB")
+    print(f"📊 {summary['duration']:.2f}s, {summary['items_per_second']} items/s, {summary['failures']} failures")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,32 @@
-import google.generativeai as genai
 import json
 import re
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
+from utils.evaluation_cache import EvaluationCache
+from utils.model_client import ModelClient
+from utils.question_pool import QuestionPool
+from utils.question_stream import QuestionStreamParser
 
 class AIHelper:
-    def __init__(self):
-        genai.configure(api_key=Config.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+    # Estimated response tokens reserved per answer in a batch evaluation
+    BATCH_RESPONSE_TOKENS_PER_ITEM = 300
+    # Bump whenever the evaluation prompts change so cached evaluations are not reused
+    EVALUATION_PROMPT_VERSION = 1
+    
+    def __init__(self, model=None, evaluation_cache=None, question_store=None, question_bank=None):
+        # All model calls go through a client with deadlines, retries and a circuit breaker;
+        # AIHelpers without an explicit model share one client (and rate limit) per process
+        self.model_client = ModelClient(model) if model is not None else ModelClient.shared()
+        self.model = self.model_client.model
+        self.evaluation_cache = evaluation_cache or EvaluationCache.from_config()
+        # Generated questions are pooled in question_store (e.g. FirebaseStorageManager) when given
+        self.question_pool = None
+        if question_store is not None and Config.QUESTION_POOL_ENABLED:
+            self.question_pool = QuestionPool(question_store, self._generate_questions_from_model)
+        # Pre-generated questions (see warm_question_bank.py) are served first when a bank is given
+        self.question_bank = question_bank
         self.behavioral_questions = self._get_behavioral_questions()
     
     def _get_behavioral_questions(self):
@@ -87,31 +106,117 @@ class AIHelper:
     
     def generate_questions(self, setup_data):
         """Generate interview questions based on setup"""
-        job_role = setup_data['job_role']
-        domain = setup_data['domain']
         interview_type = setup_data['interview_type']
         question_count = setup_data['question_count']
-        question_type = setup_data['question_type']
-        difficulty = setup_data.get('difficulty', 'Medium')
         
         # For behavioral interviews, force short answer type and use predefined questions
         if interview_type.lower() == 'behavioral':
             setup_data['question_type'] = 'Short Answer'  # Force short answer for behavioral
             return self._get_behavioral_interview_questions(setup_data)
         
-        prompt = self._build_question_prompt(
-            job_role, domain, interview_type, question_count, 
-            question_type, difficulty
-        )
+        banked_questions = self._get_banked_questions(setup_data)
+        if banked_questions:
+            return banked_questions
         
         try:
-            response = self.model.generate_content(prompt)
-            questions = self._parse_questions_response(response.text, question_type)
+            if self.question_pool:
+                return self.question_pool.get_questions(setup_data)
+            questions = self._generate_questions_from_model(setup_data, question_count)
             return questions[:question_count]  # Ensure exact count
         except Exception as e:
             # Fallback to sample questions if AI fails
             return self._get_fallback_questions(setup_data)
     
+    def stream_questions(self, setup_data):
+        """Yield interview questions one at a time as soon as each is available"""
+        interview_type = setup_data['interview_type']
+        question_count = setup_data['question_count']
+        
+        if interview_type.lower() == 'behavioral':
+            setup_data['question_type'] = 'Short Answer'  # Force short answer for behavioral
+            yield from self._get_behavioral_interview_questions(setup_data)
+            return
+        
+        banked_questions = self._get_banked_questions(setup_data)
+        if banked_questions:
+            yield from banked_questions
+            return
+        
+        if self.question_pool:
+            pooled_questions = self.question_pool.sample(setup_data)
+            if pooled_questions:
+                yield from pooled_questions
+                return
+        
+        streamed = []
+        try:
+            for question in self._stream_questions_from_model(setup_data, question_count):
+                streamed.append(question)
+                yield question
+                if len(streamed) >= question_count:
+                    break
+        except Exception as e:
+            print(f"⚠️ Question streaming failed after {len(streamed)} questions: {e}")
+        
+        if self.question_pool:
+            self.question_pool.store_generated(setup_data, streamed)
+        
+        if not streamed:
+            # Fallback to sample questions if AI fails
+            yield from self._get_fallback_questions(setup_data)[:question_count]
+    
+    def _stream_questions_from_model(self, setup_data, question_count):
+        """Stream the model response and yield each question object once it is complete"""
+        question_type = setup_data['question_type']
+        prompt = self._build_question_prompt(
+            setup_data['job_role'], setup_data['domain'], setup_data['interview_type'],
+            question_count, question_type, setup_data.get('difficulty', 'Medium')
+        )
+        
+        parser = QuestionStreamParser()
+        yielded = False
+        for chunk in self.model_client.generate_content(prompt, stream=True):
+            for question in parser.feed(chunk.text):
+                if self._validate_question(question):
+                    yielded = True
+                    yield question
+        
+        if not yielded:
+            # The model did not answer with a JSON array; parse the full text the usual way
+            yield from self._parse_questions_response(parser.text, question_type)
+    
+    def _get_banked_questions(self, setup_data):
+        """Serve pre-generated questions from the question bank, recording demand"""
+        if not self.question_bank:
+            return None
+        try:
+            self.question_bank.record_demand(setup_data)
+            return self.question_bank.sample(setup_data, setup_data['question_count'])
+        except Exception as e:
+            print(f"⚠️ Question bank lookup failed: {e}")
+            return None
+    
+    def _generate_questions_from_model(self, setup_data, question_count):
+        """Ask the model for question_count questions, raising if the call fails"""
+        question_type = setup_data['question_type']
+        prompt = self._build_question_prompt(
+            setup_data['job_role'], setup_data['domain'], setup_data['interview_type'],
+            question_count, question_type, setup_data.get('difficulty', 'Medium')
+        )
+        
+        response = self.model_client.generate_content(prompt)
+        return self._parse_questions_response(response.text, question_type)
+    
+    def generate_bank_questions(self, setup_data, question_count):
+        """Generate questions for the question bank, keeping only well-formed ones"""
+        questions = [
+            q for q in self._generate_questions_from_model(setup_data, question_count)
+            if self._validate_question(q)
+        ]
+        if not questions:
+            raise ValueError('Model returned no valid questions')
+        return questions
+    
     def _build_question_prompt(self, job_role, domain, interview_type, 
                               question_count, question_type, difficulty):
         """Build prompt for question generation"""
@@ -293,6 +398,7 @@ Generate the questions now:
     
     def _get_fallback_questions(self, setup_data):
         """Provide fallback questions if AI generation fails"""
+        self.model_client.record_fallback('questions')
         interview_type = setup_data.get('interview_type', '').lower()
         
         # Use behavioral questions for behavioral interviews
@@ -338,8 +444,14 @@ Generate the questions now:
         questions = fallback_questions.get(job_role, fallback_questions['Software Engineer'])
         return questions * (setup_data['question_count'] // len(questions) + 1)
     
-    def evaluate_answers(self, questions, user_answers, setup_data):
-        """Evaluate user answers using AI"""
+    def evaluate_answers(self, questions, user_answers, setup_data, precomputed=None, progress=None):
+        """Evaluate user answers using AI
+        
+        ``precomputed`` maps question indexes (as strings, like ``user_answers``)
+        to results already evaluated for the current answers; only the
+        remaining questions are evaluated here. ``progress(completed, total)``
+        is called as each question finishes.
+        """
         print(f"🔍 Evaluating {len(questions)} questions")
         print(f"📝 Received answers for questions: {list(user_answers.keys())}")
         
@@ -357,28 +469,9 @@ Generate the questions now:
         category_scores = {}
         all_resources = []
         
-        for i, question in enumerate(questions):
-            answer_key = str(i)
-            answer = user_answers.get(answer_key, '')
-            
-            # Only evaluate if the user actually provided an answer (not just empty string)
-            if answer_key in user_answers and answer.strip():
-                print(f"✅ Evaluating question {i}")
-                question_result = self._evaluate_single_question(
-                    question, answer, setup_data
-                )
-            else:
-                print(f"⚠️ Skipping question {i} - no answer provided")
-                # Create a default result for unanswered questions
-                question_result = {
-                    'score': 0,
-                    'evaluation': 'No answer provided',
-                    'strengths': [],
-                    'weaknesses': ['Question not answered'],
-                    'recommendations': ['Consider attempting all questions in the future'],
-                    'suggested_resources': []
-                }
-            
+        question_results = self._evaluate_questions(questions, user_answers, setup_data, precomputed, progress)
+        
+        for question, question_result in zip(questions, question_results):
             results['questions_results'].append(question_result)
             total_score += question_result['score']
             
@@ -411,25 +504,263 @@ Generate the questions now:
         
         return results
     
-    def _evaluate_single_question(self, question, user_answer, setup_data):
-        """Evaluate a single question with detailed analysis"""
-        print(f"🔍 Evaluating question: '{question['text'][:50]}...'")
-        print(f"📝 User answer: '{user_answer}' (type: {type(user_answer)}, length: {len(str(user_answer))})")
+    def _evaluate_questions(self, questions, user_answers, setup_data, precomputed=None, progress=None):
+        """Evaluate every question, in parallel when more than one worker is configured.
         
-        result = {
-            'question': question['text'],
-            'user_answer': user_answer,
-            'correct_answer': question.get('correct_answer', ''),
+        Results are returned in the same order as ``questions``.
+        """
+        max_workers = max(1, Config.EVALUATION_MAX_WORKERS)
+        precomputed = precomputed or {}
+        completed = [0]
+        progress_lock = threading.Lock()
+        
+        # Short answers evaluated in batch mode; anything missing falls back to per-question calls
+        batched_results = {}
+        cache_checked = set()
+        if Config.BATCH_EVALUATION_ENABLED:
+            batched_results = self._evaluate_short_answers_batched(
+                questions, user_answers, setup_data, max_workers, skip=precomputed, cache_checked=cache_checked
+            )
+        
+        def evaluate(item):
+            index, question = item
+            if str(index) in precomputed:
+                result = precomputed[str(index)]
+            elif index in batched_results:
+                result = batched_results[index]
+            else:
+                # Answers the batch pre-filter already missed in the cache are not looked up (and counted) again
+                result = self._evaluate_question_at(
+                    index, question, user_answers, setup_data, lookup_cache=index not in cache_checked
+                )
+            
+            if progress:
+                with progress_lock:
+                    completed[0] += 1
+                    progress(completed[0], len(questions))
+            return result
+        
+        if max_workers == 1 or len(questions) <= 1:
+            return [evaluate(item) for item in enumerate(questions)]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(questions))) as executor:
+            return list(executor.map(evaluate, enumerate(questions)))
+    
+    def _evaluate_short_answers_batched(self, questions, user_answers, setup_data, max_workers=1, skip=(),
+                                        cache_checked=None):
+        """Evaluate short answers with one model call per batch.
+        
+        Returns a dict of question index -> result for every item found in
+        the evaluation cache or evaluated and parsed successfully. Indexes in
+        ``skip`` are left out. Indexes looked up in the evaluation cache are
+        added to ``cache_checked``.
+        """
+        items = []
+        cached = {}
+        for i, question in enumerate(questions):
+            if str(i) in skip:
+                continue
+            answer = user_answers.get(str(i), '')
+            # Empty and very short answers are scored locally without a model call
+            if question.get('type') != 'mcq' and answer and len(answer.strip()) >= 3:
+                # Cache hits are returned as results, so the per-question path does not look them up again
+                evaluation = self._get_cached_evaluation(question, answer, setup_data)
+                if cache_checked is not None:
+                    cache_checked.add(i)
+                if evaluation is None:
+                    items.append((i, question, answer))
+                else:
+                    cached[i] = self._build_question_result(question, answer)
+                    cached[i].update(evaluation)
+        
+        if not items:
+            return cached
+        
+        batches = self._split_evaluation_batches(items, Config.BATCH_EVALUATION_TOKEN_BUDGET)
+        print(f"📦 Batch evaluating {len(items)} short answers in {len(batches)} call(s)")
+        
+        evaluated = dict(cached)
+        if max_workers == 1 or len(batches) == 1:
+            batch_results = [self._evaluate_batch(batch, setup_data) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                batch_results = list(executor.map(
+                    lambda batch: self._evaluate_batch(batch, setup_data), batches
+                ))
+        
+        for batch_result in batch_results:
+            evaluated.update(batch_result)
+        
+        print(f"✅ Batch evaluation parsed {len(evaluated) - len(cached)}/{len(items)} answers")
+        return evaluated
+    
+    def _split_evaluation_batches(self, items, token_budget):
+        """Split (index, question, answer) items into batches that fit the token budget"""
+        batches = []
+        current = []
+        current_tokens = 0
+        
+        for item in items:
+            _, question, answer = item
+            # Rough estimate: ~4 characters per token plus room for the response
+            item_tokens = (len(question['text']) + len(answer)) // 4 + self.BATCH_RESPONSE_TOKENS_PER_ITEM
+            if current and current_tokens + item_tokens > token_budget:
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(item)
+            current_tokens += item_tokens
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def _evaluate_batch(self, batch, setup_data):
+        """Evaluate a batch of short answers with a single model call"""
+        prompt = self._build_batch_evaluation_prompt(batch, setup_data)
+        
+        try:
+            response = self.model_client.generate_content(prompt)
+            evaluations = self._parse_batch_evaluation(response.text)
+        except Exception as e:
+            print(f"⚠️ Batch evaluation failed, falling back to per-question evaluation: {e}")
+            self.model_client.record_fallback('batch_evaluation')
+            return {}
+        
+        results = {}
+        for index, question, answer in batch:
+            evaluation = evaluations.get(index)
+            if evaluation is None:
+                continue
+            self._store_cached_evaluation(question, answer, setup_data, evaluation)
+            result = self._build_question_result(question, answer)
+            result.update(evaluation)
+            results[index] = result
+        
+        return results
+    
+    def _build_batch_evaluation_prompt(self, batch, setup_data):
+        """Build a single prompt that evaluates several short answers"""
+        interview_type = setup_data.get('interview_type', '').lower()
+        
+        if interview_type == 'behavioral':
+            criteria = """- clarity: How clearly is the answer communicated and structured?
+- correctness: Does the answer address the question and demonstrate the behavioral competency?
+- completeness: Does it follow the STAR method (Situation, Task, Action, Result) and show reflection?"""
+        else:
+            criteria = """- clarity: How clearly is the technical concept explained?
+- correctness: How technically accurate is the answer?
+- completeness: Are all aspects addressed with examples and sufficient depth?"""
+        
+        answers_json = json.dumps([
+            {
+                'id': index,
+                'question': question['text'],
+                'category': question.get('category', 'General'),
+                'answer': answer
+            }
+            for index, question, answer in batch
+        ], indent=2)
+        
+        return f"""
+Evaluate these {interview_type or 'interview'} interview answers for a {setup_data['job_role']} position.
+Domain: {setup_data.get('domain', '')}
+
+Score each answer from 0 to 10 on:
+{criteria}
+
+Answers:
+{answers_json}
+
+Respond ONLY with a JSON array containing one object per answer:
+[
+  {{
+    "id": <id of the answer>,
+    "clarity_score": <0-10>,
+    "clarity_feedback": "<feedback>",
+    "correctness_score": <0-10>,
+    "correctness_feedback": "<feedback>",
+    "completeness_score": <0-10>,
+    "completeness_feedback": "<feedback>",
+    "overall_score": <0-10>,
+    "overall_feedback": "<summary feedback>",
+    "suggested_resources": ["<3-4 specific learning resources>"]
+  }}
+]
+        """
+    
+    def _parse_batch_evaluation(self, response_text):
+        """Parse a batch evaluation response into a dict of id -> evaluation.
+        
+        Items that are missing or malformed are left out so the caller can
+        fall back to per-question evaluation for them.
+        """
+        json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
+        if not json_match:
+            return {}
+        
+        try:
+            items = json.loads(json_match.group(0))
+        except ValueError:
+            return {}
+        
+        evaluations = {}
+        for item in items:
+            try:
+                index = int(item['id'])
+                clarity_score = int(item['clarity_score'])
+                correctness_score = int(item['correctness_score'])
+                completeness_score = int(item['completeness_score'])
+                overall_score = int(item['overall_score'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            
+            resources = item.get('suggested_resources') or []
+            if isinstance(resources, str):
+                resources = resources.split(',')
+            suggested_resources = [str(r).strip() for r in resources if str(r).strip() and len(str(r).strip()) > 10]
+            
+            evaluations[index] = {
+                'score': min(overall_score, Config.SHORT_ANSWER_MAX_SCORE),
+                'feedback': str(item.get('overall_feedback', '')).strip(),
+                'detailed_analysis': {
+                    'clarity': {'score': clarity_score, 'feedback': str(item.get('clarity_feedback', '')).strip()},
+                    'correctness': {'score': correctness_score, 'feedback': str(item.get('correctness_feedback', '')).strip()},
+                    'completeness': {'score': completeness_score, 'feedback': str(item.get('completeness_feedback', '')).strip()}
+                },
+                'suggested_resources': suggested_resources[:4]  # Limit to 4 resources
+            }
+        
+        return evaluations
+    
+    def _evaluate_question_at(self, index, question, user_answers, setup_data, lookup_cache=True):
+        """Evaluate the answer for question ``index`` or build an unanswered result"""
+        answer_key = str(index)
+        answer = user_answers.get(answer_key, '')
+        
+        # Only evaluate if the user actually provided an answer (not just empty string)
+        if answer_key in user_answers and answer.strip():
+            print(f"✅ Evaluating question {index}")
+            return self._evaluate_single_question(question, answer, setup_data, lookup_cache=lookup_cache)
+        
+        print(f"⚠️ Skipping question {index} - no answer provided")
+        # Create a default result for unanswered questions
+        return {
             'score': 0,
-            'feedback': '',
-            'category': question.get('category', 'General'),
-            'detailed_analysis': {
-                'clarity': {'score': 0, 'feedback': ''},
-                'correctness': {'score': 0, 'feedback': ''},
-                'completeness': {'score': 0, 'feedback': ''}
-            },
+            'evaluation': 'No answer provided',
+            'strengths': [],
+            'weaknesses': ['Question not answered'],
+            'recommendations': ['Consider attempting all questions in the future'],
             'suggested_resources': []
         }
+    
+    def _evaluate_single_question(self, question, user_answer, setup_data, lookup_cache=True):
+        """Evaluate a single question with detailed analysis"""
+        print(f"🔍 Evaluating question: '{question['text'][:50]}...'")
+        print(f"📝 User answer: '{user_answer}' (type: {type(user_answer)}, length: {len(str(user_answer))})")
+        
+        result = self._build_question_result(question, user_answer)
         
         if question['type'] == 'mcq':
             correct_answer = question.get('correct_answer', '')
@@ -455,14 +786,31 @@ Generate the questions now:
             # Use AI to evaluate short answers with detailed analysis
             print(f"🤖 Evaluating short answer with AI...")
             evaluation_result = self._evaluate_short_answer_detailed(
-                question, user_answer, setup_data
+                question, user_answer, setup_data, lookup_cache=lookup_cache
             )
             result.update(evaluation_result)
             print(f"✅ AI evaluation result: score={result.get('score', 0)}")
         
         return result
     
-    def _evaluate_short_answer_detailed(self, question, user_answer, setup_data):
+    def _build_question_result(self, question, user_answer):
+        """Build the empty result structure for an evaluated question"""
+        return {
+            'question': question['text'],
+            'user_answer': user_answer,
+            'correct_answer': question.get('correct_answer', ''),
+            'score': 0,
+            'feedback': '',
+            'category': question.get('category', 'General'),
+            'detailed_analysis': {
+                'clarity': {'score': 0, 'feedback': ''},
+                'correctness': {'score': 0, 'feedback': ''},
+                'completeness': {'score': 0, 'feedback': ''}
+            },
+            'suggested_resources': []
+        }
+    
+    def _evaluate_short_answer_detailed(self, question, user_answer, setup_data, lookup_cache=True):
         """Evaluate short answer with detailed analysis using AI"""
         print(f"🔍 _evaluate_short_answer_detailed called")
         print(f"📝 Received answer: '{user_answer}' (type: {type(user_answer)})")
@@ -502,6 +850,11 @@ Generate the questions now:
         
         print(f"✅ Answer passes validation checks, proceeding with AI evaluation")
         
+        cached_evaluation = self._get_cached_evaluation(question, user_answer, setup_data) if lookup_cache else None
+        if cached_evaluation is not None:
+            print("♻️ Using cached evaluation")
+            return cached_evaluation
+        
         interview_type = setup_data.get('interview_type', '').lower()
         
         if interview_type == 'behavioral':
@@ -597,46 +950,44 @@ SUGGESTED_RESOURCES: [Comma-separated list of 3-4 specific learning resources]
             """
         
         try:
-            response = self.model.generate_content(prompt)
+            response = self.model_client.generate_content(prompt)
             response_text = response.text
-            
-            # Parse the structured response
-            return self._parse_detailed_evaluation(response_text)
         except Exception as e:
             # Fallback evaluation
             return self._fallback_detailed_evaluation(user_answer, question, setup_data)
+        
+        # Parse the structured response; only well-formed evaluations are cached
+        try:
+            evaluation = self._parse_detailed_evaluation_strict(response_text)
+        except Exception as e:
+            print(f"⚠️ Malformed evaluation response ({e}); parsing leniently and not caching it")
+            return self._parse_detailed_evaluation(response_text)
+        
+        self._store_cached_evaluation(question, user_answer, setup_data, evaluation)
+        return evaluation
+    
+    def _get_cached_evaluation(self, question, user_answer, setup_data):
+        """Look up a previous evaluation of the same answer to the same question"""
+        if not self.evaluation_cache:
+            return None
+        key = self.evaluation_cache.make_key(
+            question, user_answer, setup_data, self.EVALUATION_PROMPT_VERSION
+        )
+        return self.evaluation_cache.get(key)
+    
+    def _store_cached_evaluation(self, question, user_answer, setup_data, evaluation):
+        """Remember a model evaluation for identical future answers"""
+        if not self.evaluation_cache:
+            return
+        key = self.evaluation_cache.make_key(
+            question, user_answer, setup_data, self.EVALUATION_PROMPT_VERSION
+        )
+        self.evaluation_cache.set(key, evaluation)
     
     def _parse_detailed_evaluation(self, response_text):
         """Parse AI response into structured evaluation"""
         try:
-            # Extract scores and feedback
-            clarity_score = int(re.search(r'CLARITY_SCORE:\s*(\d+)', response_text).group(1))
-            clarity_feedback = re.search(r'CLARITY_FEEDBACK:\s*(.*?)(?=\n\w+_SCORE:|$)', response_text, re.DOTALL).group(1).strip()
-            
-            correctness_score = int(re.search(r'CORRECTNESS_SCORE:\s*(\d+)', response_text).group(1))
-            correctness_feedback = re.search(r'CORRECTNESS_FEEDBACK:\s*(.*?)(?=\n\w+_SCORE:|$)', response_text, re.DOTALL).group(1).strip()
-            
-            completeness_score = int(re.search(r'COMPLETENESS_SCORE:\s*(\d+)', response_text).group(1))
-            completeness_feedback = re.search(r'COMPLETENESS_FEEDBACK:\s*(.*?)(?=\n\w+_SCORE:|$)', response_text, re.DOTALL).group(1).strip()
-            
-            overall_score = int(re.search(r'OVERALL_SCORE:\s*(\d+)', response_text).group(1))
-            overall_feedback = re.search(r'OVERALL_FEEDBACK:\s*(.*?)(?=\nSUGGESTED_RESOURCES:|$)', response_text, re.DOTALL).group(1).strip()
-            
-            resources_text = re.search(r'SUGGESTED_RESOURCES:\s*(.*?)$', response_text, re.DOTALL).group(1).strip()
-            # Clean up the resources text and split properly
-            resources_text = re.sub(r'\d+\.\s*', '', resources_text)  # Remove numbering
-            suggested_resources = [r.strip() for r in resources_text.split(',') if r.strip() and len(r.strip()) > 10]
-            
-            return {
-                'score': min(overall_score, Config.SHORT_ANSWER_MAX_SCORE),
-                'feedback': overall_feedback,
-                'detailed_analysis': {
-                    'clarity': {'score': clarity_score, 'feedback': clarity_feedback},
-                    'correctness': {'score': correctness_score, 'feedback': correctness_feedback},
-                    'completeness': {'score': completeness_score, 'feedback': completeness_feedback}
-                },
-                'suggested_resources': suggested_resources[:4]  # Limit to 4 resources
-            }
+            return self._parse_detailed_evaluation_strict(response_text)
         except Exception as e:
             # Fallback if parsing fails
             return {
@@ -650,8 +1001,40 @@ SUGGESTED_RESOURCES: [Comma-separated list of 3-4 specific learning resources]
                 'suggested_resources': ['Study materials for improvement']
             }
     
+    def _parse_detailed_evaluation_strict(self, response_text):
+        """Parse AI response into structured evaluation, raising if it is malformed"""
+        # Extract scores and feedback
+        clarity_score = int(re.search(r'CLARITY_SCORE:\s*(\d+)', response_text).group(1))
+        clarity_feedback = re.search(r'CLARITY_FEEDBACK:\s*(.*?)(?=\n\w+_SCORE:|$)', response_text, re.DOTALL).group(1).strip()
+        
+        correctness_score = int(re.search(r'CORRECTNESS_SCORE:\s*(\d+)', response_text).group(1))
+        correctness_feedback = re.search(r'CORRECTNESS_FEEDBACK:\s*(.*?)(?=\n\w+_SCORE:|$)', response_text, re.DOTALL).group(1).strip()
+        
+        completeness_score = int(re.search(r'COMPLETENESS_SCORE:\s*(\d+)', response_text).group(1))
+        completeness_feedback = re.search(r'COMPLETENESS_FEEDBACK:\s*(.*?)(?=\n\w+_SCORE:|$)', response_text, re.DOTALL).group(1).strip()
+        
+        overall_score = int(re.search(r'OVERALL_SCORE:\s*(\d+)', response_text).group(1))
+        overall_feedback = re.search(r'OVERALL_FEEDBACK:\s*(.*?)(?=\nSUGGESTED_RESOURCES:|$)', response_text, re.DOTALL).group(1).strip()
+        
+        resources_text = re.search(r'SUGGESTED_RESOURCES:\s*(.*?)$', response_text, re.DOTALL).group(1).strip()
+        # Clean up the resources text and split properly
+        resources_text = re.sub(r'\d+\.\s*', '', resources_text)  # Remove numbering
+        suggested_resources = [r.strip() for r in resources_text.split(',') if r.strip() and len(r.strip()) > 10]
+        
+        return {
+            'score': min(overall_score, Config.SHORT_ANSWER_MAX_SCORE),
+            'feedback': overall_feedback,
+            'detailed_analysis': {
+                'clarity': {'score': clarity_score, 'feedback': clarity_feedback},
+                'correctness': {'score': correctness_score, 'feedback': correctness_feedback},
+                'completeness': {'score': completeness_score, 'feedback': completeness_feedback}
+            },
+            'suggested_resources': suggested_resources[:4]  # Limit to 4 resources
+        }
+    
     def _fallback_detailed_evaluation(self, user_answer, question, setup_data):
         """Fallback evaluation when AI fails"""
+        self.model_client.record_fallback('evaluation')
         answer_length = len(user_answer.strip())
         
         if answer_length < 20:
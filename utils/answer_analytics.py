@@ -0,0 +1,106 @@
+import json
+import os
+from config import Config
+
+try:
+    import numpy as np
+except ImportError:  # Analytics extra: pip install -r requirements-analytics.txt
+    np = None
+
+
+class AnswerDataset:
+    """Vectorised aggregates over the answer-level dataset written by AnswerExporter.
+
+    All chunks are loaded into one NumPy array per column. Group-bys work on
+    the dictionary codes with ``np.unique`` and ``np.bincount``, so every
+    aggregate is a few passes over the arrays and stays fast at millions of
+    answers. Skipped questions (scored 0) are left out unless
+    ``include_skipped`` is set.
+    """
+
+    def __init__(self, path=None):
+        if np is None:
+            raise RuntimeError('Answer analytics need NumPy: pip install -r requirements-analytics.txt')
+        path = path or Config.ANALYTICS_EXPORT_PATH
+        with open(os.path.join(path, 'dictionaries.json'), 'r') as f:
+            self.dictionaries = json.load(f)
+        with open(os.path.join(path, 'manifest.json'), 'r') as f:
+            manifest = json.load(f)
+
+        chunks = [np.load(os.path.join(path, chunk)) for chunk in manifest['chunks']]
+        names = chunks[0].files if chunks else []
+        self.columns = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in names}
+        self.rows = len(self.columns['score']) if chunks else 0
+
+    def mean_score_by(self, *group_columns, min_answers=1, include_skipped=False):
+        """Average score and answer count per combination of text columns, best first"""
+        if not self.rows:
+            return []
+        mask = self._scored(include_skipped)
+        sizes = [len(self.dictionaries[column]) for column in group_columns]
+        keys = np.ravel_multi_index([self.columns[column][mask].astype(np.int64) for column in group_columns], sizes)
+
+        # Compact to the combinations that occur before counting
+        groups, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(groups))
+        sums = np.bincount(inverse, weights=self.columns['score'][mask], minlength=len(groups))
+        keep = np.flatnonzero(counts >= min_answers)
+        means = sums[keep] / counts[keep]
+        order = np.argsort(-means, kind='stable')
+
+        rows = []
+        for index, mean in zip(keep[order], means[order]):
+            codes = np.unravel_index(groups[index], sizes)
+            row = {column: self.dictionaries[column][code] for column, code in zip(group_columns, codes)}
+            row.update({'average_score': round(float(mean), 2), 'answers': int(counts[index])})
+            rows.append(row)
+        return rows
+
+    def hardest_questions(self, limit=10, min_attempts=20):
+        """Questions with the lowest average score among those answered at least ``min_attempts`` times"""
+        rows = self.mean_score_by('question', 'category', min_answers=min_attempts)
+        return list(reversed(rows[-limit:])) if limit else list(reversed(rows))
+
+    def category_trends(self, period='M', include_skipped=False):
+        """Average score per category and month ('M') or week ('W')"""
+        if not self.rows:
+            return []
+        scores = self.columns['score']
+        created = self.columns['created_at']
+        valid = self._scored(include_skipped) & ~np.isnat(created)
+        periods = created[valid].astype(f'datetime64[{period}]')
+        unique_periods, period_codes = np.unique(periods, return_inverse=True)
+
+        categories = len(self.dictionaries['category'])
+        keys = self.columns['category'][valid].astype(np.int64) * len(unique_periods) + period_codes
+        counts = np.bincount(keys, minlength=categories * len(unique_periods))
+        sums = np.bincount(keys, weights=scores[valid], minlength=len(counts))
+
+        rows = []
+        for key in np.flatnonzero(counts):
+            category, period_code = divmod(int(key), len(unique_periods))
+            rows.append({
+                'category': self.dictionaries['category'][category],
+                'period': str(unique_periods[period_code]),
+                'average_score': round(float(sums[key] / counts[key]), 2),
+                'answers': int(counts[key])
+            })
+        rows.sort(key=lambda row: (row['category'], row['period']))
+        return rows
+
+    def summary(self):
+        if not self.rows:
+            return {'answers': 0, 'answered': 0, 'users': 0, 'average_score': 0}
+        mask = self._scored(False)
+        return {
+            'answers': self.rows,
+            'answered': int(np.count_nonzero(self.columns['answered'])),
+            'users': len(np.unique(self.columns['user'])),
+            'average_score': round(float(self.columns['score'][mask].mean()), 2) if mask.any() else 0
+        }
+
+    def _scored(self, include_skipped):
+        mask = ~np.isnan(self.columns['score'])
+        if not include_skipped:
+            mask &= self.columns['answered']
+        return mask
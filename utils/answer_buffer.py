@@ -0,0 +1,102 @@
+import atexit
+import threading
+from config import Config
+
+
+class AnswerWriteBuffer:
+    """Write-behind buffer for answer autosaves.
+
+    Answers submitted while typing are coalesced per interview in memory and
+    written as one field-level update (``user_answers.<i>`` and
+    ``current_question``) every ``ANSWER_FLUSH_INTERVAL`` seconds, instead of
+    one Firestore write per autosave. Call ``flush(interview_id)`` before
+    anything reads the answers back from the store; pending writes are also
+    flushed when the process exits.
+    """
+
+    # Consecutive failed writes after which an interview's answers are dropped
+    MAX_FAILURES = 3
+
+    def __init__(self, store, interval=None):
+        self.store = store
+        self.interval = Config.ANSWER_FLUSH_INTERVAL if interval is None else interval
+        self._pending = {}
+        self._failures = {}
+        self._lock = threading.Lock()
+        # Serialises flushes so an older snapshot is never written after a newer one
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._stats = {'recorded': 0, 'flushes': 0, 'writes': 0, 'failed_writes': 0}
+
+        self._thread = threading.Thread(target=self._run, name='answer-flush', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def record(self, interview_id, index, answer, current_question=None):
+        """Buffer an answer; a later answer to the same question replaces it"""
+        with self._lock:
+            fields = self._pending.setdefault(interview_id, {})
+            fields[f'user_answers.{index}'] = answer
+            if current_question is not None:
+                fields['current_question'] = current_question
+            self._stats['recorded'] += 1
+
+    def flush(self, interview_id=None):
+        """Write pending answers for one interview (or all). Returns False if a write failed."""
+        with self._flush_lock:
+            with self._lock:
+                if interview_id is None:
+                    batch, self._pending = self._pending, {}
+                elif interview_id in self._pending:
+                    batch = {interview_id: self._pending.pop(interview_id)}
+                else:
+                    batch = {}
+                self._stats['flushes'] += 1
+
+            ok = True
+            for pending_id, fields in batch.items():
+                written = self.store.update_interview_session_fields(pending_id, fields)
+                with self._lock:
+                    if written:
+                        self._stats['writes'] += 1
+                        self._failures.pop(pending_id, None)
+                        continue
+
+                    ok = False
+                    self._stats['failed_writes'] += 1
+                    failures = self._failures[pending_id] = self._failures.get(pending_id, 0) + 1
+                    if failures >= self.MAX_FAILURES:
+                        print(f"❌ Dropping buffered answers for interview {pending_id} after {failures} failed writes")
+                        self._failures.pop(pending_id, None)
+                        continue
+                    # Keep the answers for the next flush unless newer ones arrived meanwhile
+                    merged = dict(fields)
+                    merged.update(self._pending.get(pending_id, {}))
+                    self._pending[pending_id] = merged
+            return ok
+
+    def discard(self, interview_id):
+        """Drop pending answers of an interview whose session was deleted"""
+        with self._lock:
+            self._pending.pop(interview_id, None)
+            self._failures.pop(interview_id, None)
+
+    def stop(self):
+        """Stop the timer and write everything still pending"""
+        self._stop.set()
+        self.flush()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending_interviews'] = len(self._pending)
+        # Autosaves that did not need a Firestore write of their own
+        stats['saved_writes'] = stats['recorded'] - stats['writes']
+        return stats
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ Answer flush failed: {e}")
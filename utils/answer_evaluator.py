@@ -0,0 +1,188 @@
+import hashlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from config import Config
+
+
+class IncrementalEvaluator:
+    """Evaluates answers in the background as they are submitted.
+
+    Each (interview_id, question index) keeps the evaluation of its latest
+    answer. An answer is evaluated once it has been left unchanged for
+    ``INCREMENTAL_EVALUATION_DELAY`` seconds; a changed answer replaces the
+    pending evaluation. Finished results are also written to the interview
+    session in the store so any worker can pick them up at completion time.
+
+    Interviews without a new answer for ``INCREMENTAL_EVALUATION_IDLE_TTL``
+    seconds (e.g. abandoned ones) are forgotten; their stored evaluations
+    are still used if they are completed later.
+    """
+
+    # Seconds between scans for idle interviews
+    PRUNE_INTERVAL = 60
+
+    def __init__(self, ai_helper, store=None):
+        self.ai_helper = ai_helper
+        self.store = store
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, Config.EVALUATION_MAX_WORKERS),
+            thread_name_prefix='answer-eval'
+        )
+        self._entries = {}
+        self._last_submit = {}
+        self._last_prune = time.monotonic()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def answer_hash(answer):
+        return hashlib.sha256(str(answer).encode('utf-8')).hexdigest()
+
+    def submit(self, interview_id, index, question, answer, setup_data):
+        """Queue evaluation of an answer unless the same answer is already evaluated or queued"""
+        if not answer or not str(answer).strip():
+            return
+
+        key = (interview_id, str(index))
+        answer_hash = self.answer_hash(answer)
+        self.prune()
+
+        with self._lock:
+            self._last_submit[interview_id] = time.monotonic()
+            entry = self._entries.get(key)
+            if entry and entry['answer_hash'] == answer_hash:
+                return
+            if entry and entry['timer']:
+                entry['timer'].cancel()
+
+            entry = {
+                'answer_hash': answer_hash,
+                'future': Future(),
+                'started': False,
+                'timer': None,
+                'args': (question, answer, dict(setup_data))
+            }
+            self._entries[key] = entry
+
+            delay = Config.INCREMENTAL_EVALUATION_DELAY
+            if delay > 0:
+                entry['timer'] = threading.Timer(delay, self._start, args=(key, entry))
+                entry['timer'].daemon = True
+                entry['timer'].start()
+
+        if delay <= 0:
+            self._start(key, entry)
+
+    def collect(self, interview_id, user_answers, stored_evaluations=None, timeout=None):
+        """Return finished evaluations matching the current answers, keyed by question index.
+
+        Evaluations stored in the interview session are used first; in-process
+        ones that are still pending are started immediately and waited for up
+        to ``timeout`` seconds in total.
+        """
+        timeout = Config.INCREMENTAL_EVALUATION_WAIT if timeout is None else timeout
+        results = {}
+
+        for index, stored in (stored_evaluations or {}).items():
+            answer = user_answers.get(index)
+            if answer and stored.get('answer_hash') == self.answer_hash(answer):
+                results[index] = stored['result']
+
+        pending = {}
+        starting = []
+        # Matched and started under one lock hold, so a concurrent prune cannot drop
+        # an entry whose future would then never resolve
+        with self._lock:
+            for key, entry in self._entries.items():
+                index = key[1]
+                if key[0] != interview_id or index in results:
+                    continue
+                answer = user_answers.get(index)
+                if answer and entry['answer_hash'] == self.answer_hash(answer):
+                    # Don't wait for the settle delay any longer
+                    if self._mark_started(entry):
+                        starting.append((key, entry))
+                    pending[index] = entry['future']
+        for key, entry in starting:
+            self._executor.submit(self._evaluate, key, entry)
+
+        deadline = time.monotonic() + timeout
+        for index, future in pending.items():
+            try:
+                result = future.result(timeout=max(0, deadline - time.monotonic()))
+            except Exception as e:
+                print(f"⚠️ Incremental evaluation of question {index} not used: {e}")
+                continue
+            if result is not None:
+                results[index] = result
+
+        print(f"♻️ {len(results)} answers already evaluated for interview {interview_id}")
+        return results
+
+    def discard(self, interview_id):
+        """Forget all evaluations for an interview"""
+        with self._lock:
+            self._discard(interview_id)
+
+    def prune(self, idle_ttl=None, force=False):
+        """Forget interviews idle for ``idle_ttl`` seconds. Returns how many were dropped.
+
+        Runs at most once per PRUNE_INTERVAL unless ``force`` is set.
+        """
+        idle_ttl = Config.INCREMENTAL_EVALUATION_IDLE_TTL if idle_ttl is None else idle_ttl
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_prune < self.PRUNE_INTERVAL:
+                return 0
+            self._last_prune = now
+            idle = [interview_id for interview_id, last in self._last_submit.items() if now - last >= idle_ttl]
+            for interview_id in idle:
+                self._discard(interview_id)
+        if idle:
+            print(f"🧹 Dropped incremental evaluations of {len(idle)} idle interviews")
+        return len(idle)
+
+    def stats(self):
+        with self._lock:
+            return {'interviews': len(self._last_submit), 'entries': len(self._entries)}
+
+    def _discard(self, interview_id):
+        self._last_submit.pop(interview_id, None)
+        for key in [key for key in self._entries if key[0] == interview_id]:
+            entry = self._entries.pop(key)
+            if entry['timer']:
+                entry['timer'].cancel()
+
+    def _start(self, key, entry):
+        with self._lock:
+            if self._entries.get(key) is not entry or not self._mark_started(entry):
+                return
+        self._executor.submit(self._evaluate, key, entry)
+
+    @staticmethod
+    def _mark_started(entry):
+        """Mark an entry as started (under _lock). Returns False if it already was."""
+        if entry['started']:
+            return False
+        entry['started'] = True
+        if entry['timer']:
+            entry['timer'].cancel()
+        return True
+
+    def _evaluate(self, key, entry):
+        interview_id, index = key
+        question, answer, setup_data = entry['args']
+        try:
+            result = self.ai_helper._evaluate_single_question(question, answer, setup_data)
+        except Exception as e:
+            entry['future'].set_exception(e)
+            return
+
+        with self._lock:
+            current = self._entries.get(key) is entry
+
+        if current and self.store is not None:
+            self.store.update_interview_session_fields(interview_id, {
+                f'evaluations.{index}': {'answer_hash': entry['answer_hash'], 'result': result}
+            })
+        entry['future'].set_result(result)
@@ -0,0 +1,155 @@
+import json
+import os
+from datetime import datetime
+from config import Config
+
+try:
+    import numpy as np
+except ImportError:  # Analytics extra: pip install -r requirements-analytics.txt
+    np = None
+
+
+class AnswerExporter:
+    """Flattens interview reports into an answer-level columnar dataset.
+
+    Every answered or skipped question becomes one row. Each export run
+    appends ``chunk_<n>.npz`` files of NumPy columns (at most
+    ``ANALYTICS_CHUNK_ROWS`` rows each) holding the reports created since the
+    last run, tracked by a ``created_at`` watermark in ``manifest.json`` that
+    is saved after every chunk. Text columns (domain, category, question
+    text, ...) are dictionary-encoded: the chunks hold int32 codes into the
+    append-only value lists in ``dictionaries.json``.
+    """
+
+    TEXT_COLUMNS = ('user', 'domain', 'job_role', 'interview_type', 'difficulty',
+                    'question_type', 'category', 'question')
+    SCORE_COLUMNS = ('score', 'clarity', 'correctness', 'completeness')
+
+    def __init__(self, path=None):
+        if np is None:
+            raise RuntimeError('Answer analytics need NumPy: pip install -r requirements-analytics.txt')
+        self.path = path or Config.ANALYTICS_EXPORT_PATH
+        os.makedirs(self.path, exist_ok=True)
+        self.manifest = self._read_json('manifest.json', {
+            'watermark': None, 'watermark_ids': [], 'chunks': [], 'rows': 0, 'reports': 0
+        })
+        self.dictionaries = self._read_json('dictionaries.json', {column: [] for column in self.TEXT_COLUMNS})
+        self._codes = {
+            column: {value: code for code, value in enumerate(values)}
+            for column, values in self.dictionaries.items()
+        }
+
+    def export(self, reports):
+        """Append reports newer than the watermark. Returns a summary dict.
+
+        ``reports`` must be ordered by created_at and start at the watermark,
+        e.g. ``storage_manager.iter_reports_since(exporter.watermark)``.
+        """
+        watermark = self.manifest['watermark']
+        # Reports sharing the watermark timestamp that were already exported
+        seen_at_watermark = set(self.manifest['watermark_ids'])
+        columns = self._empty_columns()
+        summary = {'reports': 0, 'rows': 0, 'chunks': 0}
+        pending_reports = 0
+
+        for report in reports:
+            created_at = report.get('created_at', '')
+            if watermark and (created_at < watermark or (created_at == watermark and report['id'] in seen_at_watermark)):
+                continue
+            self._flatten(report, columns)
+            pending_reports += 1
+
+            if created_at != watermark:
+                watermark, seen_at_watermark = created_at, set()
+            seen_at_watermark.add(report['id'])
+
+            if len(columns['created_at']) >= Config.ANALYTICS_CHUNK_ROWS:
+                self._write_chunk(columns, pending_reports, watermark, seen_at_watermark, summary)
+                columns, pending_reports = self._empty_columns(), 0
+
+        if pending_reports:
+            self._write_chunk(columns, pending_reports, watermark, seen_at_watermark, summary)
+
+        summary['watermark'] = self.manifest['watermark']
+        return summary
+
+    def _empty_columns(self):
+        return {column: [] for column in self.TEXT_COLUMNS + self.SCORE_COLUMNS + ('answered', 'created_at')}
+
+    def _write_chunk(self, columns, reports, watermark, seen_at_watermark, summary):
+        rows = len(columns['created_at'])
+        if rows:
+            chunk = f"chunk_{len(self.manifest['chunks']):05d}.npz"
+            arrays = {column: np.asarray(columns[column], dtype=np.int32) for column in self.TEXT_COLUMNS}
+            arrays.update({column: np.asarray(columns[column], dtype=np.float32) for column in self.SCORE_COLUMNS})
+            arrays['answered'] = np.asarray(columns['answered'], dtype=bool)
+            arrays['created_at'] = np.asarray(columns['created_at'], dtype='datetime64[s]')
+            np.savez(os.path.join(self.path, chunk), **arrays)
+            self.manifest['chunks'].append(chunk)
+            summary['chunks'] += 1
+
+        # Dictionaries before the manifest: a crash in between only leaves unused values behind
+        self._write_json('dictionaries.json', self.dictionaries)
+        self.manifest.update({
+            'watermark': watermark,
+            'watermark_ids': sorted(seen_at_watermark),
+            'rows': self.manifest['rows'] + rows,
+            'reports': self.manifest['reports'] + reports,
+            'updated_at': datetime.now().isoformat()
+        })
+        self._write_json('manifest.json', self.manifest)
+        summary['reports'] += reports
+        summary['rows'] += rows
+
+    @property
+    def watermark(self):
+        return self.manifest['watermark']
+
+    def _flatten(self, report, columns):
+        setup = report.get('setup', {})
+        answers = report.get('answers', {})
+        question_results = report.get('results', {}).get('questions_results', [])
+        created_at = report.get('created_at', '')[:19]
+
+        for index, question in enumerate(report.get('questions', [])):
+            result = question_results[index] if index < len(question_results) else {}
+            analysis = result.get('detailed_analysis', {})
+            values = {
+                'user': report.get('user_id', ''),
+                'domain': setup.get('domain', 'Unknown'),
+                'job_role': setup.get('job_role', 'Unknown'),
+                'interview_type': setup.get('interview_type', 'Unknown'),
+                'difficulty': question.get('difficulty') or setup.get('difficulty', 'Medium'),
+                'question_type': question.get('type', 'short'),
+                'category': question.get('category', 'General'),
+                'question': question.get('text', '')
+            }
+            for column, value in values.items():
+                columns[column].append(self._encode(column, str(value)))
+
+            columns['answered'].append(bool(str(answers.get(str(index), '')).strip()))
+            columns['score'].append(result.get('score', np.nan) if result else np.nan)
+            for part in ('clarity', 'correctness', 'completeness'):
+                columns[part].append(analysis.get(part, {}).get('score', np.nan))
+            columns['created_at'].append(created_at or 'NaT')
+
+    def _encode(self, column, value):
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.dictionaries[column])
+            self.dictionaries[column].append(value)
+        return code
+
+    def _read_json(self, name, default):
+        path = os.path.join(self.path, name)
+        if not os.path.exists(path):
+            return default
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _write_json(self, name, data):
+        path = os.path.join(self.path, name)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(data, f)
+        os.replace(path + '.tmp', path)
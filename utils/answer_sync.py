@@ -0,0 +1,67 @@
+class AnswerSync:
+    """Applies batches of answer edits sent by the interview page.
+
+    Each change names a question index and a version that the page increments
+    with every edit of that answer; the highest version wins and older or
+    repeated versions are ignored, so retried and reordered batches are
+    harmless. A change carries either the full ``text`` or a ``diff`` against
+    the version the server last acknowledged (``base``): one splice
+    ``[start, delete_count, insert]``, which is all a typing session needs.
+    A diff whose base no longer matches is reported as a conflict and the
+    page resends the full text.
+    """
+
+    MAX_CHANGES = 100
+    MAX_ANSWER_LENGTH = 20000
+
+    @staticmethod
+    def apply_diff(text, diff):
+        """Apply a [start, delete_count, insert] splice, raising ValueError if it does not fit"""
+        if not isinstance(diff, list) or len(diff) != 3:
+            raise ValueError('Malformed diff')
+        start, delete_count, insert = diff
+        if not isinstance(start, int) or not isinstance(delete_count, int) or not isinstance(insert, str):
+            raise ValueError('Malformed diff')
+        if start < 0 or delete_count < 0 or start + delete_count > len(text):
+            raise ValueError('Diff does not match the stored answer')
+        return text[:start] + insert + text[start + delete_count:]
+
+    @classmethod
+    def apply(cls, answers, versions, changes, question_count):
+        """Apply changes to the ``answers`` and ``versions`` dicts (keyed by str index) in place.
+
+        Returns (applied, conflicts): the answers that changed, by index, and
+        the indexes whose diff could not be applied.
+        """
+        applied = {}
+        conflicts = []
+        for change in (changes or [])[:cls.MAX_CHANGES]:
+            if not isinstance(change, dict):
+                continue
+            index = change.get('index')
+            version = change.get('version')
+            if isinstance(index, bool) or not isinstance(index, int) or not 0 <= index < question_count \
+                    or not isinstance(version, int):
+                continue
+
+            key = str(index)
+            if version <= versions.get(key, 0):
+                # Already applied, or overtaken by a newer edit
+                continue
+
+            if isinstance(change.get('text'), str):
+                text = change['text']
+            else:
+                if change.get('base') != versions.get(key, 0):
+                    conflicts.append(index)
+                    continue
+                try:
+                    text = cls.apply_diff(answers.get(key, ''), change.get('diff'))
+                except ValueError:
+                    conflicts.append(index)
+                    continue
+
+            answers[key] = text[:cls.MAX_ANSWER_LENGTH]
+            versions[key] = version
+            applied[key] = answers[key]
+        return applied, conflicts
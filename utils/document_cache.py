@@ -0,0 +1,116 @@
+import copy
+import json
+import threading
+from config import Config
+from utils.cache import LRUCache
+
+
+class DocumentCache:
+    """Per-process read-through cache for Firestore documents.
+
+    Documents are stored as deep copies under ``(kind, doc_id)`` keys and
+    bounded by entry count, approximate JSON size and TTL. Writers keep the
+    cache coherent within the process: ``patch`` applies dotted field updates
+    to a cached copy and ``invalidate`` drops it. Other processes only see a
+    change once their entry expires, so the TTL bounds cross-worker staleness.
+
+    Read-through fills pass the ``generation`` taken before reading Firestore;
+    the fill is dropped if any write reached the cache in the meantime, so a
+    slow read cannot overwrite a newer patch.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None):
+        self.entries = LRUCache(
+            max_entries=max_entries or Config.DOCUMENT_CACHE_MAX_ENTRIES,
+            ttl=ttl or Config.DOCUMENT_CACHE_TTL,
+            max_bytes=max_bytes or Config.DOCUMENT_CACHE_MAX_BYTES
+        )
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'invalidations': 0,
+            'bytes_saved': 0
+        }
+
+    @classmethod
+    def from_config(cls):
+        """Build the cache configured in Config, or None when disabled"""
+        if not Config.DOCUMENT_CACHE_ENABLED:
+            return None
+        return cls()
+
+    def get(self, kind, doc_id):
+        """Return a copy of the cached document or None"""
+        entry = self.entries.get_entry((kind, doc_id))
+        with self._lock:
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['hits'] += 1
+            self._stats['bytes_saved'] += entry[1]
+        return copy.deepcopy(entry[0])
+
+    @property
+    def generation(self):
+        """Write counter to take before a read-through fill"""
+        with self._lock:
+            return self._generation
+
+    def set(self, kind, doc_id, document, generation=None, ttl=None):
+        """Store a document: a write-through when ``generation`` is None, else a read-through fill.
+
+        ``ttl`` overrides the cache TTL for documents other workers change often.
+        """
+        value = copy.deepcopy(document)
+        size = self._size(value)
+        with self._lock:
+            if generation is None:
+                self._generation += 1
+            elif generation != self._generation:
+                return
+            self.entries.set((kind, doc_id), value, ttl=ttl, size=size)
+            self._stats['stores'] += 1
+
+    def patch(self, kind, doc_id, updates):
+        """Apply Firestore-style dotted field updates to the cached copy, if any"""
+        with self._lock:
+            self._generation += 1
+            entry = self.entries.get_entry((kind, doc_id))
+            if entry is None:
+                return
+            value = copy.deepcopy(entry[0])
+            for path, field_value in updates.items():
+                target = value
+                parts = path.split('.')
+                for part in parts[:-1]:
+                    child = target.get(part)
+                    if not isinstance(child, dict):
+                        child = target[part] = {}
+                    target = child
+                target[parts[-1]] = copy.deepcopy(field_value)
+            self.entries.set((kind, doc_id), value, size=self._size(value))
+
+    def invalidate(self, kind, doc_id):
+        with self._lock:
+            self._generation += 1
+            if self.entries.delete((kind, doc_id)):
+                self._stats['invalidations'] += 1
+
+    def stats(self):
+        """Return hit ratio, bytes saved and memory use"""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0
+        stats['entries'] = len(self.entries)
+        stats['bytes'] = self.entries.bytes
+        stats['evictions'] = self.entries.evictions
+        return stats
+
+    @staticmethod
+    def _size(document):
+        """Approximate size of a document, as its JSON encoding"""
+        return len(json.dumps(document, default=str))
@@ -0,0 +1,111 @@
+import copy
+import hashlib
+import json
+import threading
+from config import Config
+from utils.cache import LRUCache, SQLiteCache
+
+
+class EvaluationCache:
+    """Two-tier cache for AI answer evaluations.
+
+    Entries are keyed on a hash of the question, the normalised answer and the
+    setup fields that change the evaluation prompt. Lookups hit the in-process
+    LRU first and then the optional shared tier (any object with ``get``/``set``,
+    e.g. ``SQLiteCache``), promoting shared hits into memory.
+    """
+
+    def __init__(self, memory_tier=None, shared_tier=None):
+        self.memory_tier = memory_tier or LRUCache(
+            max_entries=Config.EVALUATION_CACHE_MAX_ENTRIES,
+            ttl=Config.EVALUATION_CACHE_TTL
+        )
+        self.shared_tier = shared_tier
+        self._lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0,
+            'shared_hits': 0,
+            'misses': 0,
+            'stores': 0
+        }
+
+    @classmethod
+    def from_config(cls):
+        """Build the cache configured in Config, or None when disabled"""
+        if not Config.EVALUATION_CACHE_ENABLED:
+            return None
+
+        shared_tier = None
+        if Config.EVALUATION_CACHE_BACKEND == 'sqlite':
+            shared_tier = SQLiteCache(
+                Config.EVALUATION_CACHE_PATH,
+                max_entries=Config.EVALUATION_CACHE_SHARED_MAX_ENTRIES,
+                ttl=Config.EVALUATION_CACHE_TTL
+            )
+        return cls(shared_tier=shared_tier)
+
+    @staticmethod
+    def normalize_answer(answer):
+        """Normalise an answer so trivially different submissions share a key"""
+        return ' '.join(str(answer).lower().split())
+
+    def make_key(self, question, user_answer, setup_data, prompt_version):
+        """Build the content hash for a question/answer evaluation"""
+        payload = json.dumps([
+            prompt_version,
+            question.get('text', ''),
+            question.get('category', 'General'),
+            self.normalize_answer(user_answer),
+            setup_data.get('job_role', ''),
+            setup_data.get('domain', ''),
+            setup_data.get('interview_type', '').lower(),
+            setup_data.get('difficulty', 'Medium')
+        ])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return a copy of the cached evaluation or None"""
+        value = self.memory_tier.get(key)
+        if value is not None:
+            self._record('memory_hits')
+            return copy.deepcopy(value)
+
+        if self.shared_tier is not None:
+            try:
+                value = self.shared_tier.get(key)
+            except Exception as e:
+                print(f"⚠️ Evaluation cache shared tier read failed: {e}")
+                value = None
+            if value is not None:
+                self._record('shared_hits')
+                self.memory_tier.set(key, value)
+                return copy.deepcopy(value)
+
+        self._record('misses')
+        return None
+
+    def set(self, key, evaluation):
+        """Store an evaluation in every tier"""
+        value = copy.deepcopy(evaluation)
+        self.memory_tier.set(key, value)
+        if self.shared_tier is not None:
+            try:
+                self.shared_tier.set(key, value)
+            except Exception as e:
+                print(f"⚠️ Evaluation cache shared tier write failed: {e}")
+        self._record('stores')
+
+    def stats(self):
+        """Return hit/miss counters and the number of model calls saved"""
+        with self._lock:
+            stats = dict(self._stats)
+        hits = stats['memory_hits'] + stats['shared_hits']
+        lookups = hits + stats['misses']
+        stats['saved_calls'] = hits
+        stats['hit_rate'] = round(hits / lookups, 3) if lookups else 0
+        stats['memory_entries'] = len(self.memory_tier)
+        return stats
+
+    def _record(self, counter):
+        with self._lock:
+            self._stats[counter] += 1
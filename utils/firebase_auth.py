@@ -122,33 +122,10 @@ class FirebaseAuthManager:
             if not user_doc.exists:
                 return False
             
-            user_data = user_doc.to_dict()
-            
-            # Update statistics
-            total_interviews = user_data.get('total_interviews', 0) + 1
-            current_avg = user_data.get('average_score', 0)
-            new_score = interview_data.get('overall_score', 0)
-            
-            # Calculate new average
-            new_average = (current_avg * (total_interviews - 1) + new_score) / total_interviews
-            
-            # Update skill levels
-            skill_levels = user_data.get('skill_levels', {})
-            if 'skill_scores' in interview_data:
-                for skill, score in interview_data['skill_scores'].items():
-                    if skill in skill_levels:
-                        # Average with existing score
-                        skill_levels[skill] = (skill_levels[skill] + score) / 2
-                    else:
-                        skill_levels[skill] = score
-            
             # Update user document
-            self.users_collection.document(user_id).update({
-                'total_interviews': total_interviews,
-                'average_score': new_average,
-                'skill_levels': skill_levels,
-                'last_interview': datetime.now().isoformat()
-            })
+            self.users_collection.document(user_id).update(
+                self.interview_stats_update(user_doc.to_dict(), interview_data)
+            )
             
             return True
             
@@ -156,6 +133,34 @@ class FirebaseAuthManager:
             print(f"Error updating user stats: {e}")
             return False
     
+    @staticmethod
+    def interview_stats_update(user_data, interview_data):
+        """Build the profile update that adds one interview to the user's running stats"""
+        # Update statistics
+        total_interviews = user_data.get('total_interviews', 0) + 1
+        current_avg = user_data.get('average_score', 0)
+        new_score = interview_data.get('overall_score', 0)
+        
+        # Calculate new average
+        new_average = (current_avg * (total_interviews - 1) + new_score) / total_interviews
+        
+        # Update skill levels
+        skill_levels = user_data.get('skill_levels', {})
+        if 'skill_scores' in interview_data:
+            for skill, score in interview_data['skill_scores'].items():
+                if skill in skill_levels:
+                    # Average with existing score
+                    skill_levels[skill] = (skill_levels[skill] + score) / 2
+                else:
+                    skill_levels[skill] = score
+        
+        return {
+            'total_interviews': total_interviews,
+            'average_score': new_average,
+            'skill_levels': skill_levels,
+            'last_interview': datetime.now().isoformat()
+        }
+    
     def verify_token(self, token):
         """Verify Firebase ID token"""
         try:
@@ -23,6 +23,14 @@ class FirebaseConfig:
     
     def _init_admin_sdk(self):
         """Initialize Firebase Admin SDK"""
+        if os.environ.get('FIRESTORE_EMULATOR_HOST'):
+            # Local Firestore emulator (development, benchmarks): no credentials needed
+            from google.cloud import firestore as cloud_firestore
+            self.db = cloud_firestore.Client(project=Config.FIREBASE_PROJECT_ID or 'demo-interview-buddy')
+            self.auth_admin = auth
+            print(f"🧪 Using Firestore emulator at {os.environ['FIRESTORE_EMULATOR_HOST']}")
+            return
+        
         try:
             # Check if already initialized
             firebase_admin.get_app()
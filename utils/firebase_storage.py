@@ -1,25 +1,56 @@
 import json
 import os
+import time
 import uuid
 from datetime import datetime
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from utils.firebase_config import firebase_config
-from firebase_admin import storage
+from utils.firebase_auth import FirebaseAuthManager
+from utils.user_stats import UserStats
+from utils.document_cache import DocumentCache
+from utils.leaderboard import Leaderboard
+from config import Config
+from firebase_admin import storage, firestore
 import io
 import base64
 
 class FirebaseStorageManager:
+    # Report ids of completed interviews are uuid5(REPORT_ID_NAMESPACE, interview_id)
+    REPORT_ID_NAMESPACE = uuid.UUID('5b0c7a52-8f0e-4a8e-9a43-1d2f3c6e7b10')
+    
     def __init__(self):
         self.db = firebase_config.get_db()
         self.reports_collection = self.db.collection('reports')
         self.interviews_collection = self.db.collection('interviews')
         self.questions_collection = self.db.collection('questions')
+        self.user_stats_collection = self.db.collection('user_stats')
+        self.report_summaries_collection = self.db.collection('report_summaries')
+        self.users_collection = self.db.collection('users')
+        self.leaderboards_collection = self.db.collection('leaderboards')
+        # Read-through cache for interview sessions, reports and user stats (None when disabled)
+        self.cache = DocumentCache.from_config()
     
     def save_report(self, user_id, setup, questions, answers, results):
         """Save interview report to Firestore"""
+        return self._commit_report(user_id, setup, questions, answers, results)
+    
+    def complete_interview(self, user_id, interview_id, setup, questions, answers, results):
+        """Save the report, add it to the user's profile stats and delete the interview session.
+        
+        Everything is written in one transaction, so a failure leaves the session
+        in place for a retry and never a report without its stats. The report id
+        is derived from the interview id, so running the completion again (e.g. a
+        requeued job) returns the saved report instead of adding a second one.
+        """
+        return self._commit_report(user_id, setup, questions, answers, results, interview_id=interview_id)
+    
+    def _commit_report(self, user_id, setup, questions, answers, results, interview_id=None):
         try:
-            report_id = str(uuid.uuid4())
+            if interview_id:
+                report_id = str(uuid.uuid5(self.REPORT_ID_NAMESPACE, interview_id))
+            else:
+                report_id = str(uuid.uuid4())
             report_data = {
                 'id': report_id,
                 'user_id': user_id,
@@ -31,8 +62,49 @@ class FirebaseStorageManager:
                 'type': 'interview_report'
             }
             
-            # Save to Firestore
-            self.reports_collection.document(report_id).set(report_data)
+            # Save to Firestore with its list-view summary, updating the user's aggregate stats in the same transaction
+            report_ref = self.reports_collection.document(report_id)
+            summary_ref = self.report_summaries_collection.document(report_id)
+            stats_ref = self.user_stats_collection.document(user_id)
+            user_ref = self.users_collection.document(user_id)
+            
+            @firestore.transactional
+            def save(transaction):
+                # Transactions must do all reads before any writes
+                if interview_id and report_ref.get(transaction=transaction).exists:
+                    # Completed before; leave the report, stats and profile as they are
+                    transaction.delete(self.interviews_collection.document(interview_id))
+                    return False, None
+                stats_doc = stats_ref.get(transaction=transaction)
+                user_doc = user_ref.get(transaction=transaction) if interview_id else None
+                
+                transaction.set(report_ref, report_data)
+                transaction.set(summary_ref, self.build_report_summary(report_data))
+                # Missing stats are rebuilt from the reports on the next read
+                stats = None
+                if stats_doc.exists:
+                    stats = UserStats(stats_doc.to_dict())
+                    stats.add_report(report_data)
+                    transaction.set(stats_ref, stats.to_dict())
+                
+                if interview_id:
+                    if user_doc.exists:
+                        transaction.update(user_ref, FirebaseAuthManager.interview_stats_update(user_doc.to_dict(), results))
+                    transaction.delete(self.interviews_collection.document(interview_id))
+                return True, stats
+            
+            created, saved_stats = save(self.db.transaction())
+            if not created:
+                if self.cache:
+                    self.cache.invalidate('interview', interview_id)
+                print(f"♻️ Interview {interview_id} already has report {report_id}")
+                return report_id
+            if self.cache:
+                self.cache.set('report', report_id, report_data)
+                self._cache_user_stats(user_id, saved_stats)
+                if interview_id:
+                    self.cache.invalidate('interview', interview_id)
+            self.update_leaderboards(report_data)
             print(f"✅ Report saved successfully: {report_id} for user: {user_id}")
             
             return report_id
@@ -72,13 +144,19 @@ class FirebaseStorageManager:
     def get_report(self, user_id, report_id):
         """Get specific report from Firestore"""
         try:
-            report_doc = self.reports_collection.document(report_id).get()
-            
-            if report_doc.exists:
+            report_data = self.cache.get('report', report_id) if self.cache else None
+            if report_data is None:
+                generation = self.cache.generation if self.cache else None
+                report_doc = self.reports_collection.document(report_id).get()
+                if not report_doc.exists:
+                    return None
                 report_data = report_doc.to_dict()
-                # Verify the report belongs to the user
-                if report_data.get('user_id') == user_id:
-                    return report_data
+                if self.cache:
+                    self.cache.set('report', report_id, report_data, generation=generation)
+            
+            # Verify the report belongs to the user
+            if report_data.get('user_id') == user_id:
+                return report_data
             
             return None
             
@@ -86,74 +164,113 @@ class FirebaseStorageManager:
             print(f"Error getting report: {e}")
             return None
     
-    def get_recent_reports(self, user_id, limit=5):
-        """Get recent reports for a user"""
+    def get_recent_reports(self, user_id, limit=5, stats=None):
+        """Get summaries of a user's most recent reports"""
+        return self.get_report_summaries_page(user_id, page_size=limit, stats=stats)['reports']
+    
+    def iter_reports_since(self, watermark=None, page_size=500):
+        """Yield full reports with created_at >= watermark, oldest first, one page at a time"""
+        query = self.reports_collection.order_by('created_at')
+        if watermark:
+            query = query.where('created_at', '>=', watermark)
+        query = query.limit(page_size)
+        
+        last = None
+        while True:
+            page = list((query.start_after(last) if last else query).stream())
+            for report_doc in page:
+                yield report_doc.to_dict()
+            if len(page) < page_size:
+                break
+            last = page[-1]
+    
+    def get_report_summaries_page(self, user_id, page_size=None, cursor=None, stats=None):
+        """Get one page of a user's report summaries, newest first.
+        
+        Returns {'reports': [...], 'next_cursor': ...}; pass next_cursor back to
+        get the following page (it is None on the last page). Summaries are
+        ordered by created_at and then by report id, so reports created in the
+        same instant are not skipped; the cursor holds both. The ordered query
+        needs the (user_id, created_at DESC) index from firestore.indexes.json.
+        Pass the user's already loaded ``stats`` to skip reading them again.
+        """
+        page_size = page_size or Config.REPORTS_PAGE_SIZE
         try:
-            # Get all reports for user first, then sort in Python to avoid index requirement
-            reports_query = self.reports_collection.where('user_id', '==', user_id)
-            
-            reports = []
-            for doc in reports_query.stream():
-                reports.append(doc.to_dict())
+            # Make sure reports saved before summaries existed have been backfilled
+            if stats is None:
+                self.load_user_stats(user_id)
+            
+            after = None
+            if cursor:
+                created_at, _, report_id = cursor.partition('|')
+                after = (created_at, report_id)
+            
+            try:
+                query = self.report_summaries_collection.where('user_id', '==', user_id) \
+                    .order_by('created_at', direction=firestore.Query.DESCENDING) \
+                    .order_by('__name__', direction=firestore.Query.DESCENDING)
+                if after:
+                    query = query.start_after({'created_at': after[0], '__name__': after[1]})
+                # One extra document tells us whether there is a next page
+                summaries = [doc.to_dict() for doc in query.limit(page_size + 1).stream()]
+            except Exception as e:
+                print(f"⚠️ Ordered report query failed ({e}); is the composite index deployed? Sorting in Python instead")
+                summaries = self.get_user_report_summaries(user_id)
+                summaries.sort(key=lambda summary: (summary.get('created_at', ''), summary['id']), reverse=True)
+                if after:
+                    summaries = [summary for summary in summaries
+                                 if (summary.get('created_at', ''), summary['id']) < after]
+                summaries = summaries[:page_size + 1]
+            
+            page = summaries[:page_size]
+            next_cursor = f"{page[-1]['created_at']}|{page[-1]['id']}" if len(summaries) > page_size else None
+            return {'reports': page, 'next_cursor': next_cursor}
             
-            # Sort by created_at in Python and limit
-            reports.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        except Exception as e:
+            print(f"Error getting report summaries page: {e}")
+            return {'reports': [], 'next_cursor': None}
+    
+    def get_user_report_summaries(self, user_id):
+        """Get compact summaries of all reports for a user, newest first.
+        
+        Summaries hold only what list views show; use get_report for the full report.
+        Prefer get_report_summaries_page for anything shown to users.
+        """
+        try:
+            summaries_query = self.report_summaries_collection.where('user_id', '==', user_id)
+            summaries = [doc.to_dict() for doc in summaries_query.stream()]
             
-            return reports[:limit]
+            # Sort by created_at in Python instead of Firestore to avoid index issues
+            summaries.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+            return summaries
             
         except Exception as e:
-            print(f"Error getting recent reports: {e}")
+            print(f"Error getting report summaries: {e}")
             return []
     
+    @staticmethod
+    def build_report_summary(report_data):
+        """Compact projection of a report for list views"""
+        setup = report_data.get('setup', {})
+        return {
+            'id': report_data['id'],
+            'user_id': report_data['user_id'],
+            'created_at': report_data.get('created_at', ''),
+            'setup': {
+                'job_role': setup.get('job_role', ''),
+                'domain': setup.get('domain', ''),
+                'interview_type': setup.get('interview_type', ''),
+                'question_type': setup.get('question_type', ''),
+                'difficulty': setup.get('difficulty', '')
+            },
+            'results': {'overall_score': report_data.get('results', {}).get('overall_score', 0)},
+            'question_count': len(report_data.get('questions', []))
+        }
+    
     def get_user_stats(self, user_id):
-        """Get user statistics from Firestore"""
+        """Get user statistics from the aggregate stats document"""
         try:
-            reports = self.get_user_reports(user_id)
-            
-            if not reports:
-                return {
-                    'total_interviews': 0,
-                    'average_score': 0,
-                    'best_score': 0,
-                    'total_questions_answered': 0,
-                    'favorite_domain': 'N/A',
-                    'recent_performance': []
-                }
-            
-            total_interviews = len(reports)
-            scores = [report['results']['overall_score'] for report in reports if 'results' in report and 'overall_score' in report['results']]
-            
-            if scores:
-                average_score = (sum(scores) / len(scores)) * 10
-                best_score = max(scores) * 10
-            else:
-                average_score = 0
-                best_score = 0
-            
-            total_questions = sum(len(report.get('questions', [])) for report in reports)
-            
-            # Find favorite domain
-            domains = [report['setup']['domain'] for report in reports if 'setup' in report and 'domain' in report['setup']]
-            favorite_domain = max(set(domains), key=domains.count) if domains else 'N/A'
-            
-            # Recent performance (last 10 interviews)
-            recent_performance = []
-            for report in reports[:10]:
-                if 'results' in report and 'overall_score' in report['results']:
-                    recent_performance.append({
-                        'date': report['created_at'],
-                        'score': report['results']['overall_score'] * 10,
-                        'domain': report.get('setup', {}).get('domain', 'Unknown')
-                    })
-            
-            return {
-                'total_interviews': total_interviews,
-                'average_score': round(average_score, 1),
-                'best_score': round(best_score, 1),
-                'total_questions_answered': total_questions,
-                'favorite_domain': favorite_domain,
-                'recent_performance': recent_performance
-            }
+            return self.load_user_stats(user_id).summary()
             
         except Exception as e:
             print(f"Error getting user stats: {e}")
@@ -169,87 +286,7 @@ class FirebaseStorageManager:
     def get_detailed_stats(self, user_id):
         """Get detailed user statistics for charts and analytics"""
         try:
-            reports = self.get_user_reports(user_id)
-            
-            if not reports:
-                return {
-                    'total_interviews': 0,
-                    'average_score': 0,
-                    'best_score': 0,
-                    'total_questions_answered': 0,
-                    'favorite_domain': 'N/A',
-                    'recent_performance': [],
-                    'recent_scores': [],  # Add this for the performance chart
-                    'domain_breakdown': {},
-                    'monthly_progress': [],
-                    'skill_analysis': {}
-                }
-            
-            # Basic stats
-            total_interviews = len(reports)
-            scores = [report['results']['overall_score'] for report in reports if 'results' in report and 'overall_score' in report['results']]
-            
-            if scores:
-                average_score = sum(scores) / len(scores)  # Score is already 0-10
-                best_score = max(scores)  # Score is already 0-10
-            else:
-                average_score = 0
-                best_score = 0
-            
-            total_questions = sum(len(report.get('questions', [])) for report in reports)
-            
-            # Domain breakdown
-            domains = [report['setup']['domain'] for report in reports if 'setup' in report and 'domain' in report['setup']]
-            domain_breakdown = {}
-            for domain in set(domains):
-                domain_breakdown[domain] = domains.count(domain)
-            
-            favorite_domain = max(domain_breakdown, key=domain_breakdown.get) if domain_breakdown else 'N/A'
-            
-            # Recent performance (last 10 interviews)
-            recent_performance = []
-            for report in reports[:10]:
-                if 'results' in report and 'overall_score' in report['results']:
-                    recent_performance.append({
-                        'date': report['created_at'][:10],  # Just the date part
-                        'score': round(report['results']['overall_score'], 1),  # Score is already 0-10
-                        'domain': report.get('setup', {}).get('domain', 'Unknown')
-                    })
-            
-            # Monthly progress (group by month)
-            monthly_progress = {}
-            for report in reports:
-                if 'created_at' in report and 'results' in report:
-                    month = report['created_at'][:7]  # YYYY-MM format
-                    if month not in monthly_progress:
-                        monthly_progress[month] = {'count': 0, 'total_score': 0}
-                    monthly_progress[month]['count'] += 1
-                    monthly_progress[month]['total_score'] += report['results'].get('overall_score', 0)  # Score is already 0-10
-            
-            # Convert monthly progress to list
-            monthly_list = []
-            for month, data in sorted(monthly_progress.items()):
-                monthly_list.append({
-                    'month': month,
-                    'interviews': data['count'],
-                    'average_score': round(data['total_score'] / data['count'], 1) if data['count'] > 0 else 0
-                })
-            
-            # Extract scores for the performance chart
-            recent_scores = [perf['score'] for perf in recent_performance]
-            
-            return {
-                'total_interviews': total_interviews,
-                'average_score': round(average_score, 1),
-                'best_score': round(best_score, 1),
-                'total_questions_answered': total_questions,
-                'favorite_domain': favorite_domain,
-                'recent_performance': recent_performance,
-                'recent_scores': recent_scores,  # Add this for the performance chart
-                'domain_breakdown': domain_breakdown,
-                'monthly_progress': monthly_list[-6:],  # Last 6 months
-                'skill_analysis': {}
-            }
+            return self.load_user_stats(user_id).detailed()
             
         except Exception as e:
             print(f"Error getting detailed stats: {e}")
@@ -266,6 +303,56 @@ class FirebaseStorageManager:
                 'skill_analysis': {}
             }
     
+    def load_user_stats(self, user_id):
+        """Read the user's aggregate stats, rebuilding them from the reports when missing"""
+        cached = self.cache.get('user_stats', user_id) if self.cache else None
+        if cached is not None:
+            return UserStats(cached)
+        
+        generation = self.cache.generation if self.cache else None
+        stats_doc = self.user_stats_collection.document(user_id).get()
+        if stats_doc.exists:
+            stats = UserStats(stats_doc.to_dict())
+            if not stats.needs_rebuild():
+                self._cache_user_stats(user_id, stats, generation=generation)
+                return stats
+            # Summaries only need backfilling when upgrading from an older stats layout
+            return self.rebuild_user_stats(user_id, backfill_summaries=stats.data.get('version') != UserStats.VERSION)
+        return self.rebuild_user_stats(user_id)
+    
+    def rebuild_user_stats(self, user_id, backfill_summaries=True):
+        """Recompute the user's aggregate stats (and optionally report summaries) from all of their reports.
+        
+        The reports are read and the stats written in one transaction, so a report
+        saved meanwhile is never lost. Read errors are raised; unlike
+        get_user_reports they must not turn into an empty (all-zero) stats document.
+        """
+        stats_ref = self.user_stats_collection.document(user_id)
+        reports_query = self.reports_collection.where('user_id', '==', user_id)
+        
+        @firestore.transactional
+        def rebuild(transaction):
+            # Reading the stats document makes a concurrent report save retry this transaction
+            stats_ref.get(transaction=transaction)
+            reports = [doc.to_dict() for doc in reports_query.stream(transaction=transaction)]
+            stats = UserStats.from_reports(user_id, reports)
+            transaction.set(stats_ref, stats.to_dict())
+            return reports, stats
+        
+        reports, stats = rebuild(self.db.transaction())
+        self._cache_user_stats(user_id, stats)
+        
+        if backfill_summaries:
+            # Firestore batches take at most 500 writes
+            for start in range(0, len(reports), 500):
+                batch = self.db.batch()
+                for report in reports[start:start + 500]:
+                    batch.set(self.report_summaries_collection.document(report['id']), self.build_report_summary(report))
+                batch.commit()
+        
+        print(f"🔄 Rebuilt stats for user {user_id} from {stats.data['total_interviews']} reports")
+        return stats
+    
     def save_interview_session(self, user_id, interview_id, session_data):
         """Save interview session data to Firestore"""
         try:
@@ -278,19 +365,31 @@ class FirebaseStorageManager:
             }
             
             self.interviews_collection.document(interview_id).set(session_doc)
+            self._cache_session(interview_id, session_doc)
             return True
             
         except Exception as e:
             print(f"Error saving interview session: {e}")
             return False
     
-    def get_interview_session(self, interview_id):
-        """Get interview session data from Firestore"""
+    def get_interview_session(self, interview_id, use_cache=True):
+        """Get interview session data from Firestore.
+        
+        Pass use_cache=False for reads that must see writes made by other processes.
+        """
         try:
+            if use_cache and self.cache:
+                cached = self.cache.get('interview', interview_id)
+                if cached is not None:
+                    return cached
+            
+            generation = self.cache.generation if self.cache else None
             session_doc = self.interviews_collection.document(interview_id).get()
             
             if session_doc.exists:
-                return session_doc.to_dict()
+                session_data = session_doc.to_dict()
+                self._cache_session(interview_id, session_data, generation=generation)
+                return session_data
             
             return None
             
@@ -301,35 +400,126 @@ class FirebaseStorageManager:
     def update_interview_session(self, interview_id, session_data):
         """Update interview session data in Firestore"""
         try:
-            self.interviews_collection.document(interview_id).update({
+            updates = {
                 'session_data': session_data,
                 'last_updated': datetime.now().isoformat()
-            })
+            }
+            self.interviews_collection.document(interview_id).update(updates)
+            if self.cache:
+                self.cache.patch('interview', interview_id, updates)
             return True
             
         except Exception as e:
             print(f"Error updating interview session: {e}")
             return False
     
+    def update_interview_session_fields(self, interview_id, fields):
+        """Update individual session_data fields without rewriting the whole session"""
+        try:
+            updates = {f'session_data.{field}': value for field, value in fields.items()}
+            updates['last_updated'] = datetime.now().isoformat()
+            self.interviews_collection.document(interview_id).update(updates)
+            if self.cache:
+                self.cache.patch('interview', interview_id, updates)
+            return True
+            
+        except Exception as e:
+            print(f"Error updating interview session fields: {e}")
+            return False
+    
+    def claim_question_generation(self, interview_id, owner, lease):
+        """Mark a session that is still missing questions as being generated by ``owner``.
+        
+        Returns True if the claim was taken. A claim whose heartbeat (refreshed by
+        append_interview_question) is older than ``lease`` seconds is taken over.
+        """
+        try:
+            session_ref = self.interviews_collection.document(interview_id)
+            
+            @firestore.transactional
+            def claim(transaction):
+                session_doc = session_ref.get(transaction=transaction)
+                if not session_doc.exists:
+                    return False
+                session_data = session_doc.to_dict().get('session_data', {})
+                status = session_data.get('generation_status', 'complete')
+                if status == 'complete':
+                    return False
+                if status == 'generating' and time.time() - session_data.get('generation_heartbeat', 0) < lease:
+                    return False
+                transaction.update(session_ref, {
+                    'session_data.generation_status': 'generating',
+                    'session_data.generation_owner': owner,
+                    'session_data.generation_heartbeat': time.time(),
+                    'last_updated': datetime.now().isoformat()
+                })
+                return True
+            
+            return claim(self.db.transaction())
+            
+        except Exception as e:
+            print(f"Error claiming question generation: {e}")
+            return False
+    
+    def append_interview_question(self, interview_id, question):
+        """Append one generated question to the session and refresh the generation heartbeat"""
+        try:
+            self.interviews_collection.document(interview_id).update({
+                'session_data.questions': firestore.ArrayUnion([question]),
+                'session_data.generation_heartbeat': time.time(),
+                'last_updated': datetime.now().isoformat()
+            })
+            if self.cache:
+                self.cache.invalidate('interview', interview_id)
+            return True
+            
+        except Exception as e:
+            print(f"Error appending interview question: {e}")
+            return False
+    
     def delete_interview_session(self, interview_id):
         """Delete interview session from Firestore"""
         try:
             self.interviews_collection.document(interview_id).delete()
+            if self.cache:
+                self.cache.invalidate('interview', interview_id)
             return True
             
         except Exception as e:
             print(f"Error deleting interview session: {e}")
             return False
     
-    def save_questions_cache(self, cache_key, questions):
+    def _cache_user_stats(self, user_id, stats, generation=None):
+        """Cache (or, when the stats document is missing, drop) a user's aggregate stats.
+        
+        The short USER_STATS_CACHE_TTL bounds how long another worker's report
+        save can go unseen on this one.
+        """
+        if not self.cache:
+            return
+        if stats is None:
+            self.cache.invalidate('user_stats', user_id)
+        else:
+            self.cache.set('user_stats', user_id, stats.data, generation=generation, ttl=Config.USER_STATS_CACHE_TTL)
+    
+    def _cache_session(self, interview_id, session_doc, generation=None):
+        """Cache a session once its question list is final"""
+        # A session still generating questions changes under other workers; always read it fresh
+        status = session_doc.get('session_data', {}).get('generation_status', 'complete')
+        if self.cache and status == 'complete':
+            self.cache.set('interview', interview_id, session_doc, generation=generation)
+    
+    def save_questions_cache(self, cache_key, questions, ttl=3600, metadata=None):
         """Save generated questions to Firestore cache"""
         try:
             questions_doc = {
                 'cache_key': cache_key,
                 'questions': questions,
                 'created_at': datetime.now().isoformat(),
-                'expires_at': (datetime.now().timestamp() + 3600)  # 1 hour expiry
+                'expires_at': (datetime.now().timestamp() + ttl)  # 1 hour expiry by default
             }
+            if metadata:
+                questions_doc.update(metadata)
             
             self.questions_collection.document(cache_key).set(questions_doc)
             return True
@@ -355,6 +545,20 @@ class FirebaseStorageManager:
             print(f"Error getting questions cache: {e}")
             return None
     
+    def get_questions_cache_entry(self, cache_key):
+        """Get a cached questions document from Firestore, including expired ones"""
+        try:
+            questions_doc = self.questions_collection.document(cache_key).get()
+            
+            if questions_doc.exists:
+                return questions_doc.to_dict()
+            
+            return None
+            
+        except Exception as e:
+            print(f"Error getting questions cache entry: {e}")
+            return None
+    
     def generate_pdf_report(self, user_id, report_id):
         """Generate PDF report and return file path"""
         try:
@@ -509,36 +713,166 @@ class FirebaseStorageManager:
     def delete_report(self, user_id, report_id):
         """Delete a specific report"""
         try:
-            report_doc = self.reports_collection.document(report_id).get()
-            
-            if report_doc.exists:
+            report_ref = self.reports_collection.document(report_id)
+            summary_ref = self.report_summaries_collection.document(report_id)
+            stats_ref = self.user_stats_collection.document(user_id)
+            
+            @firestore.transactional
+            def delete(transaction):
+                report_doc = report_ref.get(transaction=transaction)
+                if not report_doc.exists:
+                    return None, None
                 report_data = report_doc.to_dict()
                 # Verify the report belongs to the user
-                if report_data.get('user_id') == user_id:
-                    self.reports_collection.document(report_id).delete()
-                    return True
-            
-            return False
+                if report_data.get('user_id') != user_id:
+                    return None, None
+                
+                stats_doc = stats_ref.get(transaction=transaction)
+                transaction.delete(report_ref)
+                transaction.delete(summary_ref)
+                stats = None
+                if stats_doc.exists:
+                    stats = UserStats(stats_doc.to_dict())
+                    stats.remove_report(report_data)
+                    transaction.set(stats_ref, stats.to_dict())
+                return report_data, stats
+            
+            report_data, stats = delete(self.db.transaction())
+            if not report_data:
+                return False
+            
+            if self.cache:
+                self.cache.invalidate('report', report_id)
+                self._cache_user_stats(user_id, stats)
+            self.update_leaderboards(report_data, removed=True)
+            return True
             
         except Exception as e:
             print(f"Error deleting report: {e}")
             return False
     
-    def cleanup_expired_sessions(self):
-        """Clean up expired interview sessions"""
+    def update_leaderboards(self, report_data, removed=False):
+        """Offer a saved report to its leaderboards, or take a deleted one off them.
+        
+        Runs after the report is committed, in its own transaction, so contention
+        on the shared leaderboard documents never fails a report save.
+        """
         try:
-            # Get sessions older than 24 hours
-            cutoff_time = datetime.now().timestamp() - (24 * 60 * 60)
+            entry = Leaderboard.entry(report_data)
+            if entry is None:
+                return
+            keys = Leaderboard.keys_for(entry)
+            refs = [self.leaderboards_collection.document(Leaderboard.document_id(key)) for key in keys]
+            
+            @firestore.transactional
+            def update(transaction):
+                snapshots = {snapshot.id: snapshot for snapshot in self.db.get_all(refs, transaction=transaction)}
+                for key, ref in zip(keys, refs):
+                    snapshot = snapshots.get(ref.id)
+                    board = Leaderboard(snapshot.to_dict().get('entries') if snapshot and snapshot.exists else None)
+                    changed = board.remove(entry['report_id']) if removed else board.add(entry)
+                    if changed:
+                        transaction.set(ref, {
+                            'key': key,
+                            'entries': board.entries(),
+                            'updated_at': datetime.now().isoformat()
+                        })
+            
+            update(self.db.transaction())
             
-            expired_sessions = self.interviews_collection.where(
-                'created_at', '<', datetime.fromtimestamp(cutoff_time).isoformat()
-            ).stream()
-            
-            for session in expired_sessions:
-                session.reference.delete()
+        except Exception as e:
+            print(f"⚠️ Error updating leaderboards: {e}")
+    
+    def get_leaderboard(self, limit=10, domain=None, job_role=None, window='all'):
+        """Get anonymous leaderboard, optionally for one domain/job role and the current month or week"""
+        try:
+            key = Leaderboard.key(domain, job_role, window)
+            board_doc = self.leaderboards_collection.document(Leaderboard.document_id(key)).get()
+            entries = board_doc.to_dict().get('entries') if board_doc.exists else None
+            return Leaderboard(entries).top(limit)
             
+        except Exception as e:
+            print(f"Error getting leaderboard: {e}")
+            return []
+    
+    def rebuild_leaderboards(self):
+        """Recompute every leaderboard from all reports. Returns the number of boards."""
+        boards = {}
+        fields = ['id', 'created_at', 'setup.domain', 'setup.job_role', 'results.overall_score']
+        for report_doc in self.reports_collection.select(fields).stream():
+            entry = Leaderboard.entry(report_doc.to_dict())
+            if entry is None:
+                continue
+            for key in Leaderboard.keys_for(entry):
+                boards.setdefault(key, Leaderboard()).add(entry)
+        
+        # Replace the stored boards (and drop ones no report belongs to any more), 500 writes per batch
+        doc_ids = {Leaderboard.document_id(key) for key in boards}
+        writes = [
+            ('delete', doc.reference, None)
+            for doc in self.leaderboards_collection.select(['key']).stream() if doc.id not in doc_ids
+        ]
+        writes += [
+            ('set', self.leaderboards_collection.document(Leaderboard.document_id(key)),
+             {'key': key, 'entries': board.entries(), 'updated_at': datetime.now().isoformat()})
+            for key, board in boards.items()
+        ]
+        for start in range(0, len(writes), 500):
+            batch = self.db.batch()
+            for operation, ref, data in writes[start:start + 500]:
+                if operation == 'delete':
+                    batch.delete(ref)
+                else:
+                    batch.set(ref, data)
+            batch.commit()
+        
+        print(f"🏆 Rebuilt {len(boards)} leaderboards")
+        return len(boards)
+    
+    def cleanup_expired_sessions(self):
+        """Clean up expired interview sessions"""
+        try:
+            self.delete_expired_sessions(datetime.now().timestamp() - Config.SESSION_MAX_AGE)
             return True
             
         except Exception as e:
             print(f"Error cleaning up expired sessions: {e}")
             return False
+    
+    def delete_expired_sessions(self, cutoff_timestamp, page_size=None, dry_run=False):
+        """Delete interview sessions created before the cutoff, one page per batched write.
+        
+        Only document ids are read. Returns {'pages': ..., 'deleted': ...}; with
+        dry_run the sessions are counted but kept.
+        """
+        # Firestore batches take at most 500 writes
+        page_size = min(page_size or Config.SESSION_SWEEP_PAGE_SIZE, 500)
+        query = self.interviews_collection.where(
+            'created_at', '<', datetime.fromtimestamp(cutoff_timestamp).isoformat()
+        ).order_by('created_at').select(['created_at']).limit(page_size)
+        
+        summary = {'pages': 0, 'deleted': 0}
+        last = None
+        while True:
+            page = list((query.start_after(last) if last else query).stream())
+            if not page:
+                break
+            
+            if not dry_run:
+                batch = self.db.batch()
+                for snapshot in page:
+                    batch.delete(snapshot.reference)
+                batch.commit()
+                if self.cache:
+                    for snapshot in page:
+                        self.cache.invalidate('interview', snapshot.id)
+            
+            summary['pages'] += 1
+            summary['deleted'] += len(page)
+            if len(page) < page_size:
+                break
+            # Deleted sessions drop out of the query; only a dry run has to page past them
+            if dry_run:
+                last = page[-1]
+        
+        return summary
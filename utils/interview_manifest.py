@@ -0,0 +1,39 @@
+import hashlib
+import hmac
+from config import Config
+
+
+class InterviewManifest:
+    """Signed description of an interview that the interview page navigates against.
+
+    The interview page gets the manifest once and moves between questions
+    without asking the server. It sends the manifest back with answer
+    autosaves; a valid signature lets the server bound-check the reported
+    position without loading the questions.
+    """
+
+    @staticmethod
+    def _signature(interview_id, question_count):
+        message = f'{interview_id}:{question_count}'.encode('utf-8')
+        return hmac.new(Config.SECRET_KEY.encode('utf-8'), message, hashlib.sha256).hexdigest()
+
+    @classmethod
+    def create(cls, interview_id, question_count):
+        return {
+            'interview_id': interview_id,
+            'question_count': question_count,
+            'signature': cls._signature(interview_id, question_count)
+        }
+
+    @classmethod
+    def verify(cls, manifest, interview_id):
+        """Return the question count of a valid manifest for ``interview_id``, else None"""
+        if not isinstance(manifest, dict) or manifest.get('interview_id') != interview_id:
+            return None
+        question_count = manifest.get('question_count')
+        signature = manifest.get('signature')
+        if not isinstance(question_count, int) or not isinstance(signature, str):
+            return None
+        if not hmac.compare_digest(signature, cls._signature(interview_id, question_count)):
+            return None
+        return question_count
@@ -0,0 +1,220 @@
+import atexit
+import json
+import os
+import queue
+import threading
+from config import Config
+from utils.cache import LRUCache
+
+
+class MemoryQuestionTier:
+    """Questions of recent interviews in this process"""
+
+    name = 'memory'
+
+    def __init__(self, max_entries=None, ttl=None):
+        self.entries = LRUCache(
+            max_entries=max_entries or Config.INTERVIEW_QUESTION_MEMORY_ENTRIES,
+            ttl=ttl or Config.SESSION_MAX_AGE
+        )
+
+    def get(self, interview_id):
+        # Kept as JSON: every reader gets its own copy, faster than deep-copying the dicts
+        encoded = self.entries.get(interview_id)
+        return json.loads(encoded) if encoded is not None else None
+
+    def put(self, interview_id, questions):
+        self.entries.set(interview_id, json.dumps(questions))
+
+    def delete(self, interview_id):
+        self.entries.delete(interview_id)
+
+
+class FileQuestionTier:
+    """Questions as ``questions_<id>.json`` files in SESSION_FILE_DIR (pruned by the session sweeper)"""
+
+    name = 'file'
+
+    def __init__(self, directory=None):
+        self.directory = directory or Config.SESSION_FILE_DIR
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, interview_id):
+        return os.path.join(self.directory, f'questions_{interview_id}.json')
+
+    def get(self, interview_id):
+        try:
+            with open(self._path(interview_id), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def put(self, interview_id, questions):
+        # Write then rename so a concurrent reader never sees half a file
+        path = self._path(interview_id)
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(questions, f)
+        os.replace(temp_path, path)
+
+    def delete(self, interview_id):
+        try:
+            os.remove(self._path(interview_id))
+        except FileNotFoundError:
+            pass
+
+
+class FirestoreQuestionTier:
+    """The ``questions`` field of the Firestore interview session"""
+
+    name = 'firestore'
+
+    def __init__(self, storage_manager):
+        self.storage_manager = storage_manager
+
+    def get(self, interview_id):
+        session_doc = self.storage_manager.get_interview_session(interview_id)
+        if not session_doc:
+            return None
+        session_data = session_doc.get('session_data', {})
+        if session_data.get('generation_status', 'complete') != 'complete':
+            # Still streaming in; only the final question list is served from the tiers
+            return None
+        return session_data.get('questions') or None
+
+    def put(self, interview_id, questions):
+        if not self.storage_manager.update_interview_session_fields(interview_id, {'questions': questions}):
+            raise RuntimeError('Firestore update failed')
+
+    def delete(self, interview_id):
+        # The session document is deleted along with the rest of the interview
+        pass
+
+
+class InterviewQuestionStore:
+    """Tiered store for the final question list of each interview.
+
+    Tiers are listed fastest first (``INTERVIEW_QUESTION_TIERS``, e.g.
+    ``memory,firestore``). Reads return the first hit and copy it into the
+    faster tiers that missed. A save is written synchronously to every tier
+    up to and including the durability tier (``INTERVIEW_QUESTION_DURABILITY``)
+    and mirrored to the slower ones by a background thread, so a request
+    only waits for the copy it needs to survive. Tiers that already hold the
+    questions (the Firestore session is created with them) are passed as
+    ``written`` and skipped.
+
+    Failures in a tier are counted and logged and the next tier is tried;
+    ``stats()`` reports hits, misses, writes and failures per tier.
+    """
+
+    TIER_TYPES = {
+        'memory': MemoryQuestionTier,
+        'file': FileQuestionTier,
+        'firestore': FirestoreQuestionTier
+    }
+
+    def __init__(self, tiers, durability=None):
+        if not tiers:
+            raise ValueError('At least one interview question tier is needed')
+        self.tiers = tiers
+        names = [tier.name for tier in tiers]
+        durability = durability or names[-1]
+        if durability not in names:
+            raise ValueError(f'Durability tier {durability} is not one of {names}')
+        self.sync_count = names.index(durability) + 1
+        self._lock = threading.Lock()
+        self._stats = {
+            tier.name: {'hits': 0, 'misses': 0, 'writes': 0, 'mirrored_writes': 0, 'failures': 0}
+            for tier in tiers
+        }
+        self._mirror_queue = queue.Queue()
+        self._thread = None
+        if self.sync_count < len(tiers):
+            self._thread = threading.Thread(target=self._run_mirror, name='question-mirror', daemon=True)
+            self._thread.start()
+            atexit.register(self.drain)
+
+    @classmethod
+    def from_config(cls, storage_manager):
+        """Build the store from INTERVIEW_QUESTION_TIERS and INTERVIEW_QUESTION_DURABILITY"""
+        tiers = []
+        for name in Config.INTERVIEW_QUESTION_TIERS:
+            if name not in cls.TIER_TYPES:
+                raise ValueError(f'Unknown interview question tier: {name}')
+            tier_type = cls.TIER_TYPES[name]
+            tiers.append(tier_type(storage_manager) if tier_type is FirestoreQuestionTier else tier_type())
+        return cls(tiers, durability=Config.INTERVIEW_QUESTION_DURABILITY)
+
+    def get(self, interview_id):
+        """Return the questions from the fastest tier that has them, or None"""
+        for position, tier in enumerate(self.tiers):
+            try:
+                questions = tier.get(interview_id)
+            except Exception as e:
+                self._count(tier.name, 'failures')
+                print(f"⚠️ Question tier {tier.name} read failed: {e}")
+                continue
+            if questions:
+                self._count(tier.name, 'hits')
+                self._store(interview_id, questions, self.tiers[:position])
+                return questions
+            self._count(tier.name, 'misses')
+        return None
+
+    def save(self, interview_id, questions, written=()):
+        """Store the final question list. Returns False if a synchronous write failed."""
+        return self._store(interview_id, questions, [tier for tier in self.tiers if tier.name not in written])
+
+    def delete(self, interview_id):
+        """Forget an interview's questions in every tier"""
+        for tier in self.tiers:
+            try:
+                tier.delete(interview_id)
+            except Exception as e:
+                self._count(tier.name, 'failures')
+                print(f"⚠️ Question tier {tier.name} delete failed: {e}")
+
+    def drain(self):
+        """Wait for pending mirror writes (called at exit)"""
+        if self._thread:
+            self._mirror_queue.join()
+
+    def stats(self):
+        with self._lock:
+            tiers = {name: dict(counters) for name, counters in self._stats.items()}
+        return {
+            'tiers': tiers,
+            'durability': self.tiers[self.sync_count - 1].name,
+            'mirror_pending': self._mirror_queue.qsize()
+        }
+
+    def _store(self, interview_id, questions, tiers):
+        ok = True
+        for tier in tiers:
+            if self.tiers.index(tier) < self.sync_count:
+                ok = self._write(tier, interview_id, questions, 'writes') and ok
+            else:
+                self._mirror_queue.put((tier, interview_id, questions))
+        return ok
+
+    def _write(self, tier, interview_id, questions, counter):
+        try:
+            tier.put(interview_id, questions)
+            self._count(tier.name, counter)
+            return True
+        except Exception as e:
+            self._count(tier.name, 'failures')
+            print(f"⚠️ Question tier {tier.name} write failed: {e}")
+            return False
+
+    def _run_mirror(self):
+        while True:
+            tier, interview_id, questions = self._mirror_queue.get()
+            try:
+                self._write(tier, interview_id, questions, 'mirrored_writes')
+            finally:
+                self._mirror_queue.task_done()
+
+    def _count(self, tier_name, counter):
+        with self._lock:
+            self._stats[tier_name][counter] += 1
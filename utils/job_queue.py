@@ -0,0 +1,298 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from config import Config
+
+
+class JobQueue:
+    """Persistent job queue stored in SQLite.
+
+    Jobs survive restarts and are shared by every worker process using the
+    same database. Each job may carry an idempotency key; enqueueing the same
+    key again returns the existing job instead of creating a new one.
+
+    A claim stamps the job with a worker token. The worker heartbeats while
+    the job runs, and progress, completion and failure only apply while the
+    token still holds the job, so a worker whose job was requeued cannot
+    overwrite the new run. A job is attempted at most ``JOB_MAX_ATTEMPTS``
+    times; after that it is moved to the ``dead`` status and left for
+    inspection.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or Config.JOB_QUEUE_PATH
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id TEXT PRIMARY KEY, kind TEXT NOT NULL, idempotency_key TEXT UNIQUE, '
+                'owner TEXT, payload TEXT NOT NULL, status TEXT NOT NULL, '
+                'progress TEXT, result TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, '
+                'created_at REAL NOT NULL, updated_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)')
+            columns = {row['name'] for row in conn.execute('PRAGMA table_info(jobs)')}
+            if 'worker' not in columns:
+                # Databases created before claims carried a worker token
+                conn.execute('ALTER TABLE jobs ADD COLUMN worker TEXT')
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, kind, payload, idempotency_key=None, owner=None):
+        """Add a job and return it.
+
+        A failed job with the same key, or a running one whose worker stopped
+        heartbeating, is queued again, or moved to ``dead`` once it has used
+        all its attempts.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            if idempotency_key:
+                row = conn.execute(
+                    'SELECT * FROM jobs WHERE idempotency_key = ?', (idempotency_key,)
+                ).fetchone()
+                stale = row and row['status'] == 'running' and row['updated_at'] < now - Config.JOB_STALE_TIMEOUT
+                if row and row['status'] != 'failed' and not stale:
+                    return self._to_job(row)
+                if row and row['attempts'] >= Config.JOB_MAX_ATTEMPTS:
+                    conn.execute(
+                        "UPDATE jobs SET status = 'dead', worker = NULL, updated_at = ? WHERE id = ?", (now, row['id'])
+                    )
+                    return self._get(conn, row['id'])
+                if row:
+                    conn.execute(
+                        "UPDATE jobs SET status = 'queued', worker = NULL, payload = ?, progress = NULL, "
+                        'error = NULL, updated_at = ? WHERE id = ?',
+                        (json.dumps(payload), now, row['id'])
+                    )
+                    return self._get(conn, row['id'])
+
+            job_id = str(uuid.uuid4())
+            conn.execute(
+                'INSERT INTO jobs (id, kind, idempotency_key, owner, payload, status, created_at, updated_at) '
+                "VALUES (?, ?, ?, ?, ?, 'queued', ?, ?)",
+                (job_id, kind, idempotency_key, owner, json.dumps(payload), now, now)
+            )
+            return self._get(conn, job_id)
+
+    def get(self, job_id):
+        with self._connect() as conn:
+            return self._get(conn, job_id)
+
+    def claim(self, kinds):
+        """Atomically take the oldest queued job of the given kinds, or return None.
+
+        The returned job carries the ``worker`` token to pass to ``heartbeat``,
+        ``update_progress``, ``complete`` and ``fail``.
+        """
+        placeholders = ', '.join('?' for _ in kinds)
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                f"SELECT id FROM jobs WHERE status = 'queued' AND kind IN ({placeholders}) "
+                'ORDER BY created_at LIMIT 1',
+                tuple(kinds)
+            ).fetchone()
+            if not row:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, attempts = attempts + 1, updated_at = ? "
+                'WHERE id = ?',
+                (uuid.uuid4().hex, time.time(), row['id'])
+            )
+            return self._get(conn, row['id'])
+
+    def heartbeat(self, job_id, worker):
+        """Mark a running job as alive. Returns False if ``worker`` no longer holds it."""
+        return self._update(job_id, worker=worker)
+
+    def update_progress(self, job_id, progress, worker=None):
+        return self._update(job_id, worker=worker, progress=json.dumps(progress))
+
+    def complete(self, job_id, result, worker=None):
+        return self._update(job_id, worker=worker, status='completed', result=json.dumps(result))
+
+    def fail(self, job_id, error, worker=None):
+        return self._update(job_id, worker=worker, status='failed', error=str(error))
+
+    def requeue_stale(self, timeout=None):
+        """Queue running jobs again whose worker stopped heartbeating, e.g. after a crash.
+
+        Jobs that have used all their attempts are moved to ``dead`` instead.
+        Returns the number of jobs requeued.
+        """
+        timeout = timeout or Config.JOB_STALE_TIMEOUT
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute(
+                "UPDATE jobs SET status = 'dead', worker = NULL, error = ?, updated_at = ? "
+                "WHERE status = 'running' AND updated_at < ? AND attempts >= ?",
+                (f'Worker stopped {Config.JOB_MAX_ATTEMPTS} times', now, now - timeout, Config.JOB_MAX_ATTEMPTS)
+            )
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL, updated_at = ? "
+                "WHERE status = 'running' AND updated_at < ?",
+                (now, now - timeout)
+            )
+            return cursor.rowcount
+
+    def purge(self, max_age=None):
+        """Delete finished jobs older than ``max_age`` seconds"""
+        max_age = max_age or Config.JOB_RETENTION
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN ('completed', 'failed') AND updated_at < ?",
+                (time.time() - max_age,)
+            )
+            return cursor.rowcount
+
+    def stats(self):
+        with self._connect() as conn:
+            rows = conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def _update(self, job_id, worker=None, **fields):
+        """Update a job, only while ``worker`` holds it when given. Returns True if a row changed."""
+        fields['updated_at'] = time.time()
+        assignments = ', '.join(f'{name} = ?' for name in fields)
+        query = f'UPDATE jobs SET {assignments} WHERE id = ?'
+        params = (*fields.values(), job_id)
+        if worker is not None:
+            query += " AND worker = ? AND status = 'running'"
+            params += (worker,)
+        with self._connect() as conn:
+            return conn.execute(query, params).rowcount > 0
+
+    def _get(self, conn, job_id):
+        row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    @staticmethod
+    def _to_job(row):
+        return {
+            'id': row['id'],
+            'kind': row['kind'],
+            'owner': row['owner'],
+            'payload': json.loads(row['payload']),
+            'status': row['status'],
+            'progress': json.loads(row['progress']) if row['progress'] else None,
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': row['error'],
+            'attempts': row['attempts'],
+            'worker': row['worker'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at']
+        }
+
+
+class JobWorker:
+    """Runs queued jobs on a pool of daemon threads.
+
+    ``handlers`` maps a job kind to ``handler(payload, report_progress)``,
+    which returns the job result or raises to fail the job. Jobs left running
+    by a worker that died are requeued every ``JOB_HEARTBEAT_INTERVAL``.
+    """
+
+    def __init__(self, queue, handlers, workers=None, poll_interval=None):
+        self.queue = queue
+        self.handlers = handlers
+        self.workers = workers or Config.JOB_WORKERS
+        self.poll_interval = poll_interval or Config.JOB_POLL_INTERVAL
+        self._threads = []
+        self._stop = threading.Event()
+        self._requeue_lock = threading.Lock()
+        self._last_requeue = 0
+
+    def start(self):
+        if self._threads:
+            return
+        self.requeue_stale(force=True)
+        self.queue.purge()
+
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._loop, name=f'job-worker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+
+    def requeue_stale(self, force=False):
+        """Requeue jobs of dead workers, at most once per JOB_HEARTBEAT_INTERVAL unless forced"""
+        with self._requeue_lock:
+            now = time.time()
+            if not force and now - self._last_requeue < Config.JOB_HEARTBEAT_INTERVAL:
+                return 0
+            self._last_requeue = now
+        requeued = self.queue.requeue_stale()
+        if requeued:
+            print(f"🔁 Requeued {requeued} interrupted jobs")
+        return requeued
+
+    def run_pending(self):
+        """Run queued jobs in the calling thread until the queue is empty"""
+        while self.run_one():
+            pass
+
+    def run_one(self):
+        job = self.queue.claim(list(self.handlers))
+        if not job:
+            return False
+
+        print(f"⚙️ Running {job['kind']} job {job['id']} (attempt {job['attempts']})")
+        worker = job['worker']
+        done = threading.Event()
+
+        def heartbeat():
+            while not done.wait(Config.JOB_HEARTBEAT_INTERVAL):
+                try:
+                    if not self.queue.heartbeat(job['id'], worker):
+                        return
+                except Exception as e:
+                    print(f"⚠️ Job {job['id']} heartbeat failed: {e}")
+
+        threading.Thread(target=heartbeat, name=f"job-heartbeat-{job['id'][:8]}", daemon=True).start()
+        try:
+            result = self.handlers[job['kind']](
+                job['payload'], lambda progress: self.queue.update_progress(job['id'], progress, worker=worker)
+            )
+            if self.queue.complete(job['id'], result, worker=worker):
+                print(f"✅ Job {job['id']} completed")
+            else:
+                print(f"⚠️ Job {job['id']} finished after it was requeued; result dropped")
+        except Exception as e:
+            print(f"❌ Job {job['id']} failed: {e}")
+            self.queue.fail(job['id'], e, worker=worker)
+        finally:
+            done.set()
+        return True
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.requeue_stale()
+                if not self.run_one():
+                    self._stop.wait(self.poll_interval)
+            except Exception as e:
+                print(f"⚠️ Job worker error: {e}")
+                self._stop.wait(self.poll_interval)
@@ -0,0 +1,109 @@
+import heapq
+from datetime import datetime
+from urllib.parse import quote
+from config import Config
+
+
+class Leaderboard:
+    """Bounded top-K board of report scores for one scope and time window.
+
+    Every saved report is offered to the boards it belongs to (see
+    ``keys_for``): all reports, its domain, its job role and the domain and
+    job role pair, each for all time, its month and its ISO week. A board
+    keeps at most ``LEADERBOARD_SIZE`` entries in a min-heap, so adding a
+    report costs O(log K) and reading a board never touches the reports.
+    """
+
+    WINDOWS = ('all', 'month', 'week')
+
+    def __init__(self, entries=None, size=None):
+        self.size = size or Config.LEADERBOARD_SIZE
+        # Min-heap of (score, created_at, report_id, entry)
+        self.heap = [(e['score'], e['date'], e['report_id'], e) for e in (entries or [])]
+        heapq.heapify(self.heap)
+
+    @staticmethod
+    def entry(report):
+        """Leaderboard entry for a report, or None if it has no score"""
+        results = report.get('results')
+        if not isinstance(results, dict) or 'overall_score' not in results:
+            return None
+        setup = report.get('setup', {})
+        return {
+            'report_id': report['id'],
+            'score': results['overall_score'],
+            'domain': setup.get('domain', 'Unknown'),
+            'job_role': setup.get('job_role', 'Unknown'),
+            'date': report.get('created_at', '')
+        }
+
+    @classmethod
+    def key(cls, domain=None, job_role=None, window='all', when=None):
+        """Board key such as ``all|domain=Python|role=*``; ``when`` picks the month or week"""
+        if window not in cls.WINDOWS:
+            raise ValueError(f'Unknown leaderboard window: {window}')
+        if window == 'all':
+            period = 'all'
+        else:
+            when = datetime.fromisoformat(when) if isinstance(when, str) else (when or datetime.now())
+            if window == 'month':
+                period = when.strftime('%Y-%m')
+            else:
+                year, week, _ = when.isocalendar()
+                period = f'{year}-W{week:02d}'
+        return f"{period}|domain={domain or '*'}|role={job_role or '*'}"
+
+    @classmethod
+    def keys_for(cls, entry):
+        """Every board a report entry is offered to"""
+        keys = []
+        for window in cls.WINDOWS:
+            for domain in (None, entry['domain']):
+                for job_role in (None, entry['job_role']):
+                    keys.append(cls.key(domain, job_role, window, when=entry['date'] or None))
+        return keys
+
+    @staticmethod
+    def document_id(key):
+        """Firestore-safe document id for a board key (domains like 'AI/ML' contain slashes)"""
+        return quote(key, safe='')
+
+    def add(self, entry):
+        """Offer an entry. Returns True if the board changed."""
+        if any(item[2] == entry['report_id'] for item in self.heap):
+            return False
+        item = (entry['score'], entry['date'], entry['report_id'], entry)
+        if len(self.heap) < self.size:
+            heapq.heappush(self.heap, item)
+            return True
+        if item[:3] <= self.heap[0][:3]:
+            return False
+        heapq.heapreplace(self.heap, item)
+        return True
+
+    def remove(self, report_id):
+        """Drop a deleted report. Returns True if it was on the board."""
+        remaining = [item for item in self.heap if item[2] != report_id]
+        if len(remaining) == len(self.heap):
+            return False
+        self.heap = remaining
+        heapq.heapify(self.heap)
+        return True
+
+    def entries(self):
+        """Entries best first, for storage"""
+        return [item[3] for item in sorted(self.heap, key=lambda item: item[:3], reverse=True)]
+
+    def top(self, limit=10):
+        """Anonymous ranking of the best ``limit`` entries"""
+        return [
+            {
+                'rank': i + 1,
+                'score': entry['score'],
+                'domain': entry['domain'],
+                'job_role': entry['job_role'],
+                'date': entry['date'][:10],
+                'anonymous_id': f"User{i+1:03d}"
+            }
+            for i, entry in enumerate(self.entries()[:limit])
+        ]
@@ -0,0 +1,266 @@
+import hashlib
+import inspect
+import json
+import random
+import re
+import threading
+import time
+import google.ai.generativelanguage as glm
+import google.generativeai as genai
+from google.generativeai import client as genai_client
+from google.generativeai.types import generation_types
+from config import Config
+
+
+class LLMResponse:
+    """Minimal response object exposing ``text`` like the Gemini SDK responses"""
+
+    def __init__(self, text):
+        self.text = text
+
+
+class LLMBackend:
+    """Interface for the language model behind AIHelper.
+
+    ``generate_content`` returns an object with a ``text`` attribute, or an
+    iterable of such chunks when ``stream`` is true. ``timeout`` is the
+    number of seconds the backend may spend on the request.
+    """
+
+    name = None
+
+    def generate_content(self, prompt, stream=False, timeout=None):
+        raise NotImplementedError
+
+
+class GeminiBackend(LLMBackend):
+    """Google Gemini through the google.generativeai SDK.
+
+    The pinned SDK (0.3.0) has no per-request timeout: extra keyword
+    arguments to ``GenerativeModel.generate_content`` end up in
+    ``GenerateContentRequest`` and are rejected. With a timeout the backend
+    therefore makes the same calls as the SDK but passes the timeout to the
+    generated GAPIC client as its gRPC deadline, so a slow request is
+    cancelled instead of left running. For streams the deadline covers the
+    whole stream.
+    """
+
+    name = 'gemini'
+    # Keyword arguments passed to the SDK's generate_content; see check_sdk_signature
+    SDK_KWARGS = ('stream',)
+    # GAPIC client methods called with a deadline
+    CLIENT_METHODS = ('generate_content', 'stream_generate_content')
+
+    def __init__(self, model_name=None, api_key=None):
+        genai.configure(api_key=api_key or Config.GEMINI_API_KEY)
+        self.model = genai.GenerativeModel(model_name or Config.GEMINI_MODEL)
+
+    @classmethod
+    def check_sdk_signature(cls):
+        """Fail fast if the installed SDK does not support the calls this backend makes.
+
+        ``GenerativeModel.generate_content`` accepts ``**kwargs`` and only
+        rejects unknown ones when the request is built, so an unsupported
+        keyword would otherwise surface as a ValueError on every real call.
+        The deadline path also needs ``GenerativeModel._prepare_request`` and
+        a ``timeout`` on the GAPIC client methods.
+        """
+        parameters = inspect.signature(genai.GenerativeModel.generate_content).parameters
+        missing = [name for name in cls.SDK_KWARGS
+                   if name not in parameters or parameters[name].kind == inspect.Parameter.VAR_KEYWORD]
+        if not hasattr(genai.GenerativeModel, '_prepare_request'):
+            missing.append('GenerativeModel._prepare_request')
+        client_type = glm.GenerativeServiceClient
+        missing += [f'{method}(timeout=)' for method in cls.CLIENT_METHODS
+                    if 'timeout' not in inspect.signature(getattr(client_type, method)).parameters]
+        if missing:
+            raise RuntimeError(
+                f"google-generativeai {getattr(genai, '__version__', '?')} does not support "
+                f"{', '.join(missing)}; check the pinned SDK version"
+            )
+
+    def generate_content(self, prompt, stream=False, timeout=None):
+        if not timeout:
+            return self.model.generate_content(prompt, stream=stream)
+
+        # What GenerativeModel.generate_content does in 0.3.0, plus the deadline
+        request = self.model._prepare_request(contents=prompt)
+        if self.model._client is None:
+            self.model._client = genai_client.get_default_generative_client()
+        if stream:
+            with generation_types.rewrite_stream_error():
+                iterator = self.model._client.stream_generate_content(request, timeout=timeout)
+            return generation_types.GenerateContentResponse.from_iterator(iterator)
+        response = self.model._client.generate_content(request, timeout=timeout)
+        return generation_types.GenerateContentResponse.from_response(response)
+
+
+class StubBackendError(Exception):
+    """Simulated provider error; ``code`` makes it retryable like a 503 from the API"""
+
+    def __init__(self, message, code=503):
+        super().__init__(message)
+        self.code = code
+
+
+class StubBackend(LLMBackend):
+    """Local stand-in that answers every AIHelper prompt without network access.
+
+    Responses are derived from a hash of the prompt, so the same prompt
+    always gets the same answer. Latency and the share of failed calls are
+    configurable, and failures are drawn from a seeded generator so a run
+    can be reproduced.
+    """
+
+    name = 'stub'
+    STREAM_CHUNK_SIZE = 80
+
+    def __init__(self, latency=None, error_rate=None, seed=None):
+        self.latency = Config.LLM_STUB_LATENCY if latency is None else latency
+        self.error_rate = Config.LLM_STUB_ERROR_RATE if error_rate is None else error_rate
+        self._random = random.Random(Config.LLM_STUB_SEED if seed is None else seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def generate_content(self, prompt, stream=False, timeout=None):
+        with self._lock:
+            self.calls += 1
+            failed = self._random.random() < self.error_rate
+
+        if timeout is not None and self.latency > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f'Stub backend took longer than {timeout}s')
+
+        text = self._respond(prompt)
+        if stream:
+            return self._stream(text, failed)
+
+        time.sleep(self.latency)
+        if failed:
+            raise StubBackendError('Simulated provider error')
+        return LLMResponse(text)
+
+    def _stream(self, text, failed):
+        chunks = [text[i:i + self.STREAM_CHUNK_SIZE] for i in range(0, len(text), self.STREAM_CHUNK_SIZE)]
+        for i, chunk in enumerate(chunks):
+            time.sleep(self.latency / len(chunks))
+            if failed and i == len(chunks) // 2:
+                raise StubBackendError('Simulated provider error mid-stream')
+            yield LLMResponse(chunk)
+
+    def _respond(self, prompt):
+        if 'Respond ONLY with a JSON array' in prompt:
+            return self._batch_evaluation(prompt)
+        if 'CLARITY_SCORE' in prompt:
+            return self._evaluation(prompt)
+        if re.search(r'Generate \d+', prompt):
+            return self._questions(prompt)
+        return 'OK'
+
+    def _questions(self, prompt):
+        count = int(re.search(r'Generate (\d+)', prompt).group(1))
+        question_type = self._field(prompt, r'Question type: (.+)', 'Short Answer')
+        difficulty = self._field(prompt, r'Difficulty: (\w+)', 'Medium')
+        topic = self._field(prompt, r'focusing on (.+)\.', 'software engineering')
+        seed = self._hash(prompt)
+
+        questions = []
+        for i in range(count):
+            number = (seed + i) % 1000
+            is_mcq = question_type == 'MCQ' or (question_type == 'AI Choice' and i % 2 == 0)
+            if is_mcq:
+                questions.append({
+                    'text': f'Which statement about {topic} concept #{number} is correct?',
+                    'type': 'mcq',
+                    'options': [f'{letter}. Option {letter} for concept #{number}' for letter in 'ABCD'],
+                    'correct_answer': 'ABCD'[number % 4],
+                    'category': topic,
+                    'difficulty': difficulty
+                })
+            else:
+                questions.append({
+                    'text': f'Explain how you would apply {topic} concept #{number} in a production system.',
+                    'type': 'short',
+                    'category': topic,
+                    'difficulty': difficulty
+                })
+        return '```json\n' + json.dumps(questions, indent=2) + '\n```'
+
+    def _evaluation(self, prompt):
+        answer = self._field(prompt, r'Answer: (.*)', '')
+        scores = self._scores(answer)
+        return (
+            f"CLARITY_SCORE: {scores['clarity']}\n"
+            f"CLARITY_FEEDBACK: The answer is structured reasonably well.\n"
+            f"CORRECTNESS_SCORE: {scores['correctness']}\n"
+            f"CORRECTNESS_FEEDBACK: The main points are accurate.\n"
+            f"COMPLETENESS_SCORE: {scores['completeness']}\n"
+            f"COMPLETENESS_FEEDBACK: More examples would make the answer complete.\n"
+            f"OVERALL_SCORE: {scores['overall']}\n"
+            f"OVERALL_FEEDBACK: A solid answer with room for more depth.\n"
+            f"SUGGESTED_RESOURCES: Official documentation guides, Practical system design exercises, "
+            f"Hands-on tutorial projects"
+        )
+
+    def _batch_evaluation(self, prompt):
+        match = re.search(r'Answers:\s*(\[.*\])\s*Respond ONLY', prompt, re.DOTALL)
+        items = json.loads(match.group(1)) if match else []
+        evaluations = []
+        for item in items:
+            scores = self._scores(item.get('answer', ''))
+            evaluations.append({
+                'id': item.get('id'),
+                'clarity_score': scores['clarity'],
+                'clarity_feedback': 'The answer is structured reasonably well.',
+                'correctness_score': scores['correctness'],
+                'correctness_feedback': 'The main points are accurate.',
+                'completeness_score': scores['completeness'],
+                'completeness_feedback': 'More examples would make the answer complete.',
+                'overall_score': scores['overall'],
+                'overall_feedback': 'A solid answer with room for more depth.',
+                'suggested_resources': [
+                    'Official documentation guides',
+                    'Practical system design exercises',
+                    'Hands-on tutorial projects'
+                ]
+            })
+        return json.dumps(evaluations, indent=2)
+
+    def _scores(self, answer):
+        """Deterministic scores that grow with answer length"""
+        base = min(8, 3 + len(answer.split()) // 15)
+        jitter = self._hash(answer)
+        clarity = min(10, base + jitter % 3)
+        correctness = min(10, base + (jitter // 3) % 3)
+        completeness = min(10, base + (jitter // 9) % 3)
+        return {
+            'clarity': clarity,
+            'correctness': correctness,
+            'completeness': completeness,
+            'overall': round((clarity + correctness + completeness) / 3)
+        }
+
+    @staticmethod
+    def _field(prompt, pattern, default):
+        match = re.search(pattern, prompt)
+        return match.group(1).strip() if match else default
+
+    @staticmethod
+    def _hash(text):
+        return int(hashlib.sha1(text.encode('utf-8')).hexdigest()[:8], 16)
+
+
+BACKENDS = {
+    GeminiBackend.name: GeminiBackend,
+    StubBackend.name: StubBackend
+}
+
+
+def create_backend(name=None):
+    """Create the configured LLM backend (LLM_BACKEND: 'gemini' or 'stub')"""
+    name = (name or Config.LLM_BACKEND).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown LLM backend '{name}', expected one of: {', '.join(BACKENDS)}")
+    # Checked for every backend, so runs on the stub still catch SDK calls the pinned version rejects
+    GeminiBackend.check_sdk_signature()
+    return BACKENDS[name]()
@@ -0,0 +1,207 @@
+import random
+import threading
+import time
+from collections import deque
+from config import Config
+from utils.llm_backends import LLMBackend, create_backend
+
+
+class ModelUnavailableError(Exception):
+    """Raised instead of calling the model when it cannot be used right now"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter"""
+
+    def __init__(self, rate_per_minute, burst):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout):
+        """Take a token, waiting up to ``timeout`` seconds. Returns False if none became available."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets a single trial call through after a cool-down"""
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None:
+                return 'closed'
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class ModelClient:
+    """Wraps a model's ``generate_content`` with deadlines, retries, rate limiting and a circuit breaker.
+
+    Every call made by ``AIHelper`` goes through a client. Retryable errors
+    (rate limits, timeouts, 5xx) are retried with jittered exponential
+    backoff within the call deadline. After repeated failures the circuit
+    opens and calls fail fast with ``ModelUnavailableError`` so callers drop
+    to their fallback path straight away.
+    """
+
+    RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+    LATENCY_SAMPLES = 1000
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, model):
+        # An LLMBackend, or any object with a Gemini-style generate_content(prompt) method
+        self.model = model
+        self.rate_limiter = None
+        if Config.MODEL_RATE_LIMIT_RPM > 0:
+            self.rate_limiter = TokenBucket(Config.MODEL_RATE_LIMIT_RPM, Config.MODEL_RATE_LIMIT_BURST)
+        self.circuit = CircuitBreaker(Config.MODEL_CIRCUIT_FAILURE_THRESHOLD, Config.MODEL_CIRCUIT_RESET_TIMEOUT)
+
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=self.LATENCY_SAMPLES)
+        self._metrics = {
+            'calls': 0, 'successes': 0, 'failures': 0, 'retries': 0,
+            'rate_limited': 0, 'circuit_rejections': 0
+        }
+        self._fallbacks = {}
+
+    @classmethod
+    def shared(cls):
+        """Process-wide client for the configured LLM backend"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(create_backend())
+            return cls._shared
+
+    def generate_content(self, prompt, stream=False, deadline=None):
+        """Call the model, retrying retryable errors until ``deadline`` seconds have passed"""
+        deadline = deadline or Config.MODEL_CALL_DEADLINE
+        expires = time.monotonic() + deadline
+        self._record('calls')
+
+        attempt = 0
+        while True:
+            if self.rate_limiter and not self.rate_limiter.acquire(max(0, expires - time.monotonic())):
+                self._record('rate_limited')
+                raise ModelUnavailableError('Model rate limit reached before the call deadline')
+
+            if not self.circuit.allow():
+                self._record('circuit_rejections')
+                raise ModelUnavailableError('Model circuit is open')
+
+            started = time.monotonic()
+            try:
+                response = self._call(prompt, stream, min(Config.MODEL_REQUEST_TIMEOUT, expires - started))
+            except Exception as e:
+                retryable = self._is_retryable(e)
+                if retryable:
+                    self.circuit.record_failure()
+                else:
+                    # The provider answered; the request itself was bad
+                    self.circuit.record_success()
+
+                delay = self._backoff(attempt)
+                if not retryable or attempt >= Config.MODEL_MAX_RETRIES or time.monotonic() + delay >= expires:
+                    self._record('failures')
+                    raise
+
+                attempt += 1
+                self._record('retries')
+                print(f"🔁 Model call failed ({type(e).__name__}), retry {attempt} in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            self.circuit.record_success()
+            with self._lock:
+                self._metrics['successes'] += 1
+                self._latencies.append(time.monotonic() - started)
+            return response
+
+    def record_fallback(self, kind):
+        """Count a fallback result served instead of a model response"""
+        with self._lock:
+            self._fallbacks[kind] = self._fallbacks.get(kind, 0) + 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._metrics)
+            stats['fallbacks'] = dict(self._fallbacks)
+            latencies = sorted(self._latencies)
+
+        stats['circuit_state'] = self.circuit.state
+        if latencies:
+            stats['latency_avg'] = round(sum(latencies) / len(latencies), 3)
+            stats['latency_p50'] = round(latencies[len(latencies) // 2], 3)
+            stats['latency_p95'] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3)
+        return stats
+
+    def _call(self, prompt, stream, timeout):
+        if isinstance(self.model, LLMBackend):
+            return self.model.generate_content(prompt, stream=stream, timeout=max(1, timeout))
+        # Plain models (e.g. benchmark stubs) take no timeout
+        if stream:
+            return self.model.generate_content(prompt, stream=True)
+        return self.model.generate_content(prompt)
+
+    def _is_retryable(self, error):
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            return True
+        # google.api_core exceptions carry the HTTP status as ``code``
+        return getattr(error, 'code', None) in self.RETRYABLE_STATUS_CODES
+
+    @staticmethod
+    def _backoff(attempt):
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(Config.MODEL_BACKOFF_MAX, Config.MODEL_BACKOFF_BASE * (2 ** attempt)))
+
+    def _record(self, counter):
+        with self._lock:
+            self._metrics[counter] += 1
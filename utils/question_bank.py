@@ -0,0 +1,244 @@
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from config import Config
+from utils.question_pool import QuestionPool
+
+
+class QuestionBank:
+    """Persistent local bank of pre-generated questions, stored in SQLite.
+
+    Questions are grouped by the same setup key as ``QuestionPool`` and
+    de-duplicated by text. The bank also records how often each setup is
+    requested so the warm-up job can fill the most popular setups first.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or Config.QUESTION_BANK_PATH
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0}
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS questions ('
+                'bank_key TEXT NOT NULL, text_hash TEXT NOT NULL, '
+                'question TEXT NOT NULL, created_at REAL NOT NULL, '
+                'PRIMARY KEY (bank_key, text_hash))'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS demand ('
+                'bank_key TEXT PRIMARY KEY, setup TEXT NOT NULL, '
+                'requests INTEGER NOT NULL, last_requested REAL NOT NULL)'
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def sample(self, setup_data, count):
+        """Return ``count`` random questions for the setup, or None if the bank is too shallow"""
+        key = QuestionPool.make_key(setup_data)
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT question FROM questions WHERE bank_key = ? ORDER BY RANDOM() LIMIT ?',
+                (key, count)
+            ).fetchall()
+
+        if len(rows) < count:
+            self._record('misses')
+            return None
+
+        self._record('hits')
+        return [json.loads(row[0]) for row in rows]
+
+    def add_questions(self, setup_data, questions):
+        """Add questions to the bank, ignoring ones already present. Returns the number added."""
+        key = QuestionPool.make_key(setup_data)
+        now = time.time()
+        rows = []
+        for question in questions:
+            text = ' '.join(question.get('text', '').lower().split())
+            if text:
+                text_hash = hashlib.sha1(text.encode('utf-8')).hexdigest()
+                rows.append((key, text_hash, json.dumps(question), now))
+
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO questions (bank_key, text_hash, question, created_at) VALUES (?, ?, ?, ?)',
+                rows
+            )
+            return conn.total_changes - before
+
+    def depth(self, setup_data):
+        """Number of questions banked for the setup"""
+        key = QuestionPool.make_key(setup_data)
+        with self._connect() as conn:
+            return conn.execute(
+                'SELECT COUNT(*) FROM questions WHERE bank_key = ?', (key,)
+            ).fetchone()[0]
+
+    def record_demand(self, setup_data):
+        """Count a request for the setup so warm-up can prioritise it"""
+        key = QuestionPool.make_key(setup_data)
+        setup = json.dumps(self._setup_fields(setup_data))
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT INTO demand (bank_key, setup, requests, last_requested) VALUES (?, ?, 1, ?) '
+                    'ON CONFLICT(bank_key) DO UPDATE SET requests = requests + 1, last_requested = excluded.last_requested',
+                    (key, setup, time.time())
+                )
+        except Exception as e:
+            print(f"⚠️ Failed to record question demand: {e}")
+
+    def demanded_setups(self):
+        """Setups that have been requested, most requested first"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT setup FROM demand ORDER BY requests DESC, last_requested DESC'
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def stats(self):
+        """Return hit/miss counters and bank size"""
+        with self._lock:
+            stats = dict(self._stats)
+        with self._connect() as conn:
+            stats['total_questions'] = conn.execute('SELECT COUNT(*) FROM questions').fetchone()[0]
+            stats['setups'] = conn.execute('SELECT COUNT(DISTINCT bank_key) FROM questions').fetchone()[0]
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0
+        return stats
+
+    @staticmethod
+    def _setup_fields(setup_data):
+        return {
+            'job_role': setup_data.get('job_role', ''),
+            'domain': setup_data.get('domain', ''),
+            'interview_type': setup_data.get('interview_type', ''),
+            'question_type': setup_data.get('question_type', ''),
+            'difficulty': setup_data.get('difficulty', 'Medium')
+        }
+
+    def _record(self, counter):
+        with self._lock:
+            self._stats[counter] += 1
+
+
+class QuestionBankWarmer:
+    """Pre-generates questions into a QuestionBank, most requested setups first"""
+
+    def __init__(self, bank, generator, requests_per_minute=None, target_depth=None):
+        # generator(setup_data, count) -> list of validated questions, raising on model failure
+        self.bank = bank
+        self.generator = generator
+        self.requests_per_minute = requests_per_minute or Config.QUESTION_BANK_WARMUP_RPM
+        self.target_depth = target_depth or Config.QUESTION_BANK_TARGET_DEPTH
+        self._last_request = 0
+        self._thread = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def all_setups():
+        """Every generated-question setup combination offered by the setup form"""
+        domains = [domain for technologies in Config.DOMAINS.values() for domain in technologies]
+        # Behavioral interviews use the predefined question list and need no warm-up
+        interview_types = [t for t in Config.INTERVIEW_TYPES if t.lower() != 'behavioral']
+        for job_role, domain, interview_type, question_type, difficulty in itertools.product(
+            Config.JOB_ROLES, domains, interview_types, Config.QUESTION_TYPES, Config.DIFFICULTY_LEVELS
+        ):
+            yield {
+                'job_role': job_role,
+                'domain': domain,
+                'interview_type': interview_type,
+                'question_type': question_type,
+                'difficulty': difficulty
+            }
+
+    def prioritized_setups(self):
+        """Requested setups ordered by demand, followed by every other combination"""
+        seen = set()
+        for setup in itertools.chain(self.bank.demanded_setups(), self.all_setups()):
+            if setup.get('interview_type', '').lower() == 'behavioral':
+                continue
+            key = QuestionPool.make_key(setup)
+            if key not in seen:
+                seen.add(key)
+                yield setup
+
+    def run_once(self, limit=None, dry_run=False):
+        """Fill shallow setups up to the target depth. Returns a summary dict."""
+        summary = {'setups_checked': 0, 'setups_filled': 0, 'questions_added': 0, 'failures': 0}
+
+        for setup in self.prioritized_setups():
+            if self._stop.is_set() or (limit is not None and summary['setups_filled'] >= limit):
+                break
+
+            summary['setups_checked'] += 1
+            missing = self.target_depth - self.bank.depth(setup)
+            if missing <= 0:
+                continue
+
+            label = ' / '.join(setup.values())
+            if dry_run:
+                print(f"📝 Would generate {missing} questions for {label}")
+                summary['setups_filled'] += 1
+                continue
+
+            self._wait_for_rate_limit()
+            try:
+                questions = self.generator(dict(setup, question_count=missing), missing)
+                added = self.bank.add_questions(setup, questions)
+                summary['setups_filled'] += 1
+                summary['questions_added'] += added
+                print(f"✅ Banked {added} questions for {label}")
+            except Exception as e:
+                summary['failures'] += 1
+                print(f"⚠️ Warm-up failed for {label}: {e}")
+
+        return summary
+
+    def start(self, interval=None):
+        """Run warm-up cycles in a daemon thread every ``interval`` seconds"""
+        if self._thread and self._thread.is_alive():
+            return
+        interval = interval or Config.QUESTION_BANK_WARMUP_INTERVAL
+
+        def loop():
+            while not self._stop.is_set():
+                try:
+                    self.run_once(limit=Config.QUESTION_BANK_WARMUP_BATCH)
+                except Exception as e:
+                    print(f"⚠️ Question bank warm-up cycle failed: {e}")
+                self._stop.wait(interval)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=loop, name='question-bank-warmer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _wait_for_rate_limit(self):
+        """Space model requests to stay under requests_per_minute"""
+        min_interval = 60.0 / self.requests_per_minute
+        wait = self._last_request + min_interval - time.monotonic()
+        if wait > 0:
+            self._stop.wait(wait)
+        self._last_request = time.monotonic()
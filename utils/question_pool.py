@@ -0,0 +1,204 @@
+import copy
+import hashlib
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from utils.cache import LRUCache
+
+
+class QuestionPool:
+    """Pool of generated questions per interview setup, sampled per request.
+
+    Pools are keyed on (job_role, domain, interview_type, question_type,
+    difficulty) and kept in an in-process LRU backed by a shared store with
+    ``get_questions_cache_entry``/``save_questions_cache`` (the Firestore
+    ``questions`` collection). A pool older than ``QUESTION_POOL_TTL`` is still
+    served while it is regenerated in the background; one older than
+    ``QUESTION_POOL_MAX_STALE`` is treated as a miss.
+    """
+
+    def __init__(self, store, generator):
+        # generator(setup_data, count) -> list of questions, raising on model failure
+        self.store = store
+        self.generator = generator
+        # Same lifetime as the stored entry, so no process serves a pool the store has expired
+        self.memory_tier = LRUCache(
+            max_entries=Config.QUESTION_POOL_MEMORY_ENTRIES,
+            ttl=Config.QUESTION_POOL_MAX_STALE
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=Config.QUESTION_POOL_REFRESH_WORKERS,
+            thread_name_prefix='question-pool'
+        )
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._stats = {
+            'fresh_hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'refreshes': 0,
+            'refresh_failures': 0
+        }
+        self._depths = {}
+
+    @staticmethod
+    def make_key(setup_data):
+        """Build a Firestore-safe document id for a setup combination"""
+        parts = [
+            setup_data.get('job_role', ''),
+            setup_data.get('domain', ''),
+            setup_data.get('interview_type', ''),
+            setup_data.get('question_type', ''),
+            setup_data.get('difficulty', 'Medium')
+        ]
+        digest = hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+        return f"pool_{digest}"
+
+    def get_questions(self, setup_data):
+        """Return ``question_count`` questions for the setup, sampled from the pool"""
+        pooled = self.sample(setup_data)
+        if pooled is not None:
+            return pooled
+
+        # Miss: generate just what this request needs, then grow the pool in the background
+        question_count = setup_data['question_count']
+        questions = self.generator(setup_data, question_count)
+        self.store_generated(setup_data, questions)
+        return copy.deepcopy(questions[:question_count])
+
+    def sample(self, setup_data):
+        """Return ``question_count`` pooled questions, or None on a miss"""
+        question_count = setup_data['question_count']
+        key = self.make_key(setup_data)
+        entry = self._load_entry(key)
+
+        if entry and len(entry['questions']) >= question_count:
+            age = time.time() - entry['generated_at']
+            if age < Config.QUESTION_POOL_TTL:
+                self._record('fresh_hits')
+                return self._sample(entry['questions'], question_count)
+            if age < Config.QUESTION_POOL_MAX_STALE:
+                self._record('stale_hits')
+                self._schedule_fill(key, setup_data, replace=True)
+                return self._sample(entry['questions'], question_count)
+
+        self._record('misses')
+        return None
+
+    def store_generated(self, setup_data, questions):
+        """Seed the pool with questions generated on a miss and top it up in the background"""
+        if not questions:
+            return
+        key = self.make_key(setup_data)
+        # A pool too small for this request is grown, not replaced
+        entry = self._load_entry(key)
+        existing = []
+        if entry and time.time() - entry['generated_at'] < Config.QUESTION_POOL_MAX_STALE:
+            existing = entry['questions']
+        self._save_entry(key, self._merge(existing, questions), setup_data)
+        self._schedule_fill(key, setup_data, replace=False)
+
+    def stats(self):
+        """Return hit/miss counters and the depth of every known pool"""
+        with self._lock:
+            stats = dict(self._stats)
+            depths = dict(self._depths)
+        lookups = stats['fresh_hits'] + stats['stale_hits'] + stats['misses']
+        stats['hit_rate'] = round((lookups - stats['misses']) / lookups, 3) if lookups else 0
+        stats['pool_depths'] = depths
+        return stats
+
+    def _load_entry(self, key):
+        entry = self.memory_tier.get(key)
+        if entry is not None:
+            return entry
+
+        document = self.store.get_questions_cache_entry(key)
+        if not document or not document.get('questions'):
+            return None
+
+        entry = {
+            'questions': document['questions'],
+            'generated_at': document.get('generated_at', 0),
+            'label': document.get('label', key)
+        }
+        self.memory_tier.set(key, entry)
+        self._record_depth(entry)
+        return entry
+
+    def _save_entry(self, key, questions, setup_data):
+        entry = {
+            'questions': questions,
+            'generated_at': time.time(),
+            'label': self._label(setup_data)
+        }
+        self.memory_tier.set(key, entry)
+        self._record_depth(entry)
+        # The store expiry covers the whole stale-while-revalidate window
+        self.store.save_questions_cache(
+            key, questions,
+            ttl=Config.QUESTION_POOL_MAX_STALE,
+            metadata={'generated_at': entry['generated_at'], 'label': entry['label']}
+        )
+
+    def _schedule_fill(self, key, setup_data, replace):
+        """Regenerate (or top up) a pool in the background, once per key at a time"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._executor.submit(self._fill, key, dict(setup_data), replace)
+
+    def _fill(self, key, setup_data, replace):
+        try:
+            target_size = max(Config.QUESTION_POOL_SIZE, setup_data['question_count'])
+            generated = self.generator(setup_data, target_size)
+            if not generated:
+                raise ValueError('Model returned no questions')
+
+            existing = []
+            if not replace:
+                entry = self._load_entry(key)
+                existing = entry['questions'] if entry else []
+            self._save_entry(key, self._merge(existing, generated), setup_data)
+            self._record('refreshes')
+            print(f"🔄 Question pool {self._label(setup_data)} refreshed")
+        except Exception as e:
+            self._record('refresh_failures')
+            print(f"⚠️ Question pool refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _merge(self, existing, generated):
+        """Combine question lists, dropping duplicate question texts"""
+        merged = []
+        seen = set()
+        for question in existing + generated:
+            text = ' '.join(question.get('text', '').lower().split())
+            if text and text not in seen:
+                seen.add(text)
+                merged.append(question)
+        return merged[:Config.QUESTION_POOL_MAX_SIZE]
+
+    def _sample(self, questions, count):
+        return copy.deepcopy(random.sample(questions, count))
+
+    def _label(self, setup_data):
+        return ' / '.join([
+            setup_data.get('job_role', ''),
+            setup_data.get('domain', ''),
+            setup_data.get('interview_type', ''),
+            setup_data.get('question_type', ''),
+            setup_data.get('difficulty', 'Medium')
+        ])
+
+    def _record(self, counter):
+        with self._lock:
+            self._stats[counter] += 1
+
+    def _record_depth(self, entry):
+        with self._lock:
+            self._depths[entry['label']] = len(entry['questions'])
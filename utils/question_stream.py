@@ -0,0 +1,66 @@
+import json
+
+
+class QuestionStreamParser:
+    """Incrementally extracts complete objects from a streamed JSON array.
+
+    Text is fed chunk by chunk as the model produces it; every top-level
+    object of the array is returned as soon as its closing brace arrives,
+    so questions can be used before the full response has been generated.
+    """
+
+    def __init__(self):
+        self.text = ''
+        self._buffer = []
+        self._in_array = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk):
+        """Consume a chunk of text and return the objects completed by it"""
+        self.text += chunk
+        completed = []
+
+        for char in chunk:
+            if not self._in_array:
+                if char == '[':
+                    self._in_array = True
+                continue
+
+            if self._depth > 0:
+                self._buffer.append(char)
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = self._depth > 0
+            elif char == '{':
+                if self._depth == 0:
+                    self._buffer = [char]
+                self._depth += 1
+            elif char == '}' and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    item = self._decode(''.join(self._buffer))
+                    if item is not None:
+                        completed.append(item)
+                    self._buffer = []
+            elif char == ']' and self._depth == 0:
+                self._in_array = False
+
+        return completed
+
+    def _decode(self, text):
+        try:
+            item = json.loads(text)
+        except ValueError:
+            return None
+        return item if isinstance(item, dict) else None
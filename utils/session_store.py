@@ -0,0 +1,229 @@
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer, want_bytes
+from werkzeug.datastructures import CallbackDict
+from config import Config
+
+try:
+    import redis
+except ImportError:  # Only needed for SESSION_BACKEND=redis
+    redis = None
+
+
+class SQLiteSessionStore:
+    """Session records in a SQLite database (WAL), shared by every worker on the host"""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or Config.SESSION_DB_PATH
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS sessions ('
+                'id TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS sessions_expiry ON sessions (expires_at)')
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        # With WAL this only risks the last few changes on power loss, never corruption
+        conn.execute('PRAGMA synchronous=NORMAL')
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, sid):
+        """Return (data, expires_at) or None if missing or expired"""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT data, expires_at FROM sessions WHERE id = ? AND expires_at > ?', (sid, time.time())
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, sid, data, ttl):
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO sessions (id, data, expires_at) VALUES (?, ?, ?)',
+                (sid, data, time.time() + ttl)
+            )
+
+    def touch(self, sid, ttl):
+        with self._connect() as conn:
+            conn.execute('UPDATE sessions SET expires_at = ? WHERE id = ?', (time.time() + ttl, sid))
+
+    def delete(self, sid):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM sessions WHERE id = ?', (sid,))
+
+    def delete_expired(self, dry_run=False):
+        """Remove expired sessions. Returns how many were (or, with dry_run, would be) removed."""
+        with self._connect() as conn:
+            if dry_run:
+                return conn.execute('SELECT COUNT(*) FROM sessions WHERE expires_at <= ?', (time.time(),)).fetchone()[0]
+            return conn.execute('DELETE FROM sessions WHERE expires_at <= ?', (time.time(),)).rowcount
+
+
+class RedisSessionStore:
+    """Session records in Redis (or any server speaking its protocol); expiry is left to the server"""
+
+    def __init__(self, url=None, prefix=None):
+        if redis is None:
+            raise RuntimeError("SESSION_BACKEND=redis needs the redis package: pip install redis")
+        self.client = redis.Redis.from_url(url or Config.SESSION_REDIS_URL)
+        self.prefix = prefix or Config.SESSION_KEY_PREFIX
+
+    def get(self, sid):
+        pipe = self.client.pipeline()
+        pipe.get(self.prefix + sid)
+        pipe.ttl(self.prefix + sid)
+        data, ttl = pipe.execute()
+        if data is None:
+            return None
+        return data.decode('utf-8'), time.time() + max(ttl, 0)
+
+    def set(self, sid, data, ttl):
+        self.client.set(self.prefix + sid, data, ex=int(ttl))
+
+    def touch(self, sid, ttl):
+        self.client.expire(self.prefix + sid, int(ttl))
+
+    def delete(self, sid):
+        self.client.delete(self.prefix + sid)
+
+    def delete_expired(self, dry_run=False):
+        return 0
+
+
+class ServerSession(CallbackDict, SessionMixin):
+    """Session dict that remembers its id and whether it was changed"""
+
+    def __init__(self, initial=None, sid=None, expires_at=None):
+        def on_update(self):
+            self.modified = True
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.expires_at = expires_at
+        self.modified = False
+
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface keeping session data in a SQLite or Redis store.
+
+    The cookie only carries a signed random session id. Data is serialised
+    with Flask's tagged JSON (no pickle) and expires ``SESSION_TTL`` seconds
+    after the last write. Writes are lazy: a request that did not modify the
+    session writes nothing, except to push the expiry back once less than
+    half of the TTL is left. Nested changes (``session['a']['b'] = ...``)
+    still need ``session.modified = True``.
+    """
+
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, store, ttl=None):
+        self.store = store
+        self.ttl = ttl or Config.SESSION_TTL
+        self._lock = threading.Lock()
+        self._stats = {'loads': 0, 'misses': 0, 'writes': 0, 'touches': 0, 'skipped_writes': 0, 'deletes': 0}
+
+    @classmethod
+    def from_config(cls):
+        """Build the interface for Config.SESSION_BACKEND ('sqlite' or 'redis')"""
+        if Config.SESSION_BACKEND == 'redis':
+            return cls(RedisSessionStore())
+        if Config.SESSION_BACKEND == 'sqlite':
+            return cls(SQLiteSessionStore())
+        raise ValueError(f'Unknown session backend: {Config.SESSION_BACKEND}')
+
+    def open_session(self, app, request):
+        sid = self._unsign(app, request.cookies.get(self.get_cookie_name(app)))
+        if sid:
+            try:
+                record = self.store.get(sid)
+            except Exception as e:
+                print(f"⚠️ Session load failed: {e}")
+                record = None
+            if record:
+                try:
+                    data = self.serializer.loads(record[0])
+                    self._count('loads')
+                    return ServerSession(data, sid=sid, expires_at=record[1])
+                except ValueError:
+                    print(f"⚠️ Discarding unreadable session {sid[:8]}...")
+            self._count('misses')
+        return ServerSession(sid=secrets.token_urlsafe(32))
+
+    def save_session(self, app, session, response):
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        name = self.get_cookie_name(app)
+
+        try:
+            if not session:
+                if session.modified:
+                    # Cleared (e.g. logout): drop the record and the cookie
+                    self.store.delete(session.sid)
+                    self._count('deletes')
+                    response.delete_cookie(name, domain=domain, path=path)
+                return
+
+            if not session.modified:
+                if session.expires_at and session.expires_at - time.time() < self.ttl / 2:
+                    self.store.touch(session.sid, self.ttl)
+                    self._count('touches')
+                else:
+                    self._count('skipped_writes')
+                return
+
+            self.store.set(session.sid, self.serializer.dumps(dict(session)), self.ttl)
+            self._count('writes')
+        except Exception as e:
+            print(f"❌ Session save failed: {e}")
+            return
+
+        response.set_cookie(
+            name,
+            self._sign(app, session.sid),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, backend=type(self.store).__name__, ttl=self.ttl)
+
+    def delete_expired(self, dry_run=False):
+        return self.store.delete_expired(dry_run=dry_run)
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    @staticmethod
+    def _signer(app):
+        return Signer(app.secret_key, salt='server-session', key_derivation='hmac')
+
+    def _sign(self, app, sid):
+        return self._signer(app).sign(want_bytes(sid)).decode('utf-8')
+
+    def _unsign(self, app, value):
+        if not value:
+            return None
+        try:
+            return self._signer(app).unsign(value).decode('utf-8')
+        except BadSignature:
+            return None
@@ -0,0 +1,150 @@
+import os
+import re
+import threading
+import time
+from config import Config
+
+
+class SessionSweeper:
+    """Removes expired interview sessions and the local files they leave behind.
+
+    Each sweep deletes Firestore interview sessions older than
+    ``SESSION_MAX_AGE`` in batched pages, then prunes files in
+    ``SESSION_FILE_DIR`` by modification time: question files of
+    the 'file' question tier (``questions_<id>.json``) older than ``SESSION_MAX_AGE`` and Flask-Session
+    files older than ``SESSION_FILE_MAX_AGE``. With a ``session_store``
+    (the SQLite session backend) expired login sessions are removed too.
+
+    When a job queue is given, the background loop enqueues one
+    ``sweep_sessions`` job per interval instead of sweeping directly, so only
+    one of the app's worker processes does the work.
+    """
+
+    JOB_KIND = 'sweep_sessions'
+    QUESTION_FILE = re.compile(r'^questions_.+\.json$')
+    # Flask-Session's filesystem backend names files after a hash (md5 or sha256) of the session key
+    SESSION_FILE = re.compile(r'^[0-9a-f]{32}(?:[0-9a-f]{32})?$')
+
+    def __init__(self, storage_manager, session_dir=None, job_queue=None, session_store=None):
+        self.storage_manager = storage_manager
+        self.session_store = session_store
+        self.session_dir = session_dir or Config.SESSION_FILE_DIR
+        self.job_queue = job_queue
+        self.last_run = None
+        self._totals = {
+            'runs': 0, 'sessions_deleted': 0, 'server_sessions_deleted': 0,
+            'files_deleted': 0, 'bytes_freed': 0, 'failures': 0
+        }
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def run_once(self, dry_run=False):
+        """Sweep once. Returns a summary dict."""
+        started = time.time()
+        summary = {
+            'dry_run': dry_run,
+            'sessions_deleted': 0,
+            'session_pages': 0,
+            'server_sessions_deleted': 0,
+            'question_files_deleted': 0,
+            'session_files_deleted': 0,
+            'bytes_freed': 0,
+            'failures': 0
+        }
+
+        try:
+            result = self.storage_manager.delete_expired_sessions(
+                started - Config.SESSION_MAX_AGE, dry_run=dry_run
+            )
+            summary['sessions_deleted'] = result['deleted']
+            summary['session_pages'] = result['pages']
+        except Exception as e:
+            summary['failures'] += 1
+            print(f"⚠️ Expired session sweep failed: {e}")
+
+        if self.session_store:
+            try:
+                summary['server_sessions_deleted'] = self.session_store.delete_expired(dry_run=dry_run)
+            except Exception as e:
+                summary['failures'] += 1
+                print(f"⚠️ Expired login session sweep failed: {e}")
+
+        self._prune_files(summary, started, dry_run)
+
+        elapsed = time.time() - started
+        summary['duration'] = round(elapsed, 3)
+        removed = (summary['sessions_deleted'] + summary['server_sessions_deleted']
+                   + summary['question_files_deleted'] + summary['session_files_deleted'])
+        summary['items_per_second'] = round(removed / elapsed, 1) if elapsed > 0 else 0
+
+        with self._lock:
+            self.last_run = dict(summary, finished_at=time.time())
+            if not dry_run:
+                self._totals['runs'] += 1
+                self._totals['sessions_deleted'] += summary['sessions_deleted']
+                self._totals['server_sessions_deleted'] += summary['server_sessions_deleted']
+                self._totals['files_deleted'] += summary['question_files_deleted'] + summary['session_files_deleted']
+                self._totals['bytes_freed'] += summary['bytes_freed']
+                self._totals['failures'] += summary['failures']
+        return summary
+
+    def run_job(self, payload, report_progress):
+        """Job handler for queued sweeps"""
+        return self.run_once(dry_run=payload.get('dry_run', False))
+
+    def start(self, interval=None):
+        """Sweep (or enqueue a sweep) in a daemon thread every ``interval`` seconds"""
+        if self._thread and self._thread.is_alive():
+            return
+        interval = interval or Config.SESSION_SWEEP_INTERVAL
+
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    if self.job_queue:
+                        # Every process asks for the same slot; the idempotency key keeps it to one job
+                        slot = int(time.time() // interval)
+                        self.job_queue.enqueue(self.JOB_KIND, {}, idempotency_key=f'{self.JOB_KIND}:{slot}')
+                    else:
+                        self.run_once()
+                except Exception as e:
+                    print(f"⚠️ Session sweep cycle failed: {e}")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=loop, name='session-sweeper', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self):
+        with self._lock:
+            return {'totals': dict(self._totals), 'last_run': self.last_run}
+
+    def _prune_files(self, summary, now, dry_run):
+        if not os.path.isdir(self.session_dir):
+            return
+
+        for entry in os.scandir(self.session_dir):
+            if self.QUESTION_FILE.match(entry.name):
+                max_age, counter = Config.SESSION_MAX_AGE, 'question_files_deleted'
+            elif self.SESSION_FILE.match(entry.name):
+                max_age, counter = Config.SESSION_FILE_MAX_AGE, 'session_files_deleted'
+            else:
+                continue
+
+            try:
+                stat = entry.stat()
+                if not entry.is_file() or stat.st_mtime >= now - max_age:
+                    continue
+                if not dry_run:
+                    os.remove(entry.path)
+                summary[counter] += 1
+                summary['bytes_freed'] += stat.st_size
+            except FileNotFoundError:
+                # Removed by another process in the meantime
+                continue
+            except OSError as e:
+                summary['failures'] += 1
+                print(f"⚠️ Could not remove {entry.path}: {e}")
@@ -1,21 +1,64 @@
 import json
 import os
+import sqlite3
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from config import Config
+from utils.leaderboard import Leaderboard
+from utils.user_stats import UserStats
 
 class StorageManager:
-    def __init__(self):
+    """Local report storage in a SQLite database.
+
+    Each report is one row holding its JSON document, indexed by id and by
+    (user_id, created_at), so saving a report is a single insert and lookups
+    never load a user's whole history. WAL mode lets every gunicorn worker
+    read and write the same file. Top-K leaderboards are kept in the same
+    database and updated with each report. Reports kept in the old per-user
+    ``{user_id}_reports.json`` files are imported with migrate_local_reports.py.
+    """
+    
+    def __init__(self, db_path=None, check_legacy=True):
         self.reports_dir = Config.REPORTS_DIR
         self.users_file = Config.USERS_FILE
+        self.db_path = db_path or Config.REPORTS_DB_PATH
         self.ensure_directories()
+        self._init_db()
+        
+        if check_legacy and self.legacy_report_files():
+            print(f"⚠️ Found JSON report files in {self.reports_dir}; import them with: python migrate_local_reports.py")
     
     def ensure_directories(self):
         """Ensure necessary directories exist"""
         os.makedirs(self.reports_dir, exist_ok=True)
         os.makedirs(os.path.dirname(self.users_file), exist_ok=True)
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS reports ('
+                'id TEXT PRIMARY KEY, user_id TEXT NOT NULL, created_at TEXT NOT NULL, '
+                'score REAL, data TEXT NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS reports_user ON reports (user_id, created_at)')
+            conn.execute('CREATE INDEX IF NOT EXISTS reports_score ON reports (score)')
+            conn.execute('CREATE TABLE IF NOT EXISTS leaderboards (key TEXT PRIMARY KEY, entries TEXT NOT NULL)')
+    
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
     
     def save_report(self, user_id, setup, questions, answers, results):
         """Save interview report"""
@@ -30,43 +73,116 @@ class StorageManager:
             'results': results
         }
         
-        # Save to user-specific reports file
-        user_reports_file = os.path.join(self.reports_dir, f'{user_id}_reports.json')
-        
-        if os.path.exists(user_reports_file):
-            with open(user_reports_file, 'r') as f:
-                reports = json.load(f)
-        else:
-            reports = []
-        
-        reports.append(report_data)
-        
-        with open(user_reports_file, 'w') as f:
-            json.dump(reports, f, indent=2)
+        with self._connect() as conn:
+            # Take the write lock up front so leaderboard updates from other workers are not lost
+            conn.execute('BEGIN IMMEDIATE')
+            self._insert(conn, report_data)
+            self._update_leaderboards(conn, report_data)
         
         return report_id
     
-    def get_user_reports(self, user_id):
-        """Get all reports for a user"""
-        user_reports_file = os.path.join(self.reports_dir, f'{user_id}_reports.json')
-        
-        if os.path.exists(user_reports_file):
-            with open(user_reports_file, 'r') as f:
-                reports = json.load(f)
-            # Sort by date (newest first)
-            return sorted(reports, key=lambda x: x['created_at'], reverse=True)
-        
-        return []
+    def _insert(self, conn, report_data, replace=True):
+        """Insert a report row. Returns True if a row was written."""
+        results = report_data.get('results')
+        score = results.get('overall_score') if isinstance(results, dict) else None
+        cursor = conn.execute(
+            f"INSERT OR {'REPLACE' if replace else 'IGNORE'} INTO reports (id, user_id, created_at, score, data) "
+            'VALUES (?, ?, ?, ?, ?)',
+            (report_data['id'], report_data['user_id'], report_data['created_at'], score, json.dumps(report_data))
+        )
+        return cursor.rowcount > 0
+    
+    def _update_leaderboards(self, conn, report_data):
+        entry = Leaderboard.entry(report_data)
+        if entry is None:
+            return
+        for key in Leaderboard.keys_for(entry):
+            board = self._load_leaderboard(conn, key)
+            if board.add(entry):
+                conn.execute(
+                    'INSERT OR REPLACE INTO leaderboards (key, entries) VALUES (?, ?)',
+                    (key, json.dumps(board.entries()))
+                )
+    
+    def _load_leaderboard(self, conn, key):
+        row = conn.execute('SELECT entries FROM leaderboards WHERE key = ?', (key,)).fetchone()
+        return Leaderboard(json.loads(row[0]) if row else None)
+    
+    def get_user_reports(self, user_id, limit=None):
+        """Get all reports for a user (newest first)"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT data FROM reports WHERE user_id = ? ORDER BY created_at DESC LIMIT ?',
+                (user_id, -1 if limit is None else limit)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
     
     def get_report(self, user_id, report_id):
         """Get specific report"""
-        reports = self.get_user_reports(user_id)
-        return next((report for report in reports if report['id'] == report_id), None)
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT data FROM reports WHERE id = ? AND user_id = ?', (report_id, user_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
     
-    def get_recent_reports(self, user_id, limit=5):
-        """Get recent reports for a user"""
-        reports = self.get_user_reports(user_id)
-        return reports[:limit]
+    def get_recent_reports(self, user_id, limit=5, stats=None):
+        """Get recent reports for a user (``stats`` is accepted for parity with Firestore)"""
+        return self.get_user_reports(user_id, limit=limit)
+    
+    def iter_reports_since(self, watermark=None):
+        """Yield reports with created_at >= watermark, oldest first"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT data FROM reports WHERE created_at >= ? ORDER BY created_at', (watermark or '',)
+            )
+            for (data,) in rows:
+                yield json.loads(data)
+    
+    def legacy_report_files(self):
+        """Paths of the per-user JSON report files used before the SQLite store"""
+        if not os.path.isdir(self.reports_dir):
+            return []
+        return sorted(
+            os.path.join(self.reports_dir, filename)
+            for filename in os.listdir(self.reports_dir) if filename.endswith('_reports.json')
+        )
+    
+    def import_report_file(self, path):
+        """Import one legacy JSON report file. Returns (reports read, reports added).
+        
+        Reports already in the database are skipped, so the import can be re-run.
+        """
+        with open(path, 'r') as f:
+            reports = json.load(f)
+        
+        added = 0
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            for report in reports:
+                if self._insert(conn, report, replace=False):
+                    self._update_leaderboards(conn, report)
+                    added += 1
+        return len(reports), added
+    
+    def rebuild_leaderboards(self):
+        """Recompute every leaderboard from the stored reports. Returns the number of boards."""
+        boards = {}
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            for (data,) in conn.execute('SELECT data FROM reports WHERE score IS NOT NULL'):
+                entry = Leaderboard.entry(json.loads(data))
+                for key in Leaderboard.keys_for(entry):
+                    boards.setdefault(key, Leaderboard()).add(entry)
+            conn.execute('DELETE FROM leaderboards')
+            conn.executemany(
+                'INSERT INTO leaderboards (key, entries) VALUES (?, ?)',
+                [(key, json.dumps(board.entries())) for key, board in boards.items()]
+            )
+        return len(boards)
+    
+    def load_user_stats(self, user_id):
+        """Aggregate stats for a user, computed from their reports in one query"""
+        return UserStats.from_reports(user_id, self.get_user_reports(user_id))
     
     def get_user_stats(self, user_id):
         """Get user statistics"""
@@ -141,40 +257,11 @@ class StorageManager:
             'recent_scores': [report['results']['overall_score'] for report in reports[:10]]
         }
     
-    def get_leaderboard(self, limit=10):
-        """Get anonymous leaderboard"""
-        all_reports = []
-        
-        # Collect all reports from all users
-        for filename in os.listdir(self.reports_dir):
-            if filename.endswith('_reports.json'):
-                filepath = os.path.join(self.reports_dir, filename)
-                with open(filepath, 'r') as f:
-                    user_reports = json.load(f)
-                    for report in user_reports:
-                        all_reports.append({
-                            'score': report['results']['overall_score'],
-                            'domain': report['setup']['domain'],
-                            'job_role': report['setup']['job_role'],
-                            'date': report['created_at'][:10]
-                        })
-        
-        # Sort by score and get top performers
-        top_scores = sorted(all_reports, key=lambda x: x['score'], reverse=True)[:limit]
-        
-        # Anonymize the data
-        leaderboard = []
-        for i, entry in enumerate(top_scores):
-            leaderboard.append({
-                'rank': i + 1,
-                'score': entry['score'],
-                'domain': entry['domain'],
-                'job_role': entry['job_role'],
-                'date': entry['date'],
-                'anonymous_id': f"User{i+1:03d}"
-            })
-        
-        return leaderboard
+    def get_leaderboard(self, limit=10, domain=None, job_role=None, window='all'):
+        """Get anonymous leaderboard, optionally for one domain/job role and the current month or week"""
+        with self._connect() as conn:
+            board = self._load_leaderboard(conn, Leaderboard.key(domain, job_role, window))
+        return board.top(limit)
     
     def generate_pdf_report(self, user_id, report_id):
         """Generate PDF report"""
@@ -0,0 +1,169 @@
+import copy
+from datetime import datetime
+
+
+class UserStats:
+    """Per-user aggregate of interview reports, updated one report at a time.
+
+    The aggregate holds running sums and counts, per-domain and per-month
+    buckets, a score histogram (so the best score survives deletions) and a
+    capped list of the most recent scored reports. ``summary()`` and
+    ``detailed()`` produce the same dicts the dashboard and statistics pages
+    used to compute from the full report history.
+    """
+
+    # Bumped whenever stored stats must be recomputed from the reports.
+    # 2: report summaries are backfilled alongside the rebuild
+    VERSION = 2
+    RECENT_SHOWN = 10
+    # Extra recent entries kept so deleting a report rarely needs a rebuild
+    RECENT_CAPACITY = 20
+
+    def __init__(self, data):
+        self.data = data
+
+    @classmethod
+    def empty(cls, user_id):
+        return cls({
+            'user_id': user_id,
+            'version': cls.VERSION,
+            'total_interviews': 0,
+            'scored_interviews': 0,
+            'score_sum': 0,
+            'total_questions': 0,
+            'score_counts': {},
+            'domains': {},
+            'months': {},
+            'recent': [],
+            'updated_at': datetime.now().isoformat()
+        })
+
+    @classmethod
+    def from_reports(cls, user_id, reports):
+        """Build the aggregate from scratch, e.g. for the rebuild command"""
+        stats = cls.empty(user_id)
+        for report in sorted(reports, key=lambda r: r.get('created_at', '')):
+            stats.add_report(report)
+        return stats
+
+    def to_dict(self):
+        return copy.deepcopy(self.data)
+
+    def needs_rebuild(self):
+        """True if the recent list ran short after deletions, or the layout is outdated"""
+        if self.data.get('version') != self.VERSION:
+            return True
+        expected = min(self.RECENT_SHOWN, self.data['scored_interviews'])
+        return len(self.data['recent']) < expected
+
+    def add_report(self, report):
+        self._apply(report, 1)
+        score = self._score(report)
+        if score is not None:
+            recent = self.data['recent']
+            recent.append({
+                'report_id': report.get('id'),
+                'created_at': report.get('created_at', ''),
+                'score': score,
+                'domain': report.get('setup', {}).get('domain', 'Unknown')
+            })
+            recent.sort(key=lambda entry: entry['created_at'], reverse=True)
+            del recent[self.RECENT_CAPACITY:]
+
+    def remove_report(self, report):
+        self._apply(report, -1)
+        self.data['recent'] = [
+            entry for entry in self.data['recent'] if entry['report_id'] != report.get('id')
+        ]
+
+    def summary(self):
+        """Stats for the dashboard (scores on a 0-100 scale)"""
+        data = self.data
+        scored = data['scored_interviews']
+        return {
+            'total_interviews': data['total_interviews'],
+            'average_score': round(data['score_sum'] / scored * 10, 1) if scored else 0,
+            'best_score': round(self._best_score() * 10, 1),
+            'total_questions_answered': data['total_questions'],
+            'favorite_domain': self._favorite_domain(),
+            'recent_performance': [
+                {'date': entry['created_at'], 'score': entry['score'] * 10, 'domain': entry['domain']}
+                for entry in data['recent'][:self.RECENT_SHOWN]
+            ]
+        }
+
+    def detailed(self):
+        """Stats for the statistics page (scores on a 0-10 scale)"""
+        data = self.data
+        scored = data['scored_interviews']
+        recent_performance = [
+            {'date': entry['created_at'][:10], 'score': round(entry['score'], 1), 'domain': entry['domain']}
+            for entry in data['recent'][:self.RECENT_SHOWN]
+        ]
+        monthly_list = [
+            {
+                'month': month,
+                'interviews': bucket['count'],
+                'average_score': round(bucket['score_sum'] / bucket['count'], 1) if bucket['count'] > 0 else 0
+            }
+            for month, bucket in sorted(data['months'].items()) if bucket['count'] > 0
+        ]
+        return {
+            'total_interviews': data['total_interviews'],
+            'average_score': round(data['score_sum'] / scored, 1) if scored else 0,
+            'best_score': round(self._best_score(), 1),
+            'total_questions_answered': data['total_questions'],
+            'favorite_domain': self._favorite_domain(),
+            'recent_performance': recent_performance,
+            'recent_scores': [perf['score'] for perf in recent_performance],
+            'domain_breakdown': {domain: count for domain, count in data['domains'].items() if count > 0},
+            'monthly_progress': monthly_list[-6:],  # Last 6 months
+            'skill_analysis': {}
+        }
+
+    def _apply(self, report, sign):
+        data = self.data
+        data['total_interviews'] += sign
+        data['total_questions'] += sign * len(report.get('questions', []))
+
+        domain = report.get('setup', {}).get('domain')
+        if domain:
+            self._bump(data['domains'], domain, sign)
+
+        score = self._score(report)
+        if score is not None:
+            data['scored_interviews'] += sign
+            data['score_sum'] += sign * score
+            # Histogram keys are tenths of a point, e.g. 7.5 -> "75"
+            self._bump(data['score_counts'], str(int(round(score * 10))), sign)
+
+        month = report.get('created_at', '')[:7]  # YYYY-MM format
+        if month and 'results' in report:
+            bucket = data['months'].setdefault(month, {'count': 0, 'score_sum': 0})
+            bucket['count'] += sign
+            bucket['score_sum'] += sign * report['results'].get('overall_score', 0)
+            if bucket['count'] <= 0:
+                del data['months'][month]
+
+        data['updated_at'] = datetime.now().isoformat()
+
+    def _best_score(self):
+        counts = self.data['score_counts']
+        return max((int(key) for key, count in counts.items() if count > 0), default=0) / 10
+
+    def _favorite_domain(self):
+        domains = {domain: count for domain, count in self.data['domains'].items() if count > 0}
+        return max(domains, key=domains.get) if domains else 'N/A'
+
+    @staticmethod
+    def _bump(counts, key, sign):
+        counts[key] = counts.get(key, 0) + sign
+        if counts[key] <= 0:
+            del counts[key]
+
+    @staticmethod
+    def _score(report):
+        results = report.get('results')
+        if isinstance(results, dict) and 'overall_score' in results:
+            return results['overall_score']
+        return None
@@ -0,0 +1,53 @@
+"""
+Question bank warm-up job
+Pre-generates interview questions into the local question bank so that
+/generate_questions can serve them without waiting on the model.
+
+Usage:
+    python warm_question_bank.py                 # Fill up to 20 setups once
+    python warm_question_bank.py --limit 0       # Fill every setup combination
+    python warm_question_bank.py --loop          # Keep running every QUESTION_BANK_WARMUP_INTERVAL
+    python warm_question_bank.py --dry-run       # Show what would be generated
+"""
+import argparse
+import time
+from config import Config
+from utils.ai_helper import AIHelper
+from utils.question_bank import QuestionBank, QuestionBankWarmer
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pre-generate questions into the question bank')
+    parser.add_argument('--limit', type=int, default=Config.QUESTION_BANK_WARMUP_BATCH,
+                        help='Maximum setups to fill per run (0 = no limit)')
+    parser.add_argument('--depth', type=int, default=Config.QUESTION_BANK_TARGET_DEPTH,
+                        help='Target number of questions per setup')
+    parser.add_argument('--rpm', type=int, default=Config.QUESTION_BANK_WARMUP_RPM,
+                        help='Maximum model requests per minute')
+    parser.add_argument('--path', default=Config.QUESTION_BANK_PATH, help='Question bank database path')
+    parser.add_argument('--loop', action='store_true', help='Keep running warm-up cycles')
+    parser.add_argument('--dry-run', action='store_true', help='Only list the setups that need questions')
+    args = parser.parse_args()
+
+    bank = QuestionBank(args.path)
+    ai_helper = AIHelper()
+    warmer = QuestionBankWarmer(
+        bank, ai_helper.generate_bank_questions,
+        requests_per_minute=args.rpm, target_depth=args.depth
+    )
+
+    print(f"🔥 Warming question bank at {args.path} (depth {args.depth}, {args.rpm} requests/min)")
+    while True:
+        started = time.time()
+        summary = warmer.run_once(limit=args.limit or None, dry_run=args.dry_run)
+        elapsed = time.time() - started
+        print(f"📊 Checked {summary['setups_checked']} setups, filled {summary['setups_filled']}, "
+              f"added {summary['questions_added']} questions, {summary['failures']} failures in {elapsed:.1f}s")
+
+        if not args.loop or args.dry_run:
+            break
+        time.sleep(Config.QUESTION_BANK_WARMUP_INTERVAL)
+
+
+if __name__ == '__main__':
+    main()